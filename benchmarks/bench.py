@@ -0,0 +1,244 @@
+"""Benchmark suite: scalar latency, batch throughput and app rerun latency.
+
+    python benchmarks/bench.py -o results.json
+    python benchmarks/bench.py --only scalar batch --sizes 1000 100000
+    python benchmarks/bench.py --baseline last-release.json
+
+Results are written as JSON (see `meta` for the environment they were
+measured in). Every scalar and batch figure is the median of `--repeat`
+measurements, taken in rounds over all systems so that a slow spell of
+the machine spreads over every figure instead of a few. With
+`--baseline`, every figure that got slower than the baseline by more
+than `--tolerance` is listed and the exit status is 1.
+
+Scalar latencies are a few microseconds, and a shared machine can
+change speed between runs by more than the tolerance. Each scalar round
+therefore also times a fixed pure-Python loop (`meta.calibration_us`).
+Baseline latencies are scaled by the change in that figure before they
+are compared, and a latency must also have grown by more than
+`--floor-us` to count.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from radcalc import SYSTEMS, cache_clear, classify  # noqa: E402
+from radcalc.batch import score_frame  # noqa: E402
+from radcalc.coverage import combinations  # noqa: E402
+
+SIZES = (1_000, 100_000, 1_000_000)
+APP = ROOT / "streamlite9_app.py"
+
+
+def meta() -> dict:
+    import streamlit
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "streamlit": streamlit.__version__,
+    }
+
+
+def calibration() -> float:
+    """Time of a fixed dict-and-call workload similar to scoring a case, in microseconds."""
+    start = time.perf_counter()
+    counts = {}
+    for i in range(2_000):
+        counts[i % 97] = counts.get(i % 97, 0) + 1
+    return (time.perf_counter() - start) * 1e6
+
+
+def per_call(func, calls: int) -> float:
+    """Time per call of `func` over `calls` calls, in microseconds."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def _cycle(classifier, cases):
+    """A call of `classifier` on the next of `cases`, round and round."""
+    it = iter(())
+
+    def direct():
+        nonlocal it
+        values = next(it, None)
+        if values is None:
+            it = iter(cases)
+            values = next(it)
+        classifier(**values)
+
+    return direct
+
+
+def bench_scalar(calls: int, repeat: int = 5, calibrations=None) -> dict:
+    """Per system: one call of the classifier (uncached) and of `classify` (cache hit).
+
+    A `calibration()` time is appended to `calibrations` next to every system's timings.
+    """
+    funcs, times = {}, {}
+    for key, classifier in SYSTEMS.items():
+        cases = list(combinations(classifier))
+        funcs[key] = {"direct_us": _cycle(classifier, cases),
+                      "cached_us": lambda key=key, inputs=cases[0]: classify(key, **inputs)}
+        times[key] = {"combinations": len(cases), "direct_us": [], "cached_us": []}
+    cache_clear()
+    for _ in range(repeat):
+        for key, timed in funcs.items():
+            if calibrations is not None:
+                calibrations.append(calibration())
+            for name, func in timed.items():
+                times[key][name].append(per_call(func, calls))
+    return {key: {name: value if name == "combinations" else round(statistics.median(value), 3)
+                  for name, value in figures.items()} for key, figures in times.items()}
+
+
+def findings_frame(classifier, rows: int, rng) -> pd.DataFrame:
+    """`rows` random valid inputs for `classifier`."""
+    columns = {}
+    for f in classifier.fields:
+        if f.options:
+            options = np.array(f.choices or f.options, dtype=object)
+            columns[f.name] = options[rng.integers(0, len(options), rows)]
+        else:
+            high = f.max_value if f.max_value is not None else 2 * (f.breakpoints.edges[-1] if f.breakpoints else 10)
+            columns[f.name] = rng.integers(int(f.min_value or 0), int(high) + 1, rows).astype(float)
+    return pd.DataFrame(columns)
+
+
+def bench_batch(sizes, repeat: int = 5) -> dict:
+    """Rows per second of `score_frame` for every system at every size."""
+    times = {key: {rows: [] for rows in sizes} for key in SYSTEMS}
+    for _ in range(repeat):
+        for i, (key, classifier) in enumerate(SYSTEMS.items()):
+            for rows in sizes:
+                # The same table every round, built outside the timing and dropped after it.
+                df = findings_frame(classifier, rows, np.random.default_rng([i, rows]))
+                start = time.perf_counter()
+                score_frame(df, [key])
+                times[key][rows].append(time.perf_counter() - start)
+    return {key: {str(rows): round(rows / statistics.median(t)) for rows, t in by_size.items()}
+            for key, by_size in times.items()}
+
+
+def bench_app(reruns: int) -> dict:
+    """Median and worst wall time of a full rerun of each calculator page."""
+    from streamlit.testing.v1 import AppTest
+
+    import calculators
+
+    out = {}
+    for category in calculators.PAGES:
+        page = calculators.load(category)
+        for label in getattr(page, "CALCULATORS", ()):
+            at = AppTest.from_file(str(APP), default_timeout=60).run()
+            at.sidebar.selectbox[0].set_value(category).run()
+            at.sidebar.selectbox[1].set_value(label).run()
+            if at.exception:
+                out[label] = {"error": str(at.exception[0].value)}
+                continue
+            times = []
+            for _ in range(reruns):
+                start = time.perf_counter()
+                at.run()
+                times.append((time.perf_counter() - start) * 1e3)
+            out[label] = {"median_ms": round(statistics.median(times), 2), "max_ms": round(max(times), 2)}
+    return out
+
+
+def regressions(current: dict, baseline: dict, tolerance: float, floor_us: float = 0.0, speed: float = 1.0,
+                path=()):
+    """Yield a description of every figure slower than in `baseline`.
+
+    `speed` is how much slower the machine ran than for the baseline (see
+    `calibration`); baseline scalar latencies are multiplied by it.
+    """
+    for name, value in current.items():
+        old = baseline.get(name) if isinstance(baseline, dict) else None
+        if old is None or name == "meta":
+            continue
+        where = path + (name,)
+        if isinstance(value, dict):
+            yield from regressions(value, old, tolerance, floor_us, speed, where)
+        elif isinstance(value, (int, float)) and isinstance(old, (int, float)) and old > 0 and name != "combinations":
+            # Throughputs (rows/s) should not drop; latencies should not grow.
+            higher_is_better = where[0] == "batch"
+            if where[0] == "scalar":
+                old = round(old * speed, 3)
+                if value - old <= floor_us:
+                    continue
+            change = (old - value) / old if higher_is_better else (value - old) / old
+            if change > tolerance:
+                yield f"{'/'.join(where)}: {old} -> {value} ({change:+.0%} worse)"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=("scalar", "batch", "app"), default=("scalar", "batch", "app"))
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES, help="batch sizes in rows")
+    parser.add_argument("--calls", type=int, default=2_000, help="calls per scalar timing")
+    parser.add_argument("--reruns", type=int, default=10, help="reruns per calculator page")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per scalar and batch figure (default: 5)")
+    parser.add_argument("-o", "--output", help="JSON file for the results (default: stdout)")
+    parser.add_argument("--baseline", help="earlier results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown (default: 0.2 = 20%%)")
+    parser.add_argument("--floor-us", type=float, default=2.0,
+                        help="scalar latency growth always allowed, in microseconds (default: 2)")
+    args = parser.parse_args(argv)
+
+    results = {"meta": meta()}
+    if "scalar" in args.only:
+        calibrations = []
+        results["scalar"] = bench_scalar(args.calls, args.repeat, calibrations)
+        results["meta"]["calibration_us"] = round(statistics.median(calibrations), 3)
+    if "batch" in args.only:
+        results["batch"] = bench_batch(args.sizes, args.repeat)
+    if "app" in args.only:
+        results["app"] = bench_app(args.reruns)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        speed = 1.0
+        then, now = baseline.get("meta", {}).get("calibration_us"), results["meta"].get("calibration_us")
+        if then and now:
+            speed = now / then
+            print(f"machine speed: calibration {then} -> {now} us, baseline scalar latencies x{speed:.2f}",
+                  file=sys.stderr)
+        worse = list(regressions(results, baseline, args.tolerance, args.floor_us, speed))
+        for line in worse:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if worse else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
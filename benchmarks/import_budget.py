@@ -0,0 +1,70 @@
+"""Import-time budget of the scoring core.
+
+    python benchmarks/import_budget.py
+    python benchmarks/import_budget.py --budget-ms 10 --runs 20
+
+Batch workers and service processes import `radcalc` once per process,
+so its import must stay cheap and must not drag in the UI or the
+dataframe stack. Each run imports the package in a fresh interpreter
+under `-X importtime` and takes the cumulative time of the package
+itself (interpreter start-up excluded). Exits with status 1 when the
+median run is over budget or a forbidden module was imported.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+FORBIDDEN = ("streamlit", "calculators", "numpy", "pandas", "pyarrow")
+
+
+def _python(code, *options) -> subprocess.CompletedProcess:
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    return subprocess.run([sys.executable, *options, "-c", code], cwd=ROOT, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def import_ms(module) -> float:
+    """Cumulative import time of `module` in a fresh interpreter, in milliseconds."""
+    report = _python(f"import {module}", "-X", "importtime").stderr
+    for line in report.splitlines():
+        # "import time: <self us> | <cumulative us> | <indented module name>"
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1e3
+    raise RuntimeError(f"no import time reported for {module}")
+
+
+def imported(module) -> list:
+    out = _python(f"import sys, {module}; print('\\n'.join(sys.modules))").stdout
+    return sorted({name.split(".")[0] for name in out.split()} & set(FORBIDDEN))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="radcalc")
+    parser.add_argument("--budget-ms", type=float, default=10.0, help="median import time allowed (default: 10)")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    _python(f"import {args.module}")  # writes the bytecode caches, so runs do not compile
+    times = [import_ms(args.module) for _ in range(args.runs)]
+    forbidden = imported(args.module)
+    median = statistics.median(times)
+    print(json.dumps({"module": args.module, "median_ms": round(median, 2), "max_ms": round(max(times), 2),
+                      "budget_ms": args.budget_ms, "forbidden_imports": forbidden}, indent=2))
+    if forbidden:
+        print(f"FAIL {args.module} imports {', '.join(forbidden)}", file=sys.stderr)
+    if median > args.budget_ms:
+        print(f"FAIL {args.module} imports in {median:.1f} ms, over the {args.budget_ms} ms budget", file=sys.stderr)
+    return 1 if forbidden or median > args.budget_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
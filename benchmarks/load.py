@@ -0,0 +1,292 @@
+"""Load harness: many concurrent sessions clicking through the calculators.
+
+    python benchmarks/load.py --sessions 50 --duration 120
+    python benchmarks/load.py --sessions 200 --ramp 60 -o load.json
+    python benchmarks/load.py --url ws://127.0.0.1:8501 --pid 12345
+
+Starts `streamlite9_app.py` under `streamlit run` on a free local port
+(or targets `--url`) and opens one websocket per simulated reader,
+speaking the same protocol as the browser: each session picks a
+category, then a calculator, then answers a few of its radio questions,
+pausing `--think` seconds between clicks. Answers inside a calculator
+panel are sent as fragment reruns, as the browser does.
+
+Reported: p50/p95/p99/max latency from click to finished rerun (all,
+full reruns, fragment reruns), errors, and the server's resident memory
+before the sessions connected, at its peak, and per connected session.
+Memory is read from /proc, so it needs Linux and the server's pid.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from typing import NamedTuple
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / "streamlite9_app.py"
+
+import websockets  # noqa: E402  (installed with Streamlit's server)
+from streamlit.proto.BackMsg_pb2 import BackMsg  # noqa: E402
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg  # noqa: E402
+from streamlit.proto.RootContainer_pb2 import SIDEBAR  # noqa: E402
+from streamlit.proto.WidgetStates_pb2 import WidgetState  # noqa: E402
+
+from bench import meta  # noqa: E402
+
+FINISHED = (ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY)
+
+
+class Widget(NamedTuple):
+    id: str
+    kind: str  # "selectbox" or "radio"
+    label: str
+    options: tuple
+    sidebar: bool
+    fragment_id: str
+
+
+class Session:
+    """One simulated reader on its own websocket."""
+
+    def __init__(self, ws, timeout):
+        self.ws = ws
+        self.timeout = timeout
+        self.page = ""
+        self.widgets: dict[str, Widget] = {}
+        self.states: dict[str, WidgetState] = {}
+
+    async def rerun(self, fragment_id="") -> tuple[float, bool]:
+        """Send the widget states, wait for the run to finish; `(seconds, ok)`."""
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = self.page
+        msg.rerun_script.fragment_id = fragment_id
+        msg.rerun_script.widget_states.widgets.extend(
+            state for id, state in self.states.items() if id in self.widgets)
+        started = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        seen, ok = {}, True
+        while True:
+            fm = ForwardMsg()
+            fm.ParseFromString(await asyncio.wait_for(self.ws.recv(), self.timeout))
+            kind = fm.WhichOneof("type")
+            if kind == "new_session":
+                self.page = fm.new_session.page_script_hash
+            elif kind == "delta" and fm.delta.WhichOneof("type") == "new_element":
+                element = fm.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "exception":
+                    ok = False
+                elif element_type in ("selectbox", "radio"):
+                    proto = getattr(element, element_type)
+                    seen[proto.id] = Widget(proto.id, element_type, proto.label, tuple(proto.options),
+                                            fm.metadata.delta_path[0] == SIDEBAR, fm.delta.fragment_id)
+            elif kind == "script_finished":
+                elapsed = time.perf_counter() - started
+                if fm.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    break
+        if fragment_id:
+            self.widgets = {id: w for id, w in self.widgets.items() if w.fragment_id != fragment_id}
+            self.widgets.update(seen)
+        else:
+            self.widgets = seen
+        return elapsed, ok and fm.script_finished in FINISHED
+
+    def find(self, kind, sidebar):
+        return [w for w in self.widgets.values() if w.kind == kind and w.sidebar == sidebar and w.options]
+
+    async def click(self, widget, option):
+        self.states[widget.id] = WidgetState(id=widget.id, string_value=option)
+        return await self.rerun(widget.fragment_id)
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = {"full": [], "fragment": []}
+        self.errors = 0
+        self.clicks = 0
+
+    def add(self, kind, seconds, ok):
+        self.clicks += 1
+        self.latencies[kind].append(seconds * 1e3)
+        if not ok:
+            self.errors += 1
+
+
+async def reader(url, stats, args, deadline, rng):
+    """One session: pick a category, a calculator and a few answers, over and over."""
+    async with websockets.connect(f"{url}/_stcore/stream", max_size=None, open_timeout=args.timeout) as ws:
+        session = Session(ws, args.timeout)
+        await session.rerun()
+        while time.monotonic() < deadline:
+            for depth in range(2):  # category, then calculator
+                boxes = session.find("selectbox", sidebar=True)
+                if len(boxes) <= depth:
+                    break
+                await asyncio.sleep(rng.uniform(*args.think))
+                stats.add("full", *await session.click(boxes[depth], rng.choice(boxes[depth].options)))
+            for _ in range(args.answers):
+                radios = session.find("radio", sidebar=False)
+                if not radios or time.monotonic() >= deadline:
+                    break
+                radio = rng.choice(radios)
+                await asyncio.sleep(rng.uniform(*args.think))
+                stats.add("fragment" if radio.fragment_id else "full",
+                          *await session.click(radio, rng.choice(radio.options)))
+
+
+def rss_kib(pid) -> int | None:
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+async def sample_memory(pid, peak, stop):
+    while not stop.is_set():
+        rss = rss_kib(pid)
+        if rss is not None:
+            peak[0] = max(peak[0], rss)
+        try:
+            await asyncio.wait_for(stop.wait(), 0.5)
+        except asyncio.TimeoutError:
+            pass
+
+
+def percentiles(values) -> dict:
+    if not values:
+        return {"count": 0}
+    cuts = statistics.quantiles(values, n=100, method="inclusive") if len(values) > 1 else values * 99
+    return {"count": len(values), "p50_ms": round(cuts[49], 1), "p95_ms": round(cuts[94], 1),
+            "p99_ms": round(cuts[98], 1), "max_ms": round(max(values), 1)}
+
+
+async def drive(url, pid, args) -> dict:
+    # A warm-up session loads the pages and the cached tables before the baseline is taken.
+    await asyncio.wait_for(reader(url, Stats(), args, time.monotonic() + 5, random.Random(0)), 120)
+    baseline = rss_kib(pid) if pid else None
+    peak, stop = [baseline or 0], asyncio.Event()
+    sampler = asyncio.create_task(sample_memory(pid, peak, stop)) if pid else None
+
+    stats = Stats()
+    started = time.monotonic()
+    deadline = started + args.ramp + args.duration
+
+    async def delayed(i):
+        await asyncio.sleep(args.ramp * i / args.sessions)
+        await reader(url, stats, args, deadline, random.Random(args.seed + i))
+
+    outcomes = await asyncio.gather(*(delayed(i) for i in range(args.sessions)), return_exceptions=True)
+    connected = rss_kib(pid) if pid else None
+    if sampler is not None:
+        stop.set()
+        await sampler
+    failed = [o for o in outcomes if isinstance(o, BaseException)]
+
+    all_latencies = stats.latencies["full"] + stats.latencies["fragment"]
+    out = {
+        "sessions": args.sessions,
+        "seconds": round(time.monotonic() - started, 1),
+        "clicks": stats.clicks,
+        "errors": stats.errors,
+        "failed_sessions": len(failed),
+        "latency": {"all": percentiles(all_latencies),
+                    **{kind: percentiles(values) for kind, values in stats.latencies.items()}},
+    }
+    if failed:
+        out["first_failure"] = repr(failed[0])
+    if baseline is not None:
+        # Sessions are still open when the last sample is taken, so their state counts.
+        out["memory"] = {"baseline_mib": round(baseline / 1024, 1), "peak_mib": round(peak[0] / 1024, 1),
+                         "per_session_kib": round(((connected or peak[0]) - baseline) / args.sessions, 1)}
+    return out
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port):
+    """`streamlit run` the app headless on `port`; returns the process once it is healthy."""
+    # A file rather than a pipe: nobody reads a pipe during the run, and a full one blocks the server.
+    log = tempfile.TemporaryFile()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(APP), "--server.headless", "true",
+         "--server.port", str(port), "--server.address", "127.0.0.1",
+         "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=log)
+    for _ in range(120):
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return server
+        except OSError:
+            pass
+        if server.poll() is not None:
+            log.seek(0)
+            raise SystemExit(f"streamlit exited: {log.read().decode(errors='replace')}")
+        time.sleep(0.5)
+    server.kill()
+    raise SystemExit("streamlit did not become healthy within 60 s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--sessions", type=int, default=20, help="concurrent sessions (default: 20)")
+    parser.add_argument("--duration", type=float, default=60, help="seconds of load after the ramp (default: 60)")
+    parser.add_argument("--ramp", type=float, default=10, help="seconds over which sessions connect (default: 10)")
+    parser.add_argument("--think", type=float, nargs=2, default=(0.5, 2.0), metavar=("MIN", "MAX"),
+                        help="pause between clicks in seconds (default: 0.5 2.0)")
+    parser.add_argument("--answers", type=int, default=4, help="radio answers per calculator (default: 4)")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds to wait for one rerun (default: 60)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", help="running app, e.g. ws://127.0.0.1:8501 (default: start one)")
+    parser.add_argument("--pid", type=int, help="server process to measure with --url")
+    parser.add_argument("-o", "--output", help="JSON file for the results (default: stdout)")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.url:
+        url, pid = args.url.rstrip("/"), args.pid
+    else:
+        port = free_port()
+        server = start_server(port)
+        url, pid = f"ws://127.0.0.1:{port}", server.pid
+    if pid and not os.path.exists(f"/proc/{pid}/status"):
+        print("memory is not reported: /proc is not available", file=sys.stderr)
+        pid = None
+    try:
+        results = {"meta": meta(), "load": asyncio.run(drive(url, pid, args))}
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(10)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    load = results["load"]
+    return 1 if load["errors"] or load["failed_sessions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
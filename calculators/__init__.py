@@ -0,0 +1,29 @@
+"""Streamlit calculator pages, one module per sidebar category.
+
+Modules are imported on first selection only, so a session that never
+opens the MSK page never loads its code.
+"""
+import importlib
+
+from radcalc.engine import ABDOMINOPELVIC, CARDIOTHORACIC, HEAD_NECK, MSK, NEURO, RADS, VASCULAR
+
+# Not classifier categories: several systems over one study, and a whole uploaded table.
+STUDY = "STUDY REPORT (SEVERAL SYSTEMS)"
+UPLOAD = "SCORE A FILE (CSV/PARQUET)"
+
+PAGES = {
+    NEURO: "neuro",
+    HEAD_NECK: "head_neck",
+    CARDIOTHORACIC: "cardiothoracic",
+    ABDOMINOPELVIC: "abdominopelvic",
+    MSK: "msk",
+    VASCULAR: "vascular",
+    RADS: "rads",
+    STUDY: "study",
+    UPLOAD: "upload",
+}
+
+
+def load(category):
+    """Import (once) and return the page module for `category`."""
+    return importlib.import_module(f"{__name__}.{PAGES[category]}")
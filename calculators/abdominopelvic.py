@@ -0,0 +1,99 @@
+"""ABDOMINOPELVIC calculators."""
+from functools import partial
+
+import streamlit as st
+
+from radcalc import classify
+
+from .widgets import ask, ask_if, inputs, panel
+
+
+# -----------------------------------------------------------
+# 4.1 Bosniak Classification (Renal Cysts)
+# -----------------------------------------------------------
+def bosniak():
+    st.subheader("Bosniak Classification for Renal Cystic Masses")
+    st.markdown("""
+    **Key Imaging Features:**
+    - Presence and number of septa, septal thickness  
+    - Calcifications (thin vs. thick/nodular)  
+    - Enhancement of walls/septa  
+    - Overall complexity
+    """)
+    with inputs("bosniak"):
+        septa = ask("bosniak", "septa")
+        result = classify(
+            "bosniak",
+            septa=septa,
+            septa_thickness=ask_if(septa == "Yes", "bosniak", "septa_thickness"),
+            calcifications=ask("bosniak", "calcifications"),
+            enhancement=ask("bosniak", "enhancement"),
+        )
+    st.write(f"**Bosniak Category:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 4.2 AAST Organ Injury Scales (Trauma)
+# -----------------------------------------------------------
+def aast_spleen():
+    st.subheader("AAST Organ Injury Scale (Example: Splenic Injury)")
+    st.markdown("""
+    **Key Radiologic Features for Splenic Injury on CT:**
+    - Subcapsular hematoma (extent as % of surface)  
+    - Laceration depth (cm)  
+    - Vascular injury (Yes/No)
+    """)
+    with inputs("aast_spleen"):
+        result = classify(
+            "aast_spleen",
+            area=ask("aast_spleen", "area"),
+            depth=ask("aast_spleen", "depth"),
+            vascular=ask("aast_spleen", "vascular"),
+        )
+    st.write(f"**Estimated Splenic Injury Grade:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 4.3 Balthazar & CTSI (Pancreatitis)
+# -----------------------------------------------------------
+def ctsi():
+    st.subheader("Pancreatitis: Balthazar Grade & CT Severity Index (CTSI)")
+    st.markdown("""
+    **Key Features on Contrast CT:**
+    - Pancreatic inflammation (graded A–E)  
+    - Peripancreatic fluid collections  
+    - Percentage of pancreatic necrosis (%)
+    """)
+    with inputs("ctsi"):
+        result = classify("ctsi", balthazar=ask("ctsi", "balthazar"), necrosis=ask("ctsi", "necrosis"))
+    st.write(f"**CT Severity Index (CTSI):** {result.score} / 10")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 4.4 LI-RADS, 4.5 PI-RADS, 4.6 O-RADS, 4.7 TI-RADS, 4.8 FIGO
+# -----------------------------------------------------------
+def see_rads_section(title):
+    st.subheader(title)
+    st.markdown("For these systems, please refer to the “-RADS SYSTEMS” section below for key imaging feature input and automatic classification.")
+    st.info("This demo integrates LI-RADS, PI-RADS, O-RADS, TI-RADS, and FIGO staging in the -RADS SYSTEMS section.")
+
+
+CALCULATORS = {
+    "4.1 Bosniak Classification (Renal Cysts)": bosniak,
+    "4.2 AAST Organ Injury Scales (Trauma)": aast_spleen,
+    "4.3 Balthazar/CT Severity Index (Pancreatitis)": ctsi,
+    "4.4 LI-RADS (Liver)": partial(see_rads_section, "4.4 LI-RADS (Liver)"),
+    "4.5 PI-RADS (Prostate)": partial(see_rads_section, "4.5 PI-RADS (Prostate)"),
+    "4.6 O-RADS (Ovarian-Adnexal)": partial(see_rads_section, "4.6 O-RADS (Ovarian-Adnexal)"),
+    "4.7 TI-RADS (Thyroid)": partial(see_rads_section, "4.7 TI-RADS (Thyroid)"),
+    "4.8 FIGO Staging (Gynecologic Cancers)": partial(see_rads_section, "4.8 FIGO Staging (Gynecologic Cancers)"),
+}
+
+
+def render():
+    st.header("Abdominopelvic Classifications")
+    option = st.sidebar.selectbox("Select a Subcategory", list(CALCULATORS))
+    panel(CALCULATORS[option])
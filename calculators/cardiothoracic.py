@@ -0,0 +1,129 @@
+"""CARDIOTHORACIC calculators."""
+import streamlit as st
+
+from radcalc import classify
+
+from .widgets import ask, inputs, panel, several_lesions
+
+
+# -----------------------------------------------------------
+# 3.1 Aortic Dissection
+# -----------------------------------------------------------
+def aortic_dissection():
+    st.subheader("Aortic Dissection Classification")
+    st.markdown("""
+    **Key Radiologic Findings on CT/MR/TEE:**
+    - Presence of an intimal flap  
+    - Involvement of the ascending aorta?
+    """)
+    with inputs("aortic_dissection"):
+        result = classify("aortic_dissection", ascending=ask("aortic_dissection", "ascending"))
+    st.write(f"**Stanford Classification:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 3.2 Pulmonary Embolism – Qanadli Score
+# -----------------------------------------------------------
+def qanadli():
+    st.subheader("Qanadli Score for Pulmonary Embolism")
+    st.markdown("""
+    **Key Steps:**
+    - Count the number of partially and completely occluded segmental arteries (10 per lung).
+    """)
+    with inputs("qanadli"):
+        result = classify("qanadli", partial=ask("qanadli", "partial"), complete=ask("qanadli", "complete"))
+    st.write(f"**Calculated Qanadli Score:** {result.score} / 40")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 3.3 Lung-RADS (CT Screening)
+# -----------------------------------------------------------
+def lung_rads():
+    st.subheader("Lung-RADS Classification")
+    st.markdown("""
+    **Key Radiologic Features:**
+    - Nodule size (mm)  
+    - Nodule composition (Solid, Part-solid, Ground-glass)
+    """)
+    if several_lesions("lung_rads"):
+        return
+    with inputs("lung_rads"):
+        result = classify(
+            "lung_rads",
+            nodule_size=ask("lung_rads", "nodule_size", "Enter nodule size (mm)", value=6),
+            nodule_type=ask("lung_rads", "nodule_type", "Nodule composition"),
+        )
+    st.write(f"**Lung-RADS Category:** {result.grade} ({result.interpretation})")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 3.4 COVID-19 Chest Imaging (RSNA)
+# -----------------------------------------------------------
+def covid_rsna():
+    st.subheader("RSNA COVID-19 Chest Imaging Classification")
+    st.markdown("""
+    **Key Radiologic Findings:**
+    - Distribution of ground-glass opacities (GGO)  
+    - Laterality (bilateral vs. unilateral)  
+    - Presence of consolidation or “crazy-paving”
+    """)
+    with inputs("covid_rsna"):
+        result = classify("covid_rsna", ggo=ask("covid_rsna", "ggo"), consolidation=ask("covid_rsna", "consolidation"))
+    st.write(f"**RSNA COVID-19 Category:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 3.5 ATS/ERS Classification (IIP)
+# -----------------------------------------------------------
+def ats_ers():
+    st.subheader("ATS/ERS Classification for Idiopathic Interstitial Pneumonias")
+    st.markdown("""
+    **Key HRCT Patterns:**
+    - UIP: Reticular opacities, honeycombing, basal/subpleural predominance  
+    - NSIP: Ground-glass opacities with uniform distribution  
+    - COP: Patchy consolidation with peripheral distribution
+    """)
+    with inputs("ats_ers"):
+        result = classify("ats_ers", pattern=ask("ats_ers", "pattern"))
+    st.write(f"**HRCT Pattern:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 3.6 Breast: BI-RADS
+# -----------------------------------------------------------
+def bi_rads():
+    st.subheader("BI-RADS Classification for Breast Imaging")
+    st.markdown("""
+    **Key Radiologic Features:**
+    - Mass shape, margins, calcification morphology, enhancement pattern
+    """)
+    with inputs("bi_rads"):
+        result = classify(
+            "bi_rads",
+            shape=ask("bi_rads", "shape"),
+            margin=ask("bi_rads", "margin"),
+            calc=ask("bi_rads", "calc"),
+        )
+    st.write(f"**Calculated BI-RADS Category:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+CALCULATORS = {
+    "3.1 Aortic Dissection": aortic_dissection,
+    "3.2 Pulmonary Embolism – Qanadli Score": qanadli,
+    "3.3 Lung-RADS (CT Screening)": lung_rads,
+    "3.4 COVID-19 Chest Imaging (RSNA)": covid_rsna,
+    "3.5 ATS/ERS Classification (IIP)": ats_ers,
+    "3.6 Breast: BI-RADS": bi_rads,
+}
+
+
+def render():
+    st.header("Cardiothoracic Classifications")
+    option = st.sidebar.selectbox("Select a Cardiothoracic Classification", list(CALCULATORS))
+    panel(CALCULATORS[option])
@@ -0,0 +1,74 @@
+"""HEAD & NECK calculators."""
+import streamlit as st
+
+from radcalc import classify
+
+from .widgets import ask, inputs, panel
+
+
+# -----------------------------------------------------------
+# 2.1 TNM Staging (AJCC) – Head & Neck Cancers
+# -----------------------------------------------------------
+def tnm():
+    st.subheader("TNM Staging (AJCC) for Head & Neck Cancers")
+    st.markdown("""
+    **Key Radiologic Features:**
+    - **Tumor Size:** Measure the primary lesion (cm)  
+    - **Invasion:** Assess if adjacent structures are invaded  
+    - **Lymph Nodes:** Number and size; extranodal extension  
+    - **Metastasis:** Presence of distant lesions
+    """)
+    with inputs("tnm"):
+        result = classify(
+            "tnm",
+            tumor_size=ask("tnm", "tumor_size"),
+            invasion=ask("tnm", "invasion"),
+            nodes=ask("tnm", "nodes"),
+            metastasis=ask("tnm", "metastasis"),
+        )
+    st.write(f"**TNM Staging:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 2.2 Lugano Classification (Lymphoma)
+# -----------------------------------------------------------
+def lugano():
+    st.subheader("Lugano Classification for Lymphoma")
+    st.markdown("""
+    **Key Features (from FDG-PET/CT):**
+    - **Nodal Involvement:** Number of nodal regions  
+    - **Extranodal Involvement:** Present or absent
+    """)
+    with inputs("lugano"):
+        result = classify("lugano", nodal_regions=ask("lugano", "nodal_regions"), extranodal=ask("lugano", "extranodal"))
+    st.write(f"**Lugano Stage:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 2.3 Friedman Staging (Tonsillar Hypertrophy)
+# -----------------------------------------------------------
+def friedman():
+    st.subheader("Friedman Staging for Tonsillar Hypertrophy")
+    st.markdown("""
+    **Key Feature:**
+    - Estimate the percentage of oropharyngeal width occupied by the tonsils.
+    """)
+    with inputs("friedman"):
+        result = classify("friedman", tonsil_percent=ask("friedman", "tonsil_percent"))
+    st.write(f"**Friedman Stage:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+CALCULATORS = {
+    "2.1 TNM Staging (AJCC) – Head & Neck Cancers": tnm,
+    "2.2 Lugano Classification (Lymphoma)": lugano,
+    "2.3 Friedman Staging (Tonsillar Hypertrophy)": friedman,
+}
+
+
+def render():
+    st.header("Head & Neck Classifications")
+    option = st.sidebar.selectbox("Select a Head & Neck Classification", list(CALCULATORS))
+    panel(CALCULATORS[option])
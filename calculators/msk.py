@@ -0,0 +1,174 @@
+"""MUSCULOSKELETAL (MSK) calculators."""
+import streamlit as st
+
+from radcalc import classify
+
+from .widgets import ask, inputs, panel
+
+
+# -----------------------------------------------------------
+# 5.1 AO/OTA Fracture Classification
+# -----------------------------------------------------------
+def ao_ota():
+    st.subheader("AO/OTA Fracture Classification (Long Bones)")
+    st.markdown("""
+    **Key Features:**
+    - Location: Proximal, Diaphyseal, or Distal  
+    - Fracture pattern: Simple, Wedge, or Complex  
+    - Articular involvement: Yes/No
+    """)
+    with inputs("ao_ota"):
+        result = classify(
+            "ao_ota",
+            location=ask("ao_ota", "location"),
+            pattern=ask("ao_ota", "pattern"),
+            articular=ask("ao_ota", "articular"),
+        )
+    st.write(f"**AO/OTA Example:** {result.grade}.")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 5.2 Gustilo–Anderson Classification
+# -----------------------------------------------------------
+def gustilo():
+    st.subheader("Gustilo–Anderson Classification for Open Fractures")
+    st.markdown("""
+    **Key Features:**
+    - Wound size (cm)  
+    - Degree of soft tissue injury (minimal, moderate, extensive)
+    """)
+    with inputs("gustilo"):
+        result = classify("gustilo", wound_size=ask("gustilo", "wound_size"), soft_tissue=ask("gustilo", "soft_tissue"))
+    st.write(f"**Gustilo–Anderson Type:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 5.3 Tscherne Classification (Soft-Tissue Injuries)
+# -----------------------------------------------------------
+def tscherne():
+    st.subheader("Tscherne Classification for Soft-Tissue Injuries")
+    st.markdown("""
+    **Key Features:**
+    - Degree of soft tissue damage in closed injuries (C0–C3)
+    """)
+    with inputs("tscherne"):
+        result = classify("tscherne", tscherne_grade=ask("tscherne", "tscherne_grade"))
+    st.write(f"**Tscherne Grade:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 5.4 Salter-Harris Classification (Physeal Fractures)
+# -----------------------------------------------------------
+def salter_harris():
+    st.subheader("Salter-Harris Classification for Pediatric Fractures")
+    st.markdown("""
+    **Key Features:**
+    - Involvement of physis, metaphysis, and/or epiphysis.
+    """)
+    with inputs("salter_harris"):
+        result = classify("salter_harris", sh_type=ask("salter_harris", "sh_type"))
+    st.write(f"**Salter-Harris Type:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 5.5 Other Fracture Classifications
+# -----------------------------------------------------------
+def other_fractures():
+    st.subheader("Other Fracture Classifications")
+    other_option = st.selectbox(
+        "Select a Classification", 
+        ["Garden (Femoral Neck)", "Pauwels (Femoral Neck)", "Neer (Proximal Humerus)",
+         "Weber (Ankle)", "Lauge-Hansen (Ankle)", "Frykman (Distal Radius)",
+         "Sanders (Calcaneal)", "Mayo (Olecranon)"]
+    )
+    if other_option == "Garden (Femoral Neck)":
+        st.markdown("""
+        **Key Features for Garden Classification:**
+        - Degree of displacement on AP radiograph.
+        """)
+        with inputs("garden"):
+            result = classify("garden", displacement=ask("garden", "displacement"))
+        st.write(f"**Garden Type:** {result.grade}")
+        st.markdown(f"**Next Steps:** {result.next_steps}")
+    elif other_option == "Pauwels (Femoral Neck)":
+        st.markdown("""
+        **Key Feature:**  
+        Angle of the fracture line relative to the horizontal.
+        """)
+        with inputs("pauwels"):
+            result = classify("pauwels", angle=ask("pauwels", "angle"))
+        st.write(f"**Pauwels Type:** {result.grade}")
+        st.markdown(f"**Next Steps:** {result.next_steps}")
+    elif other_option == "Neer (Proximal Humerus)":
+        st.markdown("""
+        **Key Feature:**  
+        Number of displaced segments (>1 cm or >45° angulation).
+        """)
+        with inputs("neer"):
+            result = classify("neer", segments=ask("neer", "segments"))
+        st.write(f"**Neer Classification:** {result.grade}")
+        st.markdown(f"**Next Steps:** {result.next_steps}")
+    elif other_option == "Weber (Ankle)":
+        st.markdown("""
+        **Key Feature:**  
+        Level of fibular fracture relative to the syndesmosis.
+        """)
+        with inputs("weber"):
+            result = classify("weber", weber=ask("weber", "weber"))
+        st.write(f"**Weber Type:** {result.grade}")
+        st.markdown(f"**Next Steps:** {result.next_steps}")
+    elif other_option == "Lauge-Hansen (Ankle)":
+        st.markdown("""
+        **Key Feature:**  
+        Mechanism of injury.
+        """)
+        with inputs("lauge_hansen"):
+            result = classify("lauge_hansen", mechanism=ask("lauge_hansen", "mechanism"))
+        st.write(f"**Lauge-Hansen Mechanism:** {result.grade}")
+        st.markdown(f"**Next Steps:** {result.next_steps}")
+    elif other_option == "Frykman (Distal Radius)":
+        st.markdown("""
+        **Key Feature:**  
+        Involvement of radiocarpal and distal radioulnar joints.
+        """)
+        with inputs("frykman"):
+            result = classify("frykman", frykman=ask("frykman", "frykman"))
+        st.write(f"**Frykman Type:** {result.grade}")
+        st.markdown(f"**Next Steps:** {result.next_steps}")
+    elif other_option == "Sanders (Calcaneal)":
+        st.markdown("""
+        **Key Feature:**  
+        Number of fracture lines in the posterior facet on CT.
+        """)
+        with inputs("sanders"):
+            result = classify("sanders", sanders=ask("sanders", "sanders"))
+        st.write(f"**Sanders Type:** {result.grade}")
+        st.markdown(f"**Next Steps:** {result.next_steps}")
+    elif other_option == "Mayo (Olecranon)":
+        st.markdown("""
+        **Key Feature:**  
+        Displacement and stability.
+        """)
+        with inputs("mayo"):
+            result = classify("mayo", mayo=ask("mayo", "mayo"))
+        st.write(f"**Mayo Classification:** {result.grade}")
+        st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+CALCULATORS = {
+    "5.1 AO/OTA Fracture Classification": ao_ota,
+    "5.2 Gustilo–Anderson (Open Fractures)": gustilo,
+    "5.3 Tscherne Classification (Soft-Tissue Injuries)": tscherne,
+    "5.4 Salter-Harris (Physeal Fractures)": salter_harris,
+    "5.5 Other Fracture Classifications": other_fractures,
+}
+
+
+def render():
+    st.header("Musculoskeletal (MSK) Classifications")
+    option = st.sidebar.selectbox("Select an MSK Classification", list(CALCULATORS))
+    panel(CALCULATORS[option])
@@ -0,0 +1,145 @@
+"""NEURO (brain & spine) calculators."""
+import streamlit as st
+
+from radcalc import classify
+
+from .widgets import ask, ask_if, inputs, panel
+
+
+# -----------------------------------------------------------
+# 1.1 Hunt and Hess Classification (SAH)
+# -----------------------------------------------------------
+def hunt_hess():
+    st.subheader("Hunt and Hess Classification for Subarachnoid Hemorrhage (SAH)")
+    st.markdown("""
+    **Key Features to Identify:**
+    - **Headache severity:** Minimal, moderate, severe  
+    - **Level of Consciousness:** Normal, drowsy/confused, stuporous, deep coma  
+    - **Focal neurological deficits:** Absent, mild, or severe  
+    - **CT Appearance:** Small/subtle SAH vs. diffuse/large SAH (with possible intraventricular extension)
+    """)
+    with inputs("hunt_hess"):
+        result = classify(
+            "hunt_hess",
+            headache=ask("hunt_hess", "headache"),
+            consciousness=ask("hunt_hess", "consciousness"),
+            focal_deficit=ask("hunt_hess", "focal_deficit"),
+            ct_sah=ask("hunt_hess", "ct_sah"),
+        )
+    st.write(f"**Calculated Hunt and Hess Grade:** {result.grade}")
+    # Provide a brief clinical interpretation and next steps.
+    st.markdown(f"**Interpretation:** {result.interpretation}  **Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 1.2 Fisher Classification (SAH)
+# -----------------------------------------------------------
+def fisher():
+    st.subheader("Fisher Classification for Subarachnoid Hemorrhage")
+    st.markdown("""
+    **Key Radiologic Findings:**
+    - **Blood detection on CT:** None, thin layer (<1 mm), thick clot (≥1 mm)
+    - **Additional findings:** Presence or absence of intraventricular/intraparenchymal blood
+    """)
+    with inputs("fisher"):
+        blood_detected = ask("fisher", "blood_detected")
+        blood_thickness = ask_if(blood_detected == "Yes", "fisher", "blood_thickness")
+        extra = ask("fisher", "extra")
+        result = classify("fisher", blood_detected=blood_detected, blood_thickness=blood_thickness, extra=extra)
+    
+    st.write(f"**Calculated Fisher Grade:** {result.grade}")
+    st.markdown(f"**Interpretation:** {result.interpretation}  **Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 1.3 Spetzler-Martin Grading (AVMs)
+# -----------------------------------------------------------
+def spetzler_martin():
+    st.subheader("Spetzler-Martin Grading for Intracranial AVMs")
+    st.markdown("""
+    **Key Radiologic Features:**
+    - **Nidus size (cm):** Small (<3), Medium (3–6), Large (>6)
+    - **Eloquence of adjacent brain:** Non-eloquent or Eloquent
+    - **Venous drainage:** Superficial only or Deep drainage
+    """)
+    with inputs("spetzler_martin"):
+        result = classify(
+            "spetzler_martin",
+            size=ask("spetzler_martin", "size"),
+            eloquent=ask("spetzler_martin", "eloquent"),
+            drainage=ask("spetzler_martin", "drainage"),
+        )
+    
+    st.write(f"**Spetzler-Martin Score:** {result.score}")
+    st.markdown(f"**Interpretation:** {result.interpretation}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 1.4 Modic Classification (Vertebral Endplate Changes)
+# -----------------------------------------------------------
+def modic():
+    st.subheader("Modic Classification for Vertebral Endplate Changes")
+    st.markdown("""
+    **Key Radiologic Findings on MRI:**
+    - **T1 signal:** Hypointense or Hyperintense
+    - **T2 signal:** Hyperintense or Hypointense
+    """)
+    with inputs("modic"):
+        result = classify("modic", t1_signal=ask("modic", "t1_signal"), t2_signal=ask("modic", "t2_signal"))
+    st.write(f"**Modic Classification:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 1.5 Pfirrmann Classification (Disc Degeneration)
+# -----------------------------------------------------------
+def pfirrmann():
+    st.subheader("Pfirrmann Classification for Intervertebral Disc Degeneration")
+    st.markdown("""
+    **Key Radiologic Findings on T2 MRI:**
+    - Disc signal brightness, disc height, and distinction between nucleus and annulus.
+    """)
+    with inputs("pfirrmann"):
+        result = classify("pfirrmann", disc_desc=ask("pfirrmann", "disc_desc"))
+    st.write(f"**Pfirrmann Grade:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 1.6 TLICS – Thoracolumbar Injury Classification
+# -----------------------------------------------------------
+def tlics():
+    st.subheader("TLICS – Thoracolumbar Injury Classification & Severity Score")
+    st.markdown("""
+    **Key Features to Assess:**
+    - **Injury Morphology:** Compression, Burst, Translation/Rotation, or Distraction  
+    - **Posterior Ligamentous Complex (PLC):** Intact or Disrupted  
+    - **Neurological Status:** Intact, Incomplete deficit, or Complete deficit
+    """)
+    with inputs("tlics"):
+        result = classify(
+            "tlics",
+            morphology=ask("tlics", "morphology"),
+            plc=ask("tlics", "plc"),
+            neuro=ask("tlics", "neuro"),
+        )
+    st.write(f"**TLICS Score:** {result.score}")
+    st.markdown(f"**Interpretation:** {result.interpretation}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+CALCULATORS = {
+    "1.1 Hunt and Hess (SAH)": hunt_hess,
+    "1.2 Fisher (SAH)": fisher,
+    "1.3 Spetzler-Martin (AVMs)": spetzler_martin,
+    "1.4 Modic (Vertebral Endplate Changes)": modic,
+    "1.5 Pfirrmann (Disc Degeneration)": pfirrmann,
+    "1.6 TLICS (Thoracolumbar Injury)": tlics,
+}
+
+
+def render():
+    st.header("NEURO – Brain & Spine Classifications")
+    option = st.sidebar.selectbox("Select a Neuro Classification System", list(CALCULATORS))
+    panel(CALCULATORS[option])
@@ -0,0 +1,175 @@
+"""-RADS system calculators."""
+import streamlit as st
+
+from radcalc import classify
+
+from .widgets import ask, inputs, panel, several_lesions
+
+
+# -----------------------------------------------------------
+# BI-RADS
+# -----------------------------------------------------------
+def bi_rads():
+    st.subheader("ACR BI-RADS for Breast Imaging")
+    st.markdown("""
+    **Key Imaging Features:**
+    - Mass shape: Oval, Round, Irregular  
+    - Mass margin: Circumscribed, Not-circumscribed  
+    - Calcification morphology: Absent, Benign, Suspicious
+    """)
+    with inputs("bi_rads"):
+        result = classify(
+            "bi_rads",
+            shape=ask("bi_rads", "shape"),
+            margin=ask("bi_rads", "margin"),
+            calc=ask("bi_rads", "calc", "Calcifications"),
+        )
+    st.write(f"**BI-RADS Category:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# Lung-RADS
+# -----------------------------------------------------------
+def lung_rads():
+    st.subheader("Lung-RADS for CT Screening")
+    st.markdown("""
+    **Key Imaging Features:**
+    - Nodule size (mm)  
+    - Nodule type: Solid, Part-solid, Ground-glass
+    """)
+    if several_lesions("lung_rads"):
+        return
+    with inputs("lung_rads"):
+        result = classify(
+            "lung_rads",
+            nodule_size=ask("lung_rads", "nodule_size"),
+            nodule_type=ask("lung_rads", "nodule_type"),
+        )
+    st.write(f"**Lung-RADS Category:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# LI-RADS
+# -----------------------------------------------------------
+def li_rads():
+    st.subheader("LI-RADS for Liver Lesions")
+    st.markdown("""
+    **Key Imaging Features (on CT/MRI with contrast):**
+    - Arterial phase hyperenhancement  
+    - Washout in portal venous/delayed phase  
+    - Capsule appearance  
+    - Lesion size
+    """)
+    if several_lesions("li_rads"):
+        return
+    with inputs("li_rads"):
+        result = classify(
+            "li_rads",
+            aphe=ask("li_rads", "aphe"),
+            washout=ask("li_rads", "washout"),
+            capsule=ask("li_rads", "capsule"),
+            size=ask("li_rads", "size"),
+        )
+    st.write(f"**LI-RADS Category:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# PI-RADS
+# -----------------------------------------------------------
+def pi_rads():
+    st.subheader("PI-RADS for Prostate MRI")
+    st.markdown("""
+    **Key Imaging Features:**
+    - T2 signal: Look for hypointense lesions in the peripheral zone  
+    - Diffusion: Restricted diffusion on DWI/ADC  
+    - Dynamic contrast enhancement (DCE)
+    """)
+    with inputs("pi_rads"):
+        result = classify("pi_rads", t2=ask("pi_rads", "t2"), dwi=ask("pi_rads", "dwi"), dce=ask("pi_rads", "dce"))
+    st.write(f"**PI-RADS Score:** {result.score}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# TI-RADS
+# -----------------------------------------------------------
+def ti_rads():
+    st.subheader("TI-RADS for Thyroid Ultrasound")
+    st.markdown("""
+    **Key Imaging Features:**
+    - Nodule composition: Cystic, Mixed, Solid  
+    - Echogenicity: Anechoic, Isoechoic, Hypoechoic  
+    - Shape: Taller-than-wide?  
+    - Margins: Smooth or Irregular  
+    - Presence of microcalcifications
+    """)
+    if several_lesions("ti_rads"):
+        return
+    with inputs("ti_rads"):
+        result = classify(
+            "ti_rads",
+            composition=ask("ti_rads", "composition"),
+            echogenicity=ask("ti_rads", "echogenicity"),
+            shape=ask("ti_rads", "shape"),
+            margins=ask("ti_rads", "margins"),
+            microcalc=ask("ti_rads", "microcalc"),
+        )
+    st.write(f"**TI-RADS Category:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# O-RADS
+# -----------------------------------------------------------
+def o_rads():
+    st.subheader("O-RADS for Ovarian/Adnexal Masses")
+    st.markdown("""
+    **Key Imaging Features (US/MRI):**
+    - Mass morphology: Simple cyst, Multilocular cyst, Complex mass  
+    - Presence of septations and papillary projections  
+    - Vascular flow on Doppler
+    """)
+    with inputs("o_rads"):
+        result = classify(
+            "o_rads",
+            morphology=ask("o_rads", "morphology"),
+            septations=ask("o_rads", "septations"),
+            papillary=ask("o_rads", "papillary"),
+        )
+    st.write(f"**O-RADS Category:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# NI-RADS
+# -----------------------------------------------------------
+def ni_rads():
+    st.subheader("NI-RADS for Neck Imaging")
+    st.markdown("""
+    **Key Imaging Features:**
+    - Evaluation of the primary site and nodal regions post-treatment for head & neck cancers.
+    """)
+    with inputs("ni_rads"):
+        result = classify("ni_rads", ni_rads=ask("ni_rads", "ni_rads"))
+    st.write(f"**NI-RADS Category:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+CALCULATORS = {
+    "BI-RADS (Breast)": bi_rads,
+    "Lung-RADS (Lung CT Screening)": lung_rads,
+    "LI-RADS (Liver)": li_rads,
+    "PI-RADS (Prostate)": pi_rads,
+    "TI-RADS (Thyroid)": ti_rads,
+    "O-RADS (Ovarian-Adnexal)": o_rads,
+    "NI-RADS (Neck)": ni_rads,
+}
+
+
+def render():
+    st.header("-RADS Systems Overview")
+    option = st.sidebar.selectbox("Select a -RADS System", list(CALCULATORS))
+    panel(CALCULATORS[option])
@@ -0,0 +1,69 @@
+"""Study report: several classifications from one set of findings."""
+from functools import partial
+
+import pandas as pd
+import streamlit as st
+
+from radcalc import SYSTEMS, ClassificationError, get
+from radcalc.report import Report
+
+from .widgets import ask, panel
+
+TRAUMA_CT = ("aast_spleen", "tlics", "ao_ota", "tscherne")
+
+
+def finding_names(systems):
+    """Finding name of each `(system, field)`.
+
+    Fields with the same name share one finding unless the selected
+    systems disagree on its options (`shape` in BI-RADS and TI-RADS) or,
+    for a numeric field, on its label and range (`size` is in cm for
+    Spetzler-Martin, in mm for LI-RADS). Then each gets a
+    `<system>.<field>` finding of its own.
+    """
+    variants = {}
+    for key in systems:
+        for f in get(key).fields:
+            meaning = f.options if f.options else (f.label, f.min_value, f.max_value)
+            variants.setdefault(f.name, set()).add(meaning)
+    return {(key, f.name): f.name if len(variants[f.name]) == 1 else f"{key}.{f.name}"
+            for key in systems for f in get(key).fields}
+
+
+def study(systems):
+    report = st.session_state.get("study_report")
+    if report is None or report.systems != tuple(systems):
+        report = st.session_state["study_report"] = Report(systems)
+    names = finding_names(systems)
+    findings = {}
+    for key in systems:
+        with st.expander(get(key).name, expanded=True):
+            for f in get(key).fields:
+                name = names[(key, f.name)]
+                if name not in findings:
+                    findings[name] = ask(key, f.name, key=f"finding_{name}")
+    rescored = report.update(**findings)
+
+    rows = []
+    for key in systems:
+        result = report.results[key]
+        if isinstance(result, ClassificationError):
+            rows.append({"System": get(key).name, "Result": "", "Next Steps": str(result)})
+        else:
+            rows.append({"System": get(key).name,
+                         "Result": f"{result.grade}" + (f" ({result.interpretation})" if result.interpretation else ""),
+                         "Next Steps": result.next_steps})
+    st.subheader("Study Report")
+    st.dataframe(pd.DataFrame(rows), hide_index=True)
+    st.caption("Recomputed on this change: " + (", ".join(get(key).name for key in rescored) or "nothing"))
+
+
+def render():
+    st.header("Study Report")
+    st.markdown("Enter the findings of one study once and read every selected classification together. "
+                "Findings shared by several systems are asked once; changing one recomputes only the "
+                "systems that use it.")
+    systems = st.multiselect("Classifications in this report", list(SYSTEMS), default=TRAUMA_CT,
+                             format_func=lambda key: SYSTEMS[key].name)
+    if systems:
+        panel(partial(study, systems))
@@ -0,0 +1,166 @@
+"""Rerun timings, their structured log and the operator's sampling profiler.
+
+Every script run is timed by section (imports, page dispatch, table
+warm-up, calculator) and logged as one JSON line on the `radcalc.timing`
+logger; set `RADCALC_TIMING_LOG=<path>` to append those lines to a file.
+Fragment reruns of a calculator panel are logged as `"event": "panel"`.
+
+With `RADCALC_OPERATOR=1` in the server environment the sidebar shows
+the last rerun's timings and can arm a sampling profiler for the next N
+full reruns; the profile is shown as a top-functions table and offered
+as collapsed stacks (the input format of flamegraph tools).
+"""
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+LOG_ENV = "RADCALC_TIMING_LOG"
+OPERATOR_ENV = "RADCALC_OPERATOR"
+
+log = logging.getLogger("radcalc.timing")
+
+
+@st.cache_resource
+def _log_file():
+    """Attach the JSON-lines file handler once per server process."""
+    path = os.environ.get(LOG_ENV)
+    if path:
+        handler = logging.FileHandler(path, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(handler)
+        log.setLevel(logging.INFO)
+        log.propagate = False
+    return path
+
+
+def operator() -> bool:
+    return os.environ.get(OPERATOR_ENV, "") not in ("", "0")
+
+
+def emit(event, **fields):
+    """Log one timing record as a JSON line."""
+    _log_file()
+    ctx = get_script_run_ctx()
+    record = {"event": event, "time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+              "session": ctx.session_id if ctx else None, **fields}
+    log.info(json.dumps(record, ensure_ascii=False))
+    return record
+
+
+class Rerun:
+    """Section timings of one script run, measured from `started`."""
+
+    def __init__(self, started):
+        self.started = started
+        self.mark = started
+        self.sections = {}
+
+    def lap(self, name):
+        """Close section `name` at the current time."""
+        now = time.perf_counter()
+        self.sections[name] = round((now - self.mark) * 1e3, 3)
+        self.mark = now
+
+    @contextmanager
+    def section(self, name):
+        self.mark = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.lap(name)
+
+    def finish(self, **fields):
+        total = round((time.perf_counter() - self.started) * 1e3, 3)
+        st.session_state["last_rerun"] = emit("rerun", **fields, sections=self.sections, total_ms=total)
+
+
+class Sampler:
+    """Samples one thread's Python stack every `interval` seconds from a helper thread."""
+
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="radcalc-sampler", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+
+def start_profile():
+    """A running `Sampler` when the operator armed the profiler for this rerun, else None."""
+    if st.session_state.get("profile_remaining", 0) <= 0:
+        return None
+    return Sampler(threading.get_ident()).start()
+
+
+def stop_profile(sampler):
+    if sampler is None:
+        return
+    profile = st.session_state.setdefault("profile", Counter())
+    profile.update(sampler.stop())
+    st.session_state["profile_remaining"] -= 1
+
+
+def top_functions(stacks: Counter, limit=25) -> list:
+    """Functions by samples in which they were on the stack (total) and on top (self)."""
+    total, own = Counter(), Counter()
+    for stack, n in stacks.items():
+        frames = stack.split(";")
+        own[frames[-1]] += n
+        for name in set(frames):
+            total[name] += n
+    samples = sum(stacks.values()) or 1
+    return [{"function": name, "total %": round(100 * n / samples, 1), "self %": round(100 * own[name] / samples, 1)}
+            for name, n in total.most_common(limit)]
+
+
+def operator_panel():
+    """Sidebar timings and profiler controls, for operators only."""
+    if not operator():
+        return
+    with st.sidebar.expander("Performance (operator)"):
+        last = st.session_state.get("last_rerun")
+        if last:
+            st.caption(f"Previous rerun: {last['total_ms']:.1f} ms")
+            st.json(last["sections"])
+        runs = st.number_input("Reruns to profile", min_value=1, max_value=50, value=5, key="profile_runs")
+        if st.button("Profile the next reruns"):
+            st.session_state["profile"] = Counter()
+            st.session_state["profile_remaining"] = runs
+        remaining = st.session_state.get("profile_remaining", 0)
+        profile = st.session_state.get("profile")
+        if remaining > 0:
+            st.caption(f"Profiling: {remaining} rerun(s) to go.")
+        elif profile:
+            st.caption(f"{sum(profile.values())} samples")
+            st.dataframe(top_functions(profile), hide_index=True)
+            stacks = "".join(f"{stack} {n}\n" for stack, n in profile.most_common())
+            st.download_button("Download collapsed stacks", stacks, file_name="radcalc-profile.txt")
@@ -0,0 +1,136 @@
+"""Score an uploaded findings table in the app instead of the CLI."""
+import hashlib
+import io
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from radcalc.engine import applicable_systems
+from radcalc.parallel import score_file
+
+CHUNK_SIZE = 20_000
+KEPT_FILES = 8  # scored uploads kept on disk for instant re-opening
+
+
+class ScoredFiles:
+    """Scored outputs on disk keyed by (content hash, systems), least recently used evicted."""
+
+    def __init__(self, size=KEPT_FILES):
+        self.size = size
+        self.directory = Path(tempfile.mkdtemp(prefix="radcalc-uploads-"))
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry):
+        with self.lock:
+            self.entries[key] = entry
+            while len(self.entries) > self.size:
+                _, (old, _, _) = self.entries.popitem(last=False)
+                old.unlink(missing_ok=True)
+
+
+@st.cache_resource
+def scored_files():
+    """One store per server process, shared by every session."""
+    return ScoredFiles()
+
+
+def _columns(data, parquet):
+    if parquet:
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(io.BytesIO(data)).schema_arrow.names
+    return list(pd.read_csv(io.BytesIO(data), nrows=0).columns)
+
+
+def _row_count(data, parquet):
+    if parquet:
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(io.BytesIO(data)).metadata.num_rows
+    return max(data.count(b"\n") - 1, 1)  # close enough for a progress bar
+
+
+def _temp_file(directory, suffix):
+    fd, name = tempfile.mkstemp(suffix=suffix, dir=directory)
+    os.close(fd)
+    return Path(name)
+
+
+def _score(data, parquet, systems, store):
+    suffix = ".parquet" if parquet else ".csv"
+    source, output = _temp_file(store.directory, suffix), _temp_file(store.directory, suffix)
+    source.write_bytes(data)
+    total = _row_count(data, parquet)
+    bar = st.progress(0.0, text="Scoring...")
+
+    def progress(rows):
+        bar.progress(min(rows / total, 1.0), text=f"Scored {rows:,} of about {total:,} rows")
+
+    try:
+        rows, invalid = score_file(source, output, systems, chunk_size=CHUNK_SIZE, progress=progress)
+    finally:
+        source.unlink(missing_ok=True)
+    bar.empty()
+    return output, rows, invalid
+
+
+def _preview(path, rows=100):
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+        return next(pq.ParquetFile(path).iter_batches(batch_size=rows)).to_pandas()
+    return pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[""], nrows=rows)
+
+
+def render():
+    st.header("Score a Findings Table")
+    st.markdown("""
+    Upload a CSV or Parquet file with one study per row and columns named after the classifier
+    inputs (e.g. `nodule_size`, `composition`; use `<system>.<field>` where two systems share a name).
+    Every applicable system is scored and added as `<system>_grade`, `<system>_score` and
+    `<system>_error` columns.
+    """)
+    upload = st.file_uploader("Findings table", type=["csv", "parquet", "pq"])
+    if upload is None:
+        return
+    parquet = upload.name.lower().endswith((".parquet", ".pq"))
+    data = upload.getvalue()
+    try:
+        available = applicable_systems(_columns(data, parquet))
+    except (OSError, ValueError) as exc:
+        st.error(f"Could not read {upload.name}: {exc}")
+        return
+    if not available:
+        st.warning("No classification system has all of its inputs among the columns of this file.")
+        return
+    systems = st.multiselect("Systems to score", available, default=available)
+    if not systems:
+        return
+
+    store = scored_files()
+    key = (hashlib.sha256(data).hexdigest(), tuple(systems), parquet)
+    entry = store.get(key)
+    if entry is None or not entry[0].exists():
+        entry = _score(data, parquet, systems, store)
+        store.put(key, entry)
+    else:
+        st.caption("Same file as before: loaded the stored result.")
+    output, rows, invalid = entry
+
+    st.write(f"**Scored:** {rows:,} rows with {len(systems)} system(s); {invalid:,} cells could not be scored.")
+    if rows:
+        st.dataframe(_preview(output), hide_index=True)
+    # Read from disk only when the reader clicks, not on every rerun.
+    st.download_button("Download scored table", data=output.read_bytes,
+                       file_name=f"scored_{Path(upload.name).stem}{output.suffix}",
+                       mime="application/octet-stream" if parquet else "text/csv")
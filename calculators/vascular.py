@@ -0,0 +1,72 @@
+"""INTERVENTIONAL RADIOLOGY / VASCULAR calculators."""
+import streamlit as st
+
+from radcalc import classify
+
+from .widgets import ask, inputs, panel
+
+
+# -----------------------------------------------------------
+# 6.1 TICI Score (Stroke)
+# -----------------------------------------------------------
+def tici():
+    st.subheader("TICI Score for Reperfusion in Stroke")
+    st.markdown("""
+    **Key Angiographic Findings (DSA):**
+    - Degree of perfusion beyond the occlusion.
+    """)
+    with inputs("tici"):
+        result = classify("tici", tici=ask("tici", "tici"))
+    st.write(f"**TICI Grade:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 6.2 Hamburg Classification (Vascular Malformations)
+# -----------------------------------------------------------
+def hamburg():
+    st.subheader("Hamburg Classification for Vascular Malformations")
+    st.markdown("""
+    **Key Features:**
+    - Flow dynamics: Fast-flow vs. slow-flow  
+    - Predominant tissue type: Capillary, venous, lymphatic, arterial, or combined.
+    """)
+    with inputs("hamburg"):
+        result = classify("hamburg", flow=ask("hamburg", "flow"), tissue=ask("hamburg", "tissue"))
+    st.write(f"**Classification:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+# -----------------------------------------------------------
+# 6.3 VARC Criteria (TAVR)
+# -----------------------------------------------------------
+def varc():
+    st.subheader("VARC Criteria for TAVR Outcomes")
+    st.markdown("""
+    **Key Points:**
+    - Valve positioning on fluoroscopy/CT  
+    - Paravalvular leak on echocardiography  
+    - Vascular access complications on CT angiography
+    """)
+    with inputs("varc"):
+        result = classify(
+            "varc",
+            positioning=ask("varc", "positioning"),
+            leak=ask("varc", "leak"),
+            access=ask("varc", "access"),
+        )
+    st.write(f"**VARC Outcome Assessment:** {result.grade}")
+    st.markdown(f"**Next Steps:** {result.next_steps}")
+
+
+CALCULATORS = {
+    "6.1 TICI Score (Stroke)": tici,
+    "6.2 Hamburg Classification (Vascular Malformations)": hamburg,
+    "6.3 VARC Criteria (TAVR)": varc,
+}
+
+
+def render():
+    st.header("Interventional Radiology / Vascular Classifications")
+    option = st.sidebar.selectbox("Select a Vascular Classification", list(CALCULATORS))
+    panel(CALCULATORS[option])
@@ -0,0 +1,142 @@
+"""Widget helpers shared by the calculator pages."""
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from radcalc import SYSTEMS, audit, classify, get
+from radcalc.batch import score_frame
+
+from . import timing
+
+
+@st.cache_resource
+def warm_tables(category):
+    """Build the lookup tables of one category once per server process."""
+    return {key: c.table for key, c in SYSTEMS.items() if c.category == category}
+
+
+def _session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else None
+
+
+@st.cache_resource
+def audit_log():
+    """Start the audit log of the app's calculations once per server process (see `radcalc.audit`)."""
+    return audit.enable("ui", session=_session_id)
+
+
+@st.fragment
+def panel(calculator):
+    """Run one calculator as a fragment.
+
+    Changing one of its inputs reruns only this panel; the page shell,
+    intro and sidebar are left as they are.
+    """
+    started = time.perf_counter()
+    calculator()
+    timing.emit("panel", calculator=getattr(calculator, "__name__", None) or calculator.func.__name__,
+                total_ms=round((time.perf_counter() - started) * 1e3, 3))
+
+
+def ask(system, name, label=None, **overrides):
+    """Render the widget for one classifier input and return its value."""
+    field = get(system).field_map[name]
+    label = label or field.label
+    if field.widget == "radio":
+        return st.radio(label, field.choices, **overrides)
+    if field.widget == "selectbox":
+        return st.selectbox(label, field.choices, **overrides)
+    kwargs = {"min_value": field.min_value, "value": field.value}
+    if field.max_value is not None:
+        kwargs["max_value"] = field.max_value
+    if field.step is not None:
+        kwargs["step"] = field.step
+    kwargs.update(overrides)
+    if field.widget == "slider":
+        return st.slider(label, **kwargs)
+    return st.number_input(label, **kwargs)
+
+
+def form_mode() -> bool:
+    """True when the reader switched on submit-once form mode in the sidebar."""
+    return st.session_state.get("form_mode", False)
+
+
+@contextmanager
+def inputs(key):
+    """Container for one calculator's inputs.
+
+    In form mode the widgets are collected in an `st.form`, so changing
+    them does not rerun the app; the result is recomputed once on submit.
+    """
+    if not form_mode():
+        yield
+        return
+    with st.form(f"form_{key}"):
+        yield
+        st.form_submit_button("Calculate")
+
+
+def ask_if(show, system, name, **overrides):
+    """An input shown only when `show`; otherwise its not-applicable default.
+
+    Inside a form `show` reflects the last submitted values, so the input
+    is always shown there and the classifier ignores it when not applicable.
+    """
+    if show or form_mode():
+        return ask(system, name, **overrides)
+    return get(system).field_map[name].default
+
+
+def several_lesions(system) -> bool:
+    """Offer a one-row-per-lesion grid instead of the single-lesion inputs.
+
+    Returns True when the reader switched it on; the grid and its results
+    have then been rendered and the caller skips its own inputs.
+    """
+    if not st.toggle("Several lesions", key=f"several_{system}",
+                     help="Enter every lesion of the study in a table and score them together."):
+        return False
+    lesion_table(system)
+    return True
+
+
+def lesion_table(system):
+    """Editable lesion grid scored in one vectorized pass; the worst lesion is highlighted."""
+    classifier = get(system)
+    columns, first = {}, {}
+    for f in classifier.fields:
+        if f.numeric:
+            columns[f.name] = st.column_config.NumberColumn(
+                f.label, min_value=f.min_value, max_value=f.max_value, step=f.step, required=True)
+            first[f.name] = f.value
+        else:
+            columns[f.name] = st.column_config.SelectboxColumn(f.label, options=list(f.options), required=True)
+            first[f.name] = f.default or f.choices[0]
+    with inputs(f"{system}_lesions"):
+        lesions = st.data_editor(pd.DataFrame([first]), column_config=columns, num_rows="dynamic",
+                                 hide_index=True, key=f"lesions_{system}").reset_index(drop=True)
+    scored = score_frame(lesions, [system])
+    grades = scored[f"{system}_grade"]
+    valid = scored[f"{system}_error"] == ""
+    if not valid.any():
+        st.info("Enter at least one complete lesion.")
+        return
+    # Rank by the grade's place in the system's result order, which runs from the
+    # least to the most severe category; a plain max() would compare the labels
+    # alphabetically.
+    order = dict.fromkeys(result.grade for result in classifier.table.results)
+    severity = {grade: rank for rank, grade in enumerate(order)}
+    worst = max(grades[valid], key=severity.get)
+    shown = scored.rename(columns={f"{system}_grade": "Category", f"{system}_score": "Score",
+                                   f"{system}_error": "Problem"})
+    shown.index = pd.RangeIndex(1, len(shown) + 1, name="Lesion")
+    st.dataframe(shown.style.apply(
+        lambda row: ["background-color: #ffd6d6" if row["Category"] == worst else ""] * len(row), axis=1))
+    result = classify(system, **lesions.loc[(valid & (grades == worst)).idxmax()].to_dict())
+    st.write(f"**Worst lesion:** {worst}" + (f" ({result.interpretation})" if result.interpretation else ""))
+    st.markdown(f"**Next Steps:** {result.next_steps}")
@@ -0,0 +1,25 @@
+"""Headless scoring core for the Radiologic Classifications Calculator.
+
+    >>> from radcalc import classify
+    >>> classify("ti_rads", composition="Solid", echogenicity="Hypoechoic",
+    ...          shape="Taller-than-wide", margins="Smooth", microcalc="No").grade
+    'TR3'
+"""
+import os
+
+from .cache import cache_clear, cache_info
+from .engine import (
+    CATEGORIES, SYSTEMS, ClassificationError, Classifier, Field, Result,
+    classify, get, register,
+)
+from . import systems  # noqa: F401  (registers the classifiers)
+
+if os.environ.get("RADCALC_RULES"):  # radcalc.rules.RULES_ENV; not imported unless needed
+    from . import rules
+
+    rules.load()
+
+__all__ = [
+    "CATEGORIES", "SYSTEMS", "ClassificationError", "Classifier", "Field", "Result",
+    "cache_clear", "cache_info", "classify", "get", "register",
+]
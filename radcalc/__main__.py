@@ -0,0 +1,216 @@
+"""Command line entry point: `python -m radcalc <command> ...`."""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+from . import SYSTEMS, ClassificationError
+
+
+def cmd_systems(args):
+    for key, classifier in SYSTEMS.items():
+        fields = ", ".join(f.name for f in classifier.fields)
+        origin = f" (from {classifier.source})" if classifier.source else ""
+        print(f"{key:<18} {classifier.name} [{fields}]{origin}")
+        for f in classifier.fields:
+            if f.breakpoints is not None:
+                cuts = ", ".join(f"{op} {v}" for v, op in f.breakpoints.cuts)
+                print(f"{'':<18}   {f.name} cut-points: {cuts}")
+    return 0
+
+
+def cmd_score(args):
+    from .audit import enable
+    from .parallel import score_file
+
+    enable("cli")
+    rows, invalid = score_file(args.input, args.output, args.system, args.workers, args.chunk_size)
+    print(f"scored {rows} rows -> {args.output} ({invalid} invalid cells)", file=sys.stderr)
+    write_metrics(args)
+    return 0
+
+
+def cmd_stream(args):
+    from .audit import enable
+    from .parallel import score_lines
+    from .stream import score_stream, write_stream
+
+    enable("cli")
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    dst = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        if args.workers > 1:
+            count = score_lines(src, dst, args.system, args.id_field, args.workers, args.chunk_size)
+        else:
+            count = write_stream(score_stream(src, args.system, args.id_field), dst)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+    print(f"wrote {count} results", file=sys.stderr)
+    write_metrics(args)
+    return 0
+
+
+def cmd_serve(args):
+    from .service import run
+
+    run(args.host, args.port)
+    return 0
+
+
+def cmd_rules_export(args):
+    import json
+
+    from .rules import export
+
+    specs = [export(key) for key in args.system]
+    text = json.dumps(specs if len(specs) > 1 else specs[0], indent=2, ensure_ascii=False)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            fh.write(text + "\n")
+    return 0
+
+
+def cmd_rules_check(args):
+    from .rules import load_file, rule_files
+
+    for path in args.path:
+        for file in rule_files(path):
+            for classifier in load_file(file):
+                print(f"{file}: {classifier.key} ok ({len(classifier.table)} input combinations)")
+    return 0
+
+
+def cmd_coverage(args):
+    import json
+
+    from .coverage import coverage
+
+    reports = [coverage(key) for key in (args.system or SYSTEMS)]
+    if args.json:
+        print(json.dumps([r._asdict() for r in reports], indent=2, ensure_ascii=False))
+    else:
+        for r in reports:
+            outputs = ", ".join(f"{grade} {n}" for grade, n in r.outputs.items())
+            print(f"{r.system:<18} {r.combinations:>4} combinations: {outputs}")
+            for line in r.unreachable:
+                print(f"{'':<18}   UNREACHABLE {line}")
+            if args.overlaps:
+                for line in r.overlaps:
+                    print(f"{'':<18}   overlap: {line}")
+    return 1 if any(r.unreachable for r in reports) else 0
+
+
+def cmd_audit(args):
+    import json
+
+    from .audit import AUDIT_ENV, query
+
+    path = args.db or os.environ.get(AUDIT_ENV)
+    if not path:
+        raise ClassificationError(f"no audit database: pass --db or set {AUDIT_ENV}")
+    rows = query(path, args.system, args.grade, args.since, args.until, args.limit)
+    if args.json:
+        print(json.dumps(rows, indent=2, ensure_ascii=False))
+    else:
+        for row in rows:
+            outcome = row["grade"] if row["error"] is None else f"ERROR {row['error']}"
+            inputs = ", ".join(f"{k}={v}" for k, v in row["inputs"].items())
+            print(f"{row['time']} {row['source']:<7} {row['system']:<18} {outcome} [{inputs}]")
+    return 0
+
+
+def write_metrics(args):
+    if args.metrics_file:
+        from .metrics import write_textfile
+        write_textfile(args.metrics_file)
+
+
+def add_worker_options(p):
+    from .parallel import DEFAULT_CHUNK_SIZE
+
+    p.add_argument("-j", "--workers", type=int, default=1,
+                   help="worker processes; 0 means one per available core (default: 1)")
+    p.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                   help=f"rows (or lines) per shard (default: {DEFAULT_CHUNK_SIZE})")
+    p.add_argument("--metrics-file", metavar="PATH",
+                   help="write the run's scoring metrics here, Prometheus textfile format")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="radcalc", description="Radiologic classifications without the UI.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("systems", help="list classification systems and their input fields")
+    p.set_defaults(func=cmd_systems)
+
+    p = sub.add_parser("score", help="score a CSV/Parquet table of findings")
+    p.add_argument("input", help="CSV or Parquet file, one study per row")
+    p.add_argument("-o", "--output", required=True, help="where to write the scored table (.csv or .parquet)")
+    p.add_argument("-s", "--system", action="append", choices=sorted(SYSTEMS),
+                   help="system to score (repeatable); default: every system whose inputs are present")
+    add_worker_options(p)
+    p.set_defaults(func=cmd_score)
+
+    p = sub.add_parser("stream", help="score newline-delimited JSON findings records")
+    p.add_argument("input", nargs="?", default="-", help="JSONL file, one study per line (default: stdin)")
+    p.add_argument("-o", "--output", default="-", help="JSONL file for the results (default: stdout)")
+    p.add_argument("-s", "--system", action="append", choices=sorted(SYSTEMS),
+                   help="system to apply when a record does not name one (repeatable)")
+    p.add_argument("--id-field", default="id", help="record key copied into every result (default: id)")
+    add_worker_options(p)
+    p.set_defaults(func=cmd_stream)
+
+    p = sub.add_parser("rules", help="declarative rule files (see radcalc.rules)")
+    rules = p.add_subparsers(dest="rules_command", required=True)
+    r = rules.add_parser("export", help="write systems as a rule file to start from")
+    r.add_argument("system", nargs="+", choices=sorted(SYSTEMS), help="system(s) to export")
+    r.add_argument("-o", "--output", default="-", help="JSON file to write (default: stdout)")
+    r.set_defaults(func=cmd_rules_export)
+    r = rules.add_parser("check", help="compile rule files without installing them")
+    r.add_argument("path", nargs="+", help="rule file or directory of *.json files")
+    r.set_defaults(func=cmd_rules_check)
+
+    p = sub.add_parser("coverage", help="run every classifier over its whole input space")
+    p.add_argument("-s", "--system", action="append", choices=sorted(SYSTEMS),
+                   help="system to check (repeatable); default: all")
+    p.add_argument("--overlaps", action="store_true", help="also list branches shadowed by earlier ones")
+    p.add_argument("--json", action="store_true", help="print the report as JSON")
+    p.set_defaults(func=cmd_coverage)
+
+    p = sub.add_parser("audit", help="list recorded calculations (see radcalc.audit)")
+    p.add_argument("--db", help="audit database (default: $RADCALC_AUDIT_DB)")
+    p.add_argument("-s", "--system", choices=sorted(SYSTEMS), help="only this system")
+    p.add_argument("--grade", help="only results starting with this text, e.g. 'Category 4'")
+    p.add_argument("--since", help="ISO date or time, UTC unless it has an offset; inclusive")
+    p.add_argument("--until", help="ISO date or time, UTC unless it has an offset; exclusive")
+    p.add_argument("-n", "--limit", type=int, default=100, help="most recent N (default: 100)")
+    p.add_argument("--json", action="store_true", help="print the rows as JSON")
+    p.set_defaults(func=cmd_audit)
+
+    p = sub.add_parser("serve", help="run the local HTTP scoring service")
+    p.add_argument("--host", default="127.0.0.1", help="bind address (default: 127.0.0.1)")
+    p.add_argument("--port", type=int, default=8765, help="port (default: 8765)")
+    p.set_defaults(func=cmd_serve)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if getattr(args, "workers", 1) == 0:
+        from .parallel import default_workers
+        args.workers = default_workers()
+    try:
+        return args.func(args)
+    except ClassificationError as exc:
+        print(f"radcalc: {exc}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,319 @@
+"""Append-only audit log of calculations in a local SQLite database.
+
+Set `RADCALC_AUDIT_DB=<path>` and every calculation made through the UI,
+the CLI (`score`, `stream`) or the service is recorded with its inputs,
+system, result and time:
+
+    calculations(id, time, source, session, system, inputs, grade, score, error)
+
+`grade` is the output category (`"Category 4A"`, `"TR3"`, ...), `inputs`
+a JSON object and `time` an ISO-8601 UTC timestamp; `source` is `ui`,
+`cli` or `service`. Rows cannot be updated or deleted (triggers abort
+the statement). Indexes serve the usual QA queries, e.g. every Lung-RADS
+4 since a date:
+
+    SELECT time, inputs FROM calculations
+    WHERE system = 'lung_rads' AND grade GLOB 'Category 4*' AND time >= '2024-05-06'
+
+or `python -m radcalc audit -s lung_rads --grade "Category 4" --since 2024-05-06`.
+
+Recording a calculation only appends a tuple to a queue. A background
+thread writes the queue in batches, one transaction per batch, to a
+database in WAL mode, so readers never wait for the log. Once
+`MAX_QUEUE` calculations are waiting, recording blocks until the writer
+catches up, and at exit the queue is written out in full. In the UI a
+rerun that repeats a session's last calculation of a system is not
+recorded again.
+"""
+from __future__ import annotations
+
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+AUDIT_ENV = "RADCALC_AUDIT_DB"
+BATCH_SIZE = 1000
+INTERVAL = 0.25  # seconds between writes when the queue is not full
+MAX_QUEUE = 100 * BATCH_SIZE  # calculations waiting before `record` blocks
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS calculations (
+    id INTEGER PRIMARY KEY,
+    time TEXT NOT NULL,
+    source TEXT NOT NULL,
+    session TEXT,
+    system TEXT NOT NULL,
+    inputs TEXT NOT NULL,
+    grade TEXT,
+    score INTEGER,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS calculations_time ON calculations (time);
+CREATE INDEX IF NOT EXISTS calculations_system ON calculations (system, time);
+CREATE INDEX IF NOT EXISTS calculations_grade ON calculations (system, grade, time);
+CREATE TRIGGER IF NOT EXISTS calculations_no_update BEFORE UPDATE ON calculations
+BEGIN SELECT RAISE(ABORT, 'the audit log is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS calculations_no_delete BEFORE DELETE ON calculations
+BEGIN SELECT RAISE(ABORT, 'the audit log is append-only'); END;
+"""
+
+INSERT = ("INSERT INTO calculations (time, source, session, system, inputs, grade, score, error) "
+          "VALUES (?, ?, ?, ?, ?, ?, ?, ?)")
+
+
+def connect(path):
+    import sqlite3
+
+    db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.executescript(SCHEMA)
+    return db
+
+
+def _inputs_json(inputs) -> str:
+    import json
+
+    return json.dumps(inputs, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def _rows(source, records):
+    """Queued records as `INSERT` parameters; `inputs` is a dict or already JSON."""
+    from datetime import datetime, timezone
+
+    last = stamp = None
+    for when, session, system, inputs, grade, score, error in records:
+        if when != last:  # rows of one scored table share a time
+            last, stamp = when, datetime.fromtimestamp(when, timezone.utc).isoformat(timespec="milliseconds")
+        text = inputs if isinstance(inputs, str) else _inputs_json(inputs)
+        yield (stamp, source, session, system, text, None if grade is None else str(grade),
+               score if isinstance(score, int) else None, error)
+
+
+class AuditLog:
+    """Queue of calculations drained into `path` by a writer thread."""
+
+    def __init__(self, path, source, session=None):
+        self.path = str(path)
+        self.source = source
+        self.session = session  # callable returning the current session id, or None
+        self._queue: deque = deque()
+        self._last: dict = {}  # (session, system) -> inputs last recorded, for UI reruns
+        self._wake = threading.Event()
+        self._idle = threading.Condition()
+        self._room = threading.Condition()  # notified as the writer shortens the queue
+        self._cycles = 0  # completed drains of the queue
+        self._stop = False
+        self._child = False  # a forked worker: no writer, records go back to the parent
+        self.dropped = 0  # calculations discarded because the writer had failed
+        connect(self.path).close()  # fail now on a bad path, not in the thread
+        self._thread = threading.Thread(target=self._run, name="radcalc-audit", daemon=True)
+        self._thread.start()
+
+    def record(self, system, inputs, result=None, error=None) -> None:
+        session = self.session() if self.session else None
+        if session is not None:
+            key = (session, system)
+            if self._last.get(key) == inputs:
+                return
+            if len(self._last) > 100_000:
+                self._last.clear()
+            self._last[key] = dict(inputs)
+        grade, score = (result.grade, result.score) if result is not None else (None, None)
+        if len(self._queue) >= MAX_QUEUE and not self._wait_for_room():
+            self.dropped += 1
+            return
+        self._queue.append((time.time(), session, system, inputs, grade, score, error))
+        if len(self._queue) >= BATCH_SIZE:
+            self._wake.set()
+
+    def record_frame(self, system, frame, mapping, out) -> None:
+        """Record every row of a scored table (see `radcalc.batch.score_frame`).
+
+        Inputs are serialized once per distinct combination, as in the batch scorer.
+        """
+        import numpy as np
+        import pandas as pd
+
+        from .batch import _unique_rows
+
+        names = list(mapping)
+        columns = frame[list(mapping.values())]
+        codes, first = _unique_rows(columns)
+        texts = np.array([_inputs_json({n: v for n, v in zip(names, row) if not pd.isna(v)})
+                          for row in columns.iloc[first].itertuples(index=False, name=None)], dtype=object)[codes]
+        grades = out[f"{system}_grade"].astype(object)
+        grades = grades.where(grades.notna(), None).tolist()
+        if f"{system}_score" in out:
+            scores = out[f"{system}_score"].astype(object)
+            scores = scores.where(scores.notna(), None).tolist()
+        else:
+            scores = [None] * len(out)
+        errors = [error or None for error in out[f"{system}_error"].tolist()]
+        now, session = time.time(), self.session() if self.session else None
+        records = [(now, session, system, text, grade, score, error)
+                   for text, grade, score, error in zip(texts, grades, scores, errors)]
+        if session is not None:
+            key, rows = (session, system, "table"), list(texts)
+            if self._last.get(key) == rows:
+                return
+            self._last[key] = rows
+        self.extend(records)
+
+    def extend(self, records) -> None:
+        records = list(records)
+        for start in range(0, len(records), BATCH_SIZE):
+            if len(self._queue) >= MAX_QUEUE and not self._wait_for_room():
+                self.dropped += len(records) - start
+                break
+            self._queue.extend(records[start:start + BATCH_SIZE])
+        self._wake.set()
+
+    def _wait_for_room(self) -> bool:
+        """Block while the queue is full; False when no writer will ever drain it."""
+        if self._child:
+            return True  # emptied by `take` after every chunk
+        with self._room:
+            while len(self._queue) >= MAX_QUEUE:
+                if not self._thread.is_alive():
+                    return False
+                self._wake.set()
+                self._room.wait(1.0)
+        return True
+
+    def take(self) -> list:
+        """Records not yet written, removed from the queue (a worker hands these to its parent)."""
+        records = []
+        while self._queue:
+            records.append(self._queue.popleft())
+        return records
+
+    def _run(self):
+        db = connect(self.path)
+        try:
+            while True:
+                self._wake.wait(INTERVAL)
+                self._wake.clear()
+                while self._queue:
+                    batch = []
+                    while self._queue and len(batch) < BATCH_SIZE:
+                        batch.append(self._queue.popleft())
+                    with db:
+                        db.executemany(INSERT, _rows(self.source, batch))
+                    with self._room:
+                        self._room.notify_all()
+                with self._idle:
+                    self._cycles += 1
+                    self._idle.notify_all()
+                if self._stop:
+                    return
+        finally:
+            db.close()
+            with self._room:
+                self._room.notify_all()
+
+    def flush(self, timeout=30) -> None:
+        """Block until everything recorded so far is written."""
+        with self._idle:
+            # The drain in progress may have started before the latest records: wait for the next one.
+            target = self._cycles + 2
+            self._wake.set()
+            self._idle.wait_for(lambda: self._cycles >= target or not self._thread.is_alive(), timeout)
+
+    def close(self) -> None:
+        """Write out everything queued, however long it takes; complain about anything lost."""
+        if self._child:
+            return
+        self._stop = True
+        self._wake.set()
+        self._thread.join()
+        lost = self.dropped + len(self._queue)
+        if lost:
+            print(f"radcalc: {lost:,} calculations were not written to the audit log {self.path}",
+                  file=sys.stderr)
+
+
+LOG: AuditLog | None = None
+_pid = os.getpid()
+
+
+def enable(source, path=None, session=None) -> AuditLog | None:
+    """Start the process's audit log, at `path` or `RADCALC_AUDIT_DB`; None when neither is set."""
+    global LOG
+    path = path or os.environ.get(AUDIT_ENV)
+    if LOG is None and path:
+        LOG = AuditLog(path, source, session)
+        atexit.register(LOG.close)
+    return LOG
+
+
+def take() -> list:
+    """In a forked worker: the calculations recorded since the last `take`."""
+    return LOG.take() if LOG is not None and os.getpid() != _pid else []
+
+
+def extend(records) -> None:
+    if LOG is not None and records:
+        LOG.extend(records)
+
+
+def _forked():
+    # The writer thread does not survive a fork: workers only queue, and
+    # `radcalc.parallel` hands their records back to the parent's log.
+    if LOG is not None:
+        LOG._queue = deque()
+        LOG._wake = threading.Event()
+        LOG._idle = threading.Condition()
+        LOG._room = threading.Condition()
+        LOG._child = True
+
+
+os.register_at_fork(after_in_child=_forked)
+
+
+def _stored_time(value: str, option: str) -> str:
+    """An ISO date or time as stored: UTC, milliseconds. A time without an offset is UTC."""
+    from datetime import datetime, timezone
+
+    from .engine import ClassificationError
+
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise ClassificationError(f"{option}: not an ISO date or time: {value!r}") from None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat(timespec="milliseconds")
+
+
+def query(path, system=None, grade=None, since=None, until=None, limit=100) -> list:
+    """Most recent calculations first, as dicts; `grade` matches a prefix, `since`/`until` are ISO times."""
+    import json
+    import sqlite3
+
+    if grade is not None:  # a literal prefix: GLOB's wildcards match only themselves inside brackets
+        grade = "".join(f"[{c}]" if c in "*?[" else c for c in grade)
+    if since is not None:
+        since = _stored_time(since, "since")
+    if until is not None:
+        until = _stored_time(until, "until")
+    where, params = [], []
+    for clause, value in (("system = ?", system), ("grade GLOB ? || '*'", grade),
+                          ("time >= ?", since), ("time < ?", until)):
+        if value is not None:
+            where.append(clause)
+            params.append(value)
+    sql = "SELECT * FROM calculations" + (" WHERE " + " AND ".join(where) if where else "")
+    sql += " ORDER BY time DESC, id DESC LIMIT ?"
+    db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    db.row_factory = sqlite3.Row
+    try:
+        rows = [dict(row) for row in db.execute(sql, (*params, limit))]
+    finally:
+        db.close()
+    for row in rows:
+        row["inputs"] = json.loads(row["inputs"])
+    return rows
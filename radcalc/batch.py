@@ -0,0 +1,141 @@
+"""Batch scoring of findings tables (CSV/Parquet) with pandas.
+
+Input columns are named after the classifier fields (`nodule_size`,
+`composition`, ...). When two systems share a field name with different
+meanings (`shape` in BI-RADS and TI-RADS), a `<system>.<field>` column
+takes precedence over the bare field name.
+
+Rows the NumPy kernels cannot score are grouped by their distinct input
+combination, so the scalar classifier runs once per combination rather
+than once per row.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from . import audit, metrics
+from .engine import ClassificationError, applicable_systems, field_columns, get
+from .vector import get_kernel, score_arrays
+
+
+def _cell(value):
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    return value
+
+
+def score_frame(df: pd.DataFrame, systems=None) -> pd.DataFrame:
+    """Return a copy of `df` with `<system>_grade`, `<system>_score` and `<system>_error` columns.
+
+    Rows with missing or invalid inputs get an empty grade and the reason in
+    `<system>_error`; they never abort the batch.
+    """
+    systems = list(systems) if systems else applicable_systems(df.columns)
+    out = df.copy()
+    for key in systems:
+        classifier = get(key)
+        mapping = field_columns(key, df.columns)
+        if mapping is None:
+            raise ClassificationError(f"{key}: input table lacks columns for {list(classifier.field_names)}")
+        started = perf_counter()
+        if get_kernel(key) is not None:
+            _score_vectorized(out, df, key, mapping)
+        else:
+            grades, scores, errors = _score_rows(classifier, mapping, df)
+            out[f"{key}_grade"] = grades
+            if any(s is not None for s in scores):
+                out[f"{key}_score"] = pd.array(scores, dtype="Int64")
+            out[f"{key}_error"] = errors
+        metrics.observe_frame(key, out[f"{key}_grade"], out[f"{key}_error"], perf_counter() - started)
+        if audit.LOG is not None:
+            audit.LOG.record_frame(key, df, mapping, out)
+    return out
+
+
+def _unique_rows(frame):
+    """`(codes, first)`: a combination code per row and the first row of each combination."""
+    codes = np.zeros(len(frame), dtype=np.int64)
+    for column in frame.columns:
+        column_codes, uniques = pd.factorize(frame[column].to_numpy(dtype=object), use_na_sentinel=False)
+        # Re-factorize after each column so the combined code stays below len(frame).
+        codes, _ = pd.factorize(codes * len(uniques) + column_codes)
+    _, first = np.unique(codes, return_index=True)
+    return codes, first
+
+
+def _objects(values) -> np.ndarray:
+    out = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        out[i] = value
+    return out
+
+
+def _score_rows(classifier, mapping, frame):
+    """Score each distinct input combination once and broadcast it to its rows."""
+    frame = frame[list(mapping.values())]
+    codes, first = _unique_rows(frame)
+    grades, scores, errors = [], [], []
+    for row in frame.iloc[first].itertuples(index=False, name=None):
+        inputs = {}
+        for name, value in zip(mapping, row):
+            value = _cell(value)
+            if value is not None:
+                inputs[name] = value
+        try:
+            result = classifier(**inputs)
+        except ClassificationError as exc:
+            grades.append(None)
+            scores.append(None)
+            errors.append(str(exc))
+        else:
+            grades.append(result.grade)
+            scores.append(result.score)
+            errors.append("")
+    return _objects(grades)[codes], _objects(scores)[codes], _objects(errors)[codes]
+
+
+def _score_vectorized(out, df, key, mapping):
+    """Score valid rows with the NumPy kernel; re-run invalid ones for their error."""
+    classifier = get(key)
+    columns = {}
+    for name, column in mapping.items():
+        values = df[column]
+        columns[name] = values if classifier.field_map[name].options else pd.to_numeric(values, errors="coerce")
+    grades, scores, valid = score_arrays(key, **columns)
+    grades = grades.astype(object)
+    if scores is not None:
+        scores = pd.array(scores, dtype="Int64")
+    errors = np.full(len(df), "", dtype=object)
+    if not valid.all():
+        invalid = np.flatnonzero(~valid)
+        g, sc, e = _score_rows(classifier, mapping, df.iloc[invalid])
+        grades[invalid] = g
+        if scores is not None:
+            scores[invalid] = pd.array(sc, dtype="Int64")
+        errors[invalid] = e
+    out[f"{key}_grade"] = grades
+    if scores is not None:
+        out[f"{key}_score"] = scores
+    out[f"{key}_error"] = errors
+
+
+def read_table(path) -> pd.DataFrame:
+    path = Path(path)
+    if path.suffix.lower() in (".parquet", ".pq"):
+        return pd.read_parquet(path)
+    # Read everything as text: option labels such as NI-RADS "1" must stay strings,
+    # numeric fields are parsed by the classifier. Only an empty cell is missing:
+    # "None" and "N/A" are option labels (Hunt-Hess, Bosniak), not NaN.
+    return pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[""])
+
+
+def write_table(df: pd.DataFrame, path) -> None:
+    path = Path(path)
+    if path.suffix.lower() in (".parquet", ".pq"):
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
@@ -0,0 +1,59 @@
+"""Sorted breakpoint tables for the numeric thresholds of the classifiers."""
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+
+
+class Breakpoints:
+    """Cut-points splitting a numeric axis into bins, resolved by binary search.
+
+    Each cut is `(value, op)` where `op` is the comparison that keeps a
+    measurement below it: `(6, "<")` puts 6 in the upper bin, `(6, "<=")`
+    keeps it in the lower one. `values` optionally gives the outcome of
+    each bin, lowest first.
+
+        >>> size = Breakpoints([(3, "<"), (6, "<=")], values=(1, 2, 3))
+        >>> [size(x) for x in (2.9, 3, 6, 6.1)]
+        [1, 2, 2, 3]
+    """
+
+    def __init__(self, cuts, values=None):
+        self.cuts = tuple((v, op) for v, op in cuts)
+        if any(op not in ("<", "<=") for _, op in self.cuts):
+            raise ValueError("cut operators must be '<' or '<='")
+        self.edges = tuple(float(v) if op == "<" else math.nextafter(float(v), math.inf)
+                           for v, op in self.cuts)
+        if any(a >= b for a, b in zip(self.edges, self.edges[1:])):
+            raise ValueError(f"cut-points must be strictly increasing: {self.cuts}")
+        if values is not None and len(values) != len(self.cuts) + 1:
+            raise ValueError(f"expected {len(self.cuts) + 1} bin values, got {len(values)}")
+        self.values = tuple(values) if values is not None else None
+
+    def __len__(self):
+        return len(self.cuts) + 1
+
+    def __repr__(self):
+        return f"Breakpoints({list(self.cuts)!r}, values={self.values!r})"
+
+    def bin(self, x) -> int:
+        return bisect_right(self.edges, x)
+
+    def __call__(self, x):
+        return self.values[self.bin(x)]
+
+    def bins(self, xs):
+        """Bin index of every element of `xs` (one `searchsorted` call)."""
+        import numpy as np
+        return np.searchsorted(np.asarray(self.edges), np.asarray(xs, dtype=float), side="right")
+
+    def take(self, xs):
+        """`values` of every element of `xs`, as an array."""
+        import numpy as np
+        values = np.array(self.values, dtype=object if any(isinstance(v, str) for v in self.values) else None)
+        return values[self.bins(xs)]
+
+    def representatives(self) -> tuple:
+        """One measurement inside each bin, lowest first."""
+        first, op = self.cuts[0]
+        return (first - 1 if op == "<" else first,) + self.edges
@@ -0,0 +1,74 @@
+"""Bounded LRU cache of classifier results, shared by every caller in the process.
+
+Readers toggle between the same few input combinations and batch inputs
+repeat heavily, so `classify` keeps the most recently used results keyed
+on `(system, inputs)`. A hit skips validation and scoring altogether.
+Only successful results are cached; invalid inputs raise every time.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+DEFAULT_MAXSIZE = 4096
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class ResultCache:
+    """Thread-safe LRU mapping; Streamlit sessions share it from several threads."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key):
+        """The cached value for `key` (now most recently used), or None."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self._data), self.maxsize)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+RESULTS = ResultCache()
+
+
+def cache_info() -> CacheInfo:
+    """Hit/miss/eviction counters of the shared result cache."""
+    return RESULTS.info()
+
+
+def cache_clear() -> None:
+    RESULTS.clear()
@@ -0,0 +1,165 @@
+"""Rule coverage: run every classifier over its whole input space.
+
+Each system is evaluated on every combination of its options, with one
+representative value per breakpoint bin for numeric fields (a full
+integer grid for bounded numeric fields without breakpoints). The report
+gives, per system:
+
+* how many combinations end in each output category;
+* unreachable branches - lines of the Python rules that never run, or
+  rules of a rule file (see `radcalc.rules`) that never match first;
+* overlaps - branches of an `if/elif` chain (or rules) whose condition
+  also holds for combinations an earlier branch already took.
+
+`python -m radcalc coverage` prints the report and exits with status 1
+when a branch is unreachable, so it can gate rule changes.
+"""
+from __future__ import annotations
+
+import ast
+import dis
+import inspect
+import itertools
+import linecache
+import sys
+import textwrap
+from collections import Counter
+from typing import NamedTuple
+
+from .engine import ClassificationError, get
+
+
+class Coverage(NamedTuple):
+    system: str
+    combinations: int
+    outputs: dict  # output category -> number of combinations
+    unreachable: list  # descriptions of branches that never run
+    overlaps: list  # descriptions of branches shadowed by earlier ones
+
+
+def axis_values(field) -> tuple:
+    """Values enumerated for one field."""
+    if field.options:
+        return field.options
+    if field.breakpoints is not None:
+        return field.breakpoints.representatives()
+    if field.max_value is None:
+        raise ClassificationError(f"{field.name}: unbounded numeric input cannot be enumerated")
+    step = field.step or 1
+    return tuple(range(int(field.min_value or 0), int(field.max_value) + 1, int(step)))
+
+
+def combinations(classifier):
+    """Yield every input combination of `classifier` as a dict."""
+    names = classifier.field_names
+    for combo in itertools.product(*(axis_values(f) for f in classifier.fields)):
+        yield dict(zip(names, combo))
+
+
+def _describe(filename, line):
+    return f"line {line}: {linecache.getline(filename, line).strip()}"
+
+
+class _Chain(NamedTuple):
+    first_line: int
+    branches: tuple  # (line, compiled test or None for the final else)
+
+
+def _chains(func):
+    """The `if/elif` chains in the body of `func`, with absolute line numbers."""
+    lines, start = inspect.getsourcelines(func)
+    tree = ast.parse(textwrap.dedent("".join(lines)))
+    filename = func.__code__.co_filename
+    chains = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.If) or getattr(node, "_in_chain", False):
+            continue
+        branches = []
+        while True:
+            test = ast.Expression(node.test)
+            branches.append((start + node.test.lineno - 1, compile(test, filename, "eval")))
+            if len(node.orelse) == 1 and isinstance(node.orelse[0], ast.If):
+                node = node.orelse[0]
+                node._in_chain = True
+                continue
+            if node.orelse:
+                branches.append((start + node.orelse[0].lineno - 1, None))
+            break
+        chains.append(_Chain(branches[0][0], tuple(branches)))
+    return chains
+
+
+def _shadowed(branches, matched, describe):
+    """Overlap descriptions from per-combination lists of matching branch indexes."""
+    shadowed = Counter()
+    for hits in matched:
+        for later in hits[1:]:
+            shadowed[(hits[0], later)] += 1
+    return [f"{describe(branches[later])} also holds for {n} combination(s) taken by {describe(branches[first])}"
+            for (first, later), n in sorted(shadowed.items(), key=lambda item: (item[0][1], item[0][0]))]
+
+
+def _python_coverage(classifier, combos):
+    func = classifier.func
+    code = func.__code__
+    chains = {chain.first_line: chain for chain in _chains(func)}
+    executed = set()
+    snapshots = {line: [] for line in chains}  # locals when each chain is reached
+
+    def local_trace(frame, event, arg):
+        if event == "line":
+            executed.add(frame.f_lineno)
+            if frame.f_lineno in snapshots:
+                snapshots[frame.f_lineno].append(dict(frame.f_locals))
+        return local_trace
+
+    def global_trace(frame, event, arg):
+        return local_trace if frame.f_code is code else None
+
+    results = []
+    previous = sys.gettrace()
+    sys.settrace(global_trace)
+    try:
+        for values in combos:
+            results.append(func(**values))
+    finally:
+        sys.settrace(previous)
+
+    executable = {line for _, line in dis.findlinestarts(code) if line and line != code.co_firstlineno}
+    unreachable = [_describe(code.co_filename, line) for line in sorted(executable - executed)]
+    overlaps = []
+    for line, chain in chains.items():
+        tests = [(n, test) for n, test in chain.branches if test is not None]
+        matched = [[i for i, (_, test) in enumerate(tests) if eval(test, func.__globals__, scope)]
+                   for scope in snapshots[line]]
+        overlaps += _shadowed(tests, matched, lambda branch: _describe(code.co_filename, branch[0]))
+    return results, unreachable, overlaps
+
+
+def _rule_coverage(classifier, combos):
+    rules = classifier.func.rules
+    binned = [(f.name, f.breakpoints.bin) for f in classifier.fields if f.numeric]
+    results, matched = [], []
+    for values in combos:
+        results.append(classifier.func(**values))
+        for name, bin_of in binned:
+            values[name] = bin_of(values[name])
+        matched.append([i for i, (when, _) in enumerate(rules)
+                        if all(values[name] in allowed for name, allowed in when)])
+    first = {hits[0] for hits in matched}
+    unreachable = [f"rule {i} ({result.grade!r}) never matches first"
+                   for i, (_, result) in enumerate(rules) if i not in first]
+    # A rule without conditions is the fallback and overlaps everything by design.
+    conditional = [[i for i in hits if rules[i][0]] for hits in matched]
+    overlaps = _shadowed(list(range(len(rules))), conditional, lambda i: f"rule {i}")
+    return results, unreachable, overlaps
+
+
+def coverage(system: str) -> Coverage:
+    """Evaluate `system` on its whole input space."""
+    classifier = get(system)
+    combos = list(combinations(classifier))
+    analyse = _python_coverage if classifier.source is None else _rule_coverage
+    results, unreachable, overlaps = analyse(classifier, combos)
+    outputs = Counter(str(r.grade) for r in results)
+    return Coverage(system, len(combos), dict(outputs), unreachable, overlaps)
@@ -0,0 +1,87 @@
+"""Reduced decision DAGs compiled from the lookup tables.
+
+The `if/elif` chains of the classifiers re-test the same inputs in every
+branch. Once a system is tabulated (see `radcalc.tables`) the chain can be
+rewritten as a decision diagram that tests the fields in order, each at
+most once, and skips a field whenever every choice leads to the same
+place. Identical subtrees are built once and shared, so the diagram is
+the minimal one for that field order.
+
+    >>> from radcalc import get
+    >>> root = get("lung_rads").dag
+    >>> root.field.name, len(root.children)   # nodule_type never changes the category
+    ('nodule_size', 3)
+"""
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class Leaf(NamedTuple):
+    result: object
+
+
+class Node(NamedTuple):
+    field: object  # the `Field` tested here
+    children: tuple  # one subtree per option (categorical) or bin (numeric), in order
+
+
+def build(classifier):
+    """Minimal decision DAG of `classifier`'s lookup table (None without a table)."""
+    table = classifier.table
+    if table is None:
+        return None
+    unique: dict = {}
+
+    def intern(node):
+        return unique.setdefault(node, node)
+
+    def subtree(level, start):
+        if level == len(table.shape):
+            return intern(Leaf(table.results[start]))
+        stride = table.strides[level]
+        children = tuple(subtree(level + 1, start + i * stride) for i in range(table.shape[level]))
+        if all(child is children[0] for child in children):
+            return children[0]  # the field makes no difference here
+        return intern(Node(classifier.fields[level], children))
+
+    return subtree(0, 0)
+
+
+def nodes(root) -> list:
+    """Every distinct node and leaf reachable from `root`."""
+    seen, stack = {}, [root]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen[id(node)] = node
+        if isinstance(node, Node):
+            stack.extend(node.children)
+    return list(seen.values())
+
+
+def tested_fields(root) -> set:
+    """Names of the fields that can change the result."""
+    return {n.field.name for n in nodes(root) if isinstance(n, Node)}
+
+
+def paths(root):
+    """Yield `(conditions, result)` for every root-to-leaf path.
+
+    `conditions` maps each tested field to the options (or bin numbers)
+    leading down the path; branches reaching the same child are merged, so
+    the paths are mutually exclusive and cover every input combination.
+    """
+    if isinstance(root, Leaf):
+        yield {}, root.result
+        return
+    f = root.field
+    labels = range(len(f.breakpoints)) if f.numeric else f.options
+    grouped: dict = {}
+    for label, child in zip(labels, root.children):
+        grouped.setdefault(id(child), (child, []))[1].append(label)
+    for child, wanted in grouped.values():
+        for conditions, result in paths(child):
+            yield {f.name: wanted, **conditions}, result
+
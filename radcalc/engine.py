@@ -0,0 +1,242 @@
+"""Classifier registry: field specs, results and the `classify` entry point."""
+from __future__ import annotations
+
+import math
+from functools import cached_property
+from time import perf_counter
+from typing import Any, Callable, NamedTuple
+
+from . import audit, metrics
+from .cache import RESULTS
+
+# Sidebar categories, in the order the app shows them.
+NEURO = "NEURO (BRAIN & SPINE)"
+HEAD_NECK = "HEAD & NECK"
+CARDIOTHORACIC = "CARDIOTHORACIC"
+ABDOMINOPELVIC = "ABDOMINOPELVIC"
+MSK = "MUSCULOSKELETAL (MSK)"
+VASCULAR = "INTERVENTIONAL RADIOLOGY/VASCULAR"
+RADS = "-RADS SYSTEMS"
+CATEGORIES = (NEURO, HEAD_NECK, CARDIOTHORACIC, ABDOMINOPELVIC, MSK, VASCULAR, RADS)
+
+YES_NO = ("No", "Yes")
+
+
+class ClassificationError(ValueError):
+    """Raised for an unknown system or an input outside a field's allowed values."""
+
+
+class Result(NamedTuple):
+    grade: Any
+    interpretation: str = ""
+    next_steps: str = ""
+    score: Any = None
+
+
+class Field(NamedTuple):
+    """One classifier input; categorical when `options` is set, numeric otherwise.
+
+    `value` is the widget's initial value; `default` fills the input when a
+    caller leaves it out (only set for inputs the UI shows conditionally).
+    An integer `step` makes a numeric field take whole numbers only (counts).
+    `breakpoints` holds a numeric field's thresholds (see `radcalc.bins`).
+    """
+
+    name: str
+    label: str
+    options: tuple = ()
+    widget: str = "radio"
+    min_value: float | None = None
+    max_value: float | None = None
+    value: Any = None
+    step: Any = None
+    default: Any = None
+    breakpoints: Any = None
+
+    @property
+    def numeric(self) -> bool:
+        return not self.options
+
+    @property
+    def choices(self) -> tuple:
+        """Options offered by the widget (a conditional field's default is implied)."""
+        return tuple(o for o in self.options if o != self.default)
+
+    def validate(self, value):
+        if self.options:
+            if value not in self.options and isinstance(value, (int, float)) and not isinstance(value, bool):
+                # Numeric cells for numeric-looking labels (NI-RADS "1", TICI "3"). NaN, ±inf
+                # (JSON `NaN`) and huge integers fall through to the error below.
+                if (isinstance(value, int) or math.isfinite(value)) and abs(value) < 1e9 and value == int(value):
+                    if str(int(value)) in self.options:
+                        return str(int(value))
+            if value not in self.options:
+                raise ClassificationError(
+                    f"{self.name}: {value!r} is not one of {list(self.options)}")
+            return value
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            raise ClassificationError(f"{self.name}: {value!r} is not a number") from None
+        except OverflowError:  # an integer beyond float range, e.g. from JSON
+            raise ClassificationError(f"{self.name}: value is out of range") from None
+        if number != number:
+            raise ClassificationError(f"{self.name}: value is missing")
+        if not math.isfinite(number):
+            raise ClassificationError(f"{self.name}: {value!r} is not a finite number")
+        if self.min_value is not None and number < self.min_value:
+            raise ClassificationError(f"{self.name}: {value!r} is below {self.min_value}")
+        if self.max_value is not None and number > self.max_value:
+            raise ClassificationError(f"{self.name}: {value!r} is above {self.max_value}")
+        if isinstance(self.step, int) and number != int(number):
+            raise ClassificationError(f"{self.name}: {value!r} is not a whole number")
+        return number
+
+
+def choice(name, label, options, widget="radio", default=None):
+    return Field(name, label, tuple(options), widget=widget, default=default)
+
+
+def number(name, label, min_value=0, max_value=None, value=0, step=None, widget="number", breakpoints=None):
+    return Field(name, label, (), widget=widget, min_value=min_value,
+                 max_value=max_value, value=value, step=step, breakpoints=breakpoints)
+
+
+class Classifier:
+    # A plain class rather than a dataclass: `dataclasses` imports `inspect`,
+    # which would double the import time of the package.
+    def __init__(self, key: str, name: str, category: str, fields: tuple, func: Callable[..., Result],
+                 source: str | None = None):
+        self.key = key
+        self.name = name
+        self.category = category
+        self.fields = fields
+        self.func = func
+        self.source = source  # rule file a declarative classifier was loaded from
+        self.field_map = {f.name: f for f in fields}
+
+    def __repr__(self):
+        return f"Classifier({self.key!r}, {self.name!r}, {self.category!r}, fields={self.field_names})"
+
+    @property
+    def field_names(self) -> tuple:
+        return tuple(f.name for f in self.fields)
+
+    def normalize(self, inputs: dict) -> dict:
+        """Validate `inputs`; fields left out fall back to their default."""
+        unknown = set(inputs) - set(self.field_map)
+        if unknown:
+            raise ClassificationError(f"{self.key}: unknown input(s) {sorted(unknown)}")
+        values = {}
+        for f in self.fields:
+            if f.name in inputs:
+                values[f.name] = f.validate(inputs[f.name])
+            elif f.default is not None:
+                values[f.name] = f.validate(f.default)
+            else:
+                raise ClassificationError(f"{self.key}: missing input {f.name!r}")
+        return values
+
+    @cached_property
+    def table(self):
+        """`LookupTable` over every input combination (numeric fields by breakpoint bin).
+
+        None when a numeric field has no breakpoints, i.e. the result is not
+        a function of a finite set of bins.
+        """
+        if any(f.numeric and f.breakpoints is None for f in self.fields):
+            return None
+        from .tables import LookupTable
+        return LookupTable(self)
+
+    @cached_property
+    def dag(self):
+        """Minimal decision DAG of the table (see `radcalc.dag`); None without a table."""
+        from .dag import build
+        return build(self)
+
+    def __call__(self, **inputs) -> Result:
+        table = self.table
+        if table is not None:
+            return table.lookup(inputs)
+        return self.func(**self.normalize(inputs))
+
+
+SYSTEMS: dict[str, Classifier] = {}
+
+
+def register(key, name, category, fields):
+    """Decorator adding a scoring function to `SYSTEMS` under `key`."""
+
+    def wrap(func):
+        if key in SYSTEMS:
+            raise ValueError(f"classifier {key!r} registered twice")
+        SYSTEMS[key] = Classifier(key, name, category, tuple(fields), func)
+        return func
+
+    return wrap
+
+
+def get(key: str) -> Classifier:
+    try:
+        return SYSTEMS[key]
+    except KeyError:
+        raise ClassificationError(f"unknown classification system {key!r}") from None
+
+
+def field_columns(system: str, columns) -> dict | None:
+    """Map each field of `system` to the column (or record key) feeding it.
+
+    A `<system>.<field>` name wins over the bare field name; returns None
+    when a required field has no column.
+    """
+    columns = set(columns)
+    mapping = {}
+    for f in get(system).fields:
+        for name in (f"{system}.{f.name}", f.name):
+            if name in columns:
+                mapping[f.name] = name
+                break
+        else:
+            if f.default is None:
+                return None
+    return mapping
+
+
+def applicable_systems(columns) -> list:
+    """Systems whose required fields are all present in `columns`."""
+    columns = set(columns)
+    return [key for key in SYSTEMS if field_columns(key, columns) is not None]
+
+
+def classify(key: str, **inputs) -> Result:
+    """Score one case: `classify("ti_rads", composition="Solid", ...)`.
+
+    Results go through the shared LRU in `radcalc.cache`, keyed on the
+    inputs as given so that a hit skips validation too. The key includes
+    each value's type: `True`, `1` and `1.0` hash alike but do not all
+    validate. Every call is counted in `radcalc.metrics` and, when
+    enabled, recorded in `radcalc.audit`.
+    """
+    classifier = get(key)  # unknown systems raise before they become a metric label
+    started = perf_counter()
+    try:
+        cache_key = (key, tuple(sorted(zip(inputs, map(type, inputs.values()), inputs.values()))))
+        hash(cache_key)
+    except TypeError:  # unhashable input value: score it uncached
+        cache_key = None
+    result = None if cache_key is None else RESULTS.get(cache_key)
+    if result is None:
+        try:
+            result = classifier(**inputs)
+        except ClassificationError as exc:
+            metrics.observe_error(key)
+            if audit.LOG is not None:
+                audit.LOG.record(key, inputs, error=str(exc))
+            raise
+        if cache_key is not None:
+            RESULTS.put(cache_key, result)
+    metrics.observe_call(key, str(result.grade), perf_counter() - started)
+    if audit.LOG is not None:
+        audit.LOG.record(key, inputs, result)
+    return result
@@ -0,0 +1,236 @@
+"""Scoring counters and latency histograms in the Prometheus text format.
+
+    radcalc_calls_total{system,path}         cases scored (path: scalar, batch)
+    radcalc_results_total{system,grade}      cases per output category
+    radcalc_errors_total{system,path}        cases rejected as invalid input
+    radcalc_classify_seconds{system}         latency of one `classify` call
+    radcalc_batch_seconds{system}            time to score one system over a table chunk
+    radcalc_http_requests_total{route,status}, radcalc_http_request_seconds{route}
+    radcalc_cache_*                          the shared result cache (see radcalc.cache)
+
+The service exposes `render()` at `GET /metrics`; batch runs write it to
+a file with `python -m radcalc score ... --metrics-file PATH` (the
+textfile collector format, replaced atomically). Updates are a dict
+increment under a lock; a `classify` call takes the lock once.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from bisect import bisect_left
+
+from .cache import cache_info
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=()) -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)] + list(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help, labels=()):
+        self.name, self.help, self.labels = name, help, tuple(labels)
+        self._values: dict = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for labels, value in sorted(values.items()):
+            yield f"{self.name}{_labels(self.labels, labels)} {_number(value)}"
+
+    def take(self) -> dict:
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+    def merge(self, values: dict) -> None:
+        for labels, value in values.items():
+            self.inc(*labels, amount=value)
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=()):
+        self.name, self.help, self.labels = name, help, tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._values: dict = {}  # labels -> [count per bucket (last is +Inf)..., sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels) -> None:
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(labels)
+            if counts is None:
+                counts = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            counts[i] += 1
+            counts[-1] += value
+
+    def samples(self):
+        with self._lock:
+            values = {labels: list(counts) for labels, counts in self._values.items()}
+        for labels, counts in sorted(values.items()):
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = f'le="{_number(float(bound))}"'
+                yield f"{self.name}_bucket{_labels(self.labels, labels, [le])} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labels, labels)} {_number(counts[-1])}"
+            yield f"{self.name}_count{_labels(self.labels, labels)} {cumulative}"
+
+    def take(self) -> dict:
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+    def merge(self, values: dict) -> None:
+        with self._lock:
+            for labels, counts in values.items():
+                mine = self._values.get(labels)
+                if mine is None:
+                    self._values[labels] = list(counts)
+                else:
+                    for i, n in enumerate(counts):
+                        mine[i] += n
+
+
+SCALAR_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 1e-3, 1e-2)
+BATCH_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+HTTP_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+CALLS = Counter("radcalc_calls_total", "Cases scored.", ("system", "path"))
+RESULTS = Counter("radcalc_results_total", "Scored cases per output category.", ("system", "grade"))
+ERRORS = Counter("radcalc_errors_total", "Cases rejected as invalid input.", ("system", "path"))
+CLASSIFY_SECONDS = Histogram("radcalc_classify_seconds", "Latency of one classify call.", ("system",),
+                             SCALAR_BUCKETS)
+BATCH_SECONDS = Histogram("radcalc_batch_seconds", "Time to score one system over a table chunk.",
+                          ("system",), BATCH_BUCKETS)
+HTTP_REQUESTS = Counter("radcalc_http_requests_total", "HTTP requests handled.", ("route", "status"))
+HTTP_SECONDS = Histogram("radcalc_http_request_seconds", "HTTP request handling time.", ("route",),
+                         HTTP_BUCKETS)
+
+METRICS = (CALLS, RESULTS, ERRORS, CLASSIFY_SECONDS, BATCH_SECONDS, HTTP_REQUESTS, HTTP_SECONDS)
+
+
+class _Calls:
+    """Successful `classify` calls, recorded under one lock per call.
+
+    They are folded into CALLS, RESULTS and CLASSIFY_SECONDS whenever the
+    metrics are read, which keeps a cache hit from paying for three updates.
+    """
+
+    def __init__(self):
+        self._pending: dict = {}  # (system, grade) -> histogram counts, as in `Histogram`
+        self._lock = threading.Lock()
+
+    def observe(self, system, grade, seconds) -> None:
+        i = bisect_left(SCALAR_BUCKETS, seconds)
+        # acquire/release rather than `with`: measurably cheaper on a cache hit.
+        self._lock.acquire()
+        try:
+            counts = self._pending.get((system, grade))
+            if counts is None:
+                counts = self._pending[(system, grade)] = [0] * (len(SCALAR_BUCKETS) + 1) + [0.0]
+            counts[i] += 1
+            counts[-1] += seconds
+        finally:
+            self._lock.release()
+
+    def fold(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for (system, grade), counts in pending.items():
+            n = sum(counts[:-1])
+            CALLS.inc(system, "scalar", amount=n)
+            RESULTS.inc(system, grade, amount=n)
+            CLASSIFY_SECONDS.merge({(system,): counts})
+
+
+_CALLS = _Calls()
+observe_call = _CALLS.observe
+
+
+def observe_error(system, path="scalar") -> None:
+    CALLS.inc(system, path)
+    ERRORS.inc(system, path)
+
+
+def observe_frame(system, grades, errors, seconds) -> None:
+    """Record one system scored over a table chunk (`grades` and `errors` are pandas Series)."""
+    invalid = int((errors != "").sum())
+    CALLS.inc(system, "batch", amount=len(grades))
+    if invalid:
+        ERRORS.inc(system, "batch", amount=invalid)
+    for grade, n in grades.value_counts(dropna=True).items():
+        RESULTS.inc(system, str(grade), amount=int(n))
+    BATCH_SECONDS.observe(seconds, system)
+
+
+def _cache_lines():
+    info = cache_info()
+    for name, kind, value, help in (
+            ("radcalc_cache_hits_total", "counter", info.hits, "Result cache hits."),
+            ("radcalc_cache_misses_total", "counter", info.misses, "Result cache misses."),
+            ("radcalc_cache_evictions_total", "counter", info.evictions, "Result cache evictions."),
+            ("radcalc_cache_entries", "gauge", info.size, "Results currently cached.")):
+        yield f"# HELP {name} {help}"
+        yield f"# TYPE {name} {kind}"
+        yield f"{name} {value}"
+
+
+def render() -> str:
+    """Every metric in the Prometheus text exposition format."""
+    _CALLS.fold()
+    lines = []
+    for metric in METRICS:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.samples())
+    lines.extend(_cache_lines())
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path) -> None:
+    """Write `render()` to `path`, replacing it atomically so a scraper never sees half a file."""
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".radcalc-metrics-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as out:
+            out.write(render())
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def take() -> list:
+    """Counts recorded since the last `take`, reset; worker processes hand these to the parent."""
+    _CALLS.fold()
+    return [metric.take() for metric in METRICS]
+
+
+def merge(taken: list) -> None:
+    for metric, values in zip(METRICS, taken):
+        metric.merge(values)
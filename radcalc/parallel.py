@@ -0,0 +1,184 @@
+"""Sharded batch scoring across a process pool.
+
+The input is read in chunks of `chunk_size` rows (lines for JSONL),
+each chunk is scored in a worker process, and results are written in
+input order as soon as the chunk at the head of the queue is done. At
+most `2 * workers` chunks are in flight, so memory stays bounded by the
+chunk size rather than the file size. Scoring metrics and audit records
+made in the workers are handed back to the parent process.
+"""
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from . import audit, metrics
+from .engine import SYSTEMS
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+def default_workers() -> int:
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+
+def _is_parquet(path) -> bool:
+    return Path(path).suffix.lower() in (".parquet", ".pq")
+
+
+def iter_table_chunks(path, chunk_size):
+    import pandas as pd
+
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[""],
+                               chunksize=chunk_size)
+
+
+def iter_line_chunks(lines, chunk_size):
+    lines = iter(lines)
+    while chunk := list(islice(lines, chunk_size)):
+        yield chunk
+
+
+def _score_table_chunk(df, systems):
+    from .batch import score_frame
+    return score_frame(df, systems)
+
+
+def _score_line_chunk(lines, systems, id_field):
+    import json
+    from .stream import score_stream
+    return [json.dumps(r, ensure_ascii=False) for r in score_stream(lines, systems, id_field)]
+
+
+def _in_worker(func, chunk, *args):
+    """Run `func` in a worker process and hand back the metrics and audit records it made."""
+    result = func(chunk, *args)
+    return result, metrics.take(), audit.take()
+
+
+def _collect(future):
+    result, taken, records = future.result()
+    metrics.merge(taken)
+    audit.extend(records)
+    return result
+
+
+def ordered_map(func, chunks, *args, workers=1):
+    """Yield `func(chunk, *args)` for every chunk, in order, using `workers` processes."""
+    if workers <= 1:
+        for chunk in chunks:
+            yield func(chunk, *args)
+        return
+    # Forked workers start with a copy of the parent's counts: drop them.
+    with ProcessPoolExecutor(max_workers=workers, initializer=metrics.take) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_in_worker, func, chunk, *args))
+            if len(pending) >= 2 * workers:
+                yield _collect(pending.popleft())
+        while pending:
+            yield _collect(pending.popleft())
+
+
+def _output_column(column):
+    """`(system, suffix)` for a column added by `score_frame`, else None."""
+    system, _, suffix = column.rpartition("_")
+    return (system, suffix) if system in SYSTEMS and suffix in ("grade", "score", "error") else None
+
+
+class _TableWriter:
+    """Appends scored chunks to a CSV or Parquet file.
+
+    The Parquet schema comes from the column types, not the first chunk:
+    a chunk whose grades are all missing must not type the column as null.
+    Input columns keep the source file's types (text for CSV); grades and
+    errors are strings, scores nullable int64.
+    """
+
+    def __init__(self, path, source=None):
+        self.path = path
+        self.source = source
+        self.parquet = _is_parquet(path)
+        self.writer = None
+        self.first = True
+
+    def _schema(self, columns):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        source = pq.ParquetFile(self.source).schema_arrow if self.source and _is_parquet(self.source) else None
+        fields = []
+        for column in columns:
+            added = _output_column(column)
+            if added is not None:
+                kind = pa.int64() if added[1] == "score" else pa.string()
+            elif source is not None and column in source.names:
+                kind = source.field(column).type
+            else:
+                kind = pa.string()
+            fields.append(pa.field(column, kind))
+        return pa.schema(fields)
+
+    def write(self, df):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if self.writer is None:
+                self.writer = pq.ParquetWriter(self.path, self._schema(df.columns))
+            df = df.copy(deep=False)
+            for column in df.columns:
+                if (_output_column(column) or (None, ""))[1] == "grade":  # some systems grade with ints
+                    df[column] = [None if g is None or g != g else str(g) for g in df[column].tolist()]
+            table = pa.Table.from_pandas(df, schema=self.writer.schema, preserve_index=False)
+            self.writer.write_table(table)
+        else:
+            df.to_csv(self.path, mode="w" if self.first else "a", header=self.first, index=False)
+        self.first = False
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def score_file(input_path, output_path, systems=None, workers=1, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+    """Score a CSV/Parquet file chunk by chunk; returns `(rows, invalid_cells)`.
+
+    `progress`, if given, is called with the number of rows written so far
+    after every chunk.
+    """
+    rows = invalid = 0
+    writer = _TableWriter(output_path, input_path)
+    try:
+        chunks = iter_table_chunks(input_path, chunk_size)
+        for scored in ordered_map(_score_table_chunk, chunks, systems, workers=workers):
+            writer.write(scored)
+            rows += len(scored)
+            invalid += sum(int((scored[c] != "").sum()) for c in scored.columns
+                           if (_output_column(c) or (None, ""))[1] == "error")
+            if progress is not None:
+                progress(rows)
+    finally:
+        writer.close()
+    return rows, invalid
+
+
+def score_lines(lines, out, systems=None, id_field="id", workers=1, chunk_size=DEFAULT_CHUNK_SIZE) -> int:
+    """JSONL counterpart of `score_file`: writes result lines to `out`, returns the count."""
+    count = 0
+    chunks = iter_line_chunks(lines, chunk_size)
+    for results in ordered_map(_score_line_chunk, chunks, systems, id_field, workers=workers):
+        for line in results:
+            out.write(line)
+            out.write("\n")
+        count += len(results)
+    return count
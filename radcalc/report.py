@@ -0,0 +1,58 @@
+"""Study-level report: several classifiers over one findings record.
+
+Findings use the batch/stream column names (`depth`, `tlics.neuro`, ...).
+The report knows which systems read each finding, so `update` rescores
+only the systems whose inputs changed:
+
+    >>> report = Report(["aast_spleen", "tscherne"])
+    >>> report.update(area="<10%", depth="<1 cm", vascular="No", tscherne_grade="C1")
+    ('aast_spleen', 'tscherne')
+    >>> report.update(depth=">3 cm")
+    ('aast_spleen',)
+    >>> report.results["aast_spleen"].grade
+    'III or higher'
+"""
+from __future__ import annotations
+
+from .engine import ClassificationError, Result, classify, field_columns, get
+
+
+class Report:
+    def __init__(self, systems):
+        self.systems = tuple(systems)
+        # finding name -> systems that read it (the dependency graph)
+        self.consumers: dict[str, set] = {}
+        for key in self.systems:
+            for f in get(key).fields:
+                for name in (f"{key}.{f.name}", f.name):
+                    self.consumers.setdefault(name, set()).add(key)
+        self.findings: dict = {}
+        self.results: dict[str, Result | ClassificationError] = {}
+
+    def update(self, **findings) -> tuple:
+        """Merge `findings` (None clears one) and rescore the systems reading a changed one.
+
+        Returns the keys of the rescored systems, in report order.
+        """
+        changed = set()
+        for name, value in findings.items():
+            if value is None:
+                if self.findings.pop(name, None) is not None:
+                    changed.add(name)
+            elif name not in self.findings or self.findings[name] != value:
+                self.findings[name] = value
+                changed.add(name)
+        stale = set().union(*(self.consumers.get(name, ()) for name in changed))
+        rescored = tuple(key for key in self.systems if key in stale or key not in self.results)
+        for key in rescored:
+            self.results[key] = self._score(key)
+        return rescored
+
+    def _score(self, key):
+        mapping = field_columns(key, self.findings)
+        if mapping is None:
+            return ClassificationError(f"{key}: missing findings for {list(get(key).field_names)}")
+        try:
+            return classify(key, **{name: self.findings[column] for name, column in mapping.items()})
+        except ClassificationError as exc:
+            return exc
@@ -0,0 +1,225 @@
+"""Declarative classifiers: JSON rule files compiled into lookup tables.
+
+A rule file holds one system, or a list of them:
+
+    {
+      "key": "li_rads", "name": "LI-RADS (Liver)", "category": "-RADS SYSTEMS",
+      "fields": [
+        {"name": "aphe", "label": "Is arterial phase hyperenhancement present?", "options": ["No", "Yes"]},
+        {"name": "size", "label": "Lesion size (mm)", "value": 8, "breakpoints": [[10, "<"]]}
+      ],
+      "rules": [
+        {"when": {"aphe": "Yes", "size": 1}, "grade": "LR-4", "next_steps": "..."},
+        {"when": {"aphe": "Yes"}, "grade": "LR-3"},
+        {"grade": "LR-2"}
+      ]
+    }
+
+Rules are tried in order and the first whose `when` matches gives the
+result; a rule without `when` matches everything. An integer `score` is
+optional, but if one rule has it every rule must. A condition names one
+option or a list of them; for a numeric field it names bins of the
+field's `breakpoints` (0 is the bin below the first cut). Numeric fields
+therefore need breakpoints, and each system is compiled into its
+`LookupTable` when loaded, so scoring never goes back to the rules.
+
+Files named in the `RADCALC_RULES` environment variable (JSON files or
+directories of them, separated by `os.pathsep`) are loaded when `radcalc`
+is imported. A file may add a system or replace a built-in one; a
+replacement keeps the built-in's field names, options and defaults, which
+the calculator pages rely on, and may change labels, thresholds and
+results. `python -m radcalc rules export <system>` writes a built-in
+system in this format as a starting point.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+from .bins import Breakpoints
+from .cache import RESULTS
+from .dag import paths
+from .engine import CATEGORIES, SYSTEMS, ClassificationError, Classifier, Result, choice, get, number
+
+RULES_ENV = "RADCALC_RULES"
+SYSTEM_KEYS = {"key", "name", "category", "fields", "rules"}
+RESULT_KEYS = ("grade", "interpretation", "next_steps", "score")
+
+
+def _field(spec: dict, where: str):
+    if not isinstance(spec, dict):
+        raise ClassificationError(f"{where}: field {spec!r} must be a JSON object")
+    spec = dict(spec)
+    try:
+        if spec.get("options"):
+            spec["options"] = tuple(spec["options"])
+            return choice(**spec)
+        cuts = spec.pop("breakpoints", None)
+        if not cuts:
+            raise ClassificationError(f"{where}: numeric field {spec.get('name')!r} needs breakpoints")
+        spec.pop("options", None)
+        return number(**spec, breakpoints=Breakpoints(cuts))
+    except ClassificationError:
+        raise
+    except (TypeError, ValueError) as exc:
+        raise ClassificationError(f"{where}: field {spec.get('name')!r}: {exc}") from None
+
+
+def _condition(field, wanted, where: str):
+    wanted = wanted if isinstance(wanted, list) else [wanted]
+    allowed = range(len(field.breakpoints)) if field.numeric else field.options
+    bad = [w for w in wanted if w not in allowed or isinstance(w, bool)]
+    if bad:
+        kind = "bin(s)" if field.numeric else "option(s)"
+        raise ClassificationError(f"{where}: {field.name}: unknown {kind} {bad}")
+    return field.name, frozenset(wanted)
+
+
+def _rule(rule: dict, field_map: dict, where: str):
+    if not isinstance(rule, dict):
+        raise ClassificationError(f"{where}: a rule must be a JSON object, got {rule!r}")
+    unknown = set(rule) - {"when", *RESULT_KEYS}
+    if unknown:
+        raise ClassificationError(f"{where}: unknown rule key(s) {sorted(unknown)}")
+    if "grade" not in rule:
+        raise ClassificationError(f"{where}: rule has no grade")
+    score = rule.get("score")
+    if score is not None and (not isinstance(score, int) or isinstance(score, bool)):
+        raise ClassificationError(f"{where}: score must be an integer, got {score!r}")
+    conditions = rule.get("when", {})
+    if not isinstance(conditions, dict):
+        raise ClassificationError(f"{where}: when must map field names to options or bins, got {conditions!r}")
+    when = []
+    for name, wanted in conditions.items():
+        if name not in field_map:
+            raise ClassificationError(f"{where}: condition on unknown field {name!r}")
+        when.append(_condition(field_map[name], wanted, where))
+    return tuple(when), Result(rule["grade"], rule.get("interpretation", ""),
+                               rule.get("next_steps", ""), score)
+
+
+def _evaluator(key: str, fields: tuple, rules: tuple):
+    binned = [(f.name, f.breakpoints.bin) for f in fields if f.numeric]
+
+    def evaluate(**values):
+        for name, bin_of in binned:
+            values[name] = bin_of(values[name])
+        for when, result in rules:
+            if all(values[name] in allowed for name, allowed in when):
+                return result
+        raise ClassificationError(f"{key}: no rule matches {values}")
+
+    evaluate.rules = rules  # for radcalc.coverage
+    return evaluate
+
+
+def compile_system(spec: dict, source: str = "<rules>") -> Classifier:
+    """Build the classifier described by one rule-file entry, table included."""
+    if not isinstance(spec, dict):
+        raise ClassificationError(f"{source}: a system must be a JSON object")
+    if set(spec) != SYSTEM_KEYS:
+        raise ClassificationError(f"{source}: a system has exactly the keys {sorted(SYSTEM_KEYS)}, "
+                                  f"got {sorted(spec)}")
+    key = spec["key"]
+    where = f"{source}: {key}"
+    if spec["category"] not in CATEGORIES:
+        raise ClassificationError(f"{where}: category must be one of {list(CATEGORIES)}")
+    for part in ("fields", "rules"):
+        if not isinstance(spec[part], list):
+            raise ClassificationError(f"{where}: {part} must be a list of JSON objects")
+    fields = tuple(_field(f, where) for f in spec["fields"])
+    field_map = {f.name: f for f in fields}
+    rules = tuple(_rule(r, field_map, f"{where}: rule {i}") for i, r in enumerate(spec["rules"]))
+    unscored = [i for i, (_, result) in enumerate(rules) if result.score is None]
+    if unscored and len(unscored) < len(rules):
+        # Batch scoring keeps scores in an integer column; a rule without one has no value there.
+        raise ClassificationError(f"{where}: rule(s) {unscored} have no score; "
+                                  f"set a score on every rule or on none")
+    classifier = Classifier(key, spec["name"], spec["category"], fields,
+                            _evaluator(key, fields, rules), source=source)
+    try:
+        classifier.table  # every combination must match a rule; fail at load, not per request
+    except ClassificationError as exc:
+        raise ClassificationError(f"{source}: {exc}") from None
+    return classifier
+
+
+def rule_files(path) -> list:
+    path = Path(path)
+    return sorted(path.glob("*.json")) if path.is_dir() else [path]
+
+
+def load_file(path) -> list:
+    """Compile every system in one rule file."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError) as exc:
+        raise ClassificationError(f"{path}: {exc}") from None
+    return [compile_system(spec, str(path)) for spec in (data if isinstance(data, list) else [data])]
+
+
+def install(classifier: Classifier) -> None:
+    """Add `classifier` to `SYSTEMS`, replacing a system with the same inputs."""
+    current = SYSTEMS.get(classifier.key)
+    if current is not None:
+        shape = [(f.name, f.options, f.default) for f in current.fields]
+        if shape != [(f.name, f.options, f.default) for f in classifier.fields]:
+            raise ClassificationError(
+                f"{classifier.source}: {classifier.key} must keep the fields, options and defaults "
+                f"of the system it replaces")
+    SYSTEMS[classifier.key] = classifier
+    RESULTS.clear()
+    vector = sys.modules.get(f"{__package__}.vector")
+    if vector is not None:
+        vector.get_kernel.cache_clear()
+
+
+def load(paths=None) -> list:
+    """Load and install rule files; by default those named in `RADCALC_RULES`.
+
+    Returns the keys of the installed systems.
+    """
+    if paths is None:
+        paths = [p for p in os.environ.get(RULES_ENV, "").split(os.pathsep) if p]
+    classifiers = [c for path in paths for file in rule_files(path) for c in load_file(file)]
+    for classifier in classifiers:
+        install(classifier)
+    return [c.key for c in classifiers]
+
+
+def _field_spec(field) -> dict:
+    spec = {"name": field.name, "label": field.label}
+    if field.options:
+        spec["options"] = list(field.options)
+        if field.widget != "radio":
+            spec["widget"] = field.widget
+        if field.default is not None:
+            spec["default"] = field.default
+        return spec
+    if field.widget != "number":
+        spec["widget"] = field.widget
+    for name in ("min_value", "max_value", "value", "step"):
+        if getattr(field, name) is not None:
+            spec[name] = getattr(field, name)
+    spec["breakpoints"] = [list(cut) for cut in field.breakpoints.cuts]
+    return spec
+
+
+def export(system: str) -> dict:
+    """Rule-file entry reproducing `system`, one rule per path of its decision DAG."""
+    classifier = get(system)
+    if classifier.dag is None:
+        raise ClassificationError(f"{system}: numeric inputs without breakpoints cannot be written as rules")
+    rules = []
+    for conditions, result in paths(classifier.dag):
+        rule = {"when": {name: wanted[0] if len(wanted) == 1 else wanted for name, wanted in conditions.items()}}
+        if not rule["when"]:
+            del rule["when"]
+        rule["grade"] = result.grade
+        rule.update((k, v) for k, v in result._asdict().items() if k != "grade" and v not in (None, ""))
+        rules.append(rule)
+    return {"key": classifier.key, "name": classifier.name, "category": classifier.category,
+            "fields": [_field_spec(f) for f in classifier.fields], "rules": rules}
@@ -0,0 +1,207 @@
+"""Local asyncio HTTP scoring service (standard library only).
+
+    GET  /health                 -> {"status": "ok", "cache": {hit/miss/eviction counters}}
+    GET  /metrics                -> scoring and request metrics, Prometheus text format
+    GET  /systems                -> every classifier with its input fields
+    POST /classify/<system>      -> body: {"<field>": value, ...}; returns one result
+    POST /batch                  -> body: [record, ...] or {"records": [...]}; records
+                                    use the JSONL stream format (see radcalc.stream)
+
+Scoring is a table lookup or a few comparisons, so requests are handled
+inline on the event loop; connections are kept alive for HTTP/1.1.
+With `RADCALC_AUDIT_DB` set, every calculation is recorded (see radcalc.audit).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import traceback
+from http import HTTPStatus
+from time import perf_counter
+
+from . import audit, metrics
+from .cache import cache_info
+from .engine import SYSTEMS, ClassificationError, classify
+from .stream import score_record
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 32 * 1024 * 1024
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def describe_systems():
+    systems = []
+    for key, classifier in SYSTEMS.items():
+        fields = []
+        for f in classifier.fields:
+            spec = {"name": f.name, "label": f.label}
+            if f.options:
+                spec["options"] = list(f.options)
+            else:
+                spec.update(min=f.min_value, max=f.max_value)
+            if f.default is not None:
+                spec["default"] = f.default
+            fields.append(spec)
+        systems.append({"key": key, "name": classifier.name, "category": classifier.category, "fields": fields})
+    return systems
+
+
+def _json_body(body: bytes):
+    try:
+        return json.loads(body)
+    except ValueError as exc:  # undecodable bytes, bad JSON, or an integer over the digit limit
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"invalid JSON body: {exc}") from None
+
+
+def handle(method: str, path: str, body: bytes):
+    """Route one request; returns `(status, payload)`."""
+    path = path.split("?", 1)[0].rstrip("/") or "/"
+    if path == "/health":
+        return HTTPStatus.OK, {"status": "ok", "cache": cache_info()._asdict()}
+    if path == "/metrics":
+        return HTTPStatus.OK, metrics.render()
+    if path == "/systems":
+        return HTTPStatus.OK, describe_systems()
+    if path.startswith("/classify/"):
+        if method != "POST":
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "use POST")
+        key = path[len("/classify/"):]
+        if key not in SYSTEMS:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"unknown classification system {key!r}")
+        inputs = _json_body(body)
+        if not isinstance(inputs, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "body must be a JSON object of inputs")
+        try:
+            result = classify(key, **inputs)
+        except ClassificationError as exc:
+            raise HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY, str(exc)) from None
+        return HTTPStatus.OK, {"system": key, **result._asdict()}
+    if path == "/batch":
+        if method != "POST":
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "use POST")
+        payload = _json_body(body)
+        records = payload.get("records") if isinstance(payload, dict) else payload
+        if not isinstance(records, list):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "body must be a list of records or {\"records\": [...]}")
+        results = []
+        for record in records:
+            if isinstance(record, dict):
+                try:
+                    results.extend(list(score_record(record)))
+                except Exception:  # one bad record must not fail the batch
+                    traceback.print_exc()
+                    results.append({"id": record.get("id"), "system": None, "error": "internal error"})
+            else:
+                results.append({"system": None, "error": "record is not a JSON object"})
+        return HTTPStatus.OK, {"results": results}
+    raise HTTPError(HTTPStatus.NOT_FOUND, f"no route for {path}")
+
+
+async def _read_request(reader):
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.LimitOverrunError:
+        raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "request headers too large") from None
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ", 2)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "malformed request line") from None
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        raise HTTPError(HTTPStatus.LENGTH_REQUIRED, "chunked request bodies are not supported")
+    value = headers.get("content-length", "0")
+    if not value.isdigit() or not value.isascii():  # int() would also take "-5", "+5" and " 5"
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+    length = int(value) if len(value) < 16 else MAX_BODY_BYTES + 1  # int() refuses very long digit strings
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "request body too large")
+    body = await reader.readexactly(length) if length else b""
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+    return method.upper(), target, body, keep_alive
+
+
+def _route(target: str) -> str:
+    """Metric label for a request target; one per route, not per URL."""
+    path = target.split("?", 1)[0].rstrip("/") or "/"
+    if path.startswith("/classify/"):
+        return "/classify"
+    return path if path in ("/health", "/metrics", "/systems", "/batch") else "other"
+
+
+def _response(status: HTTPStatus, payload, keep_alive: bool) -> bytes:
+    """A JSON response; a `str` payload is sent as-is in the metrics text format."""
+    if isinstance(payload, str):
+        body, content_type = payload.encode(), metrics.CONTENT_TYPE
+    else:
+        body, content_type = json.dumps(payload, ensure_ascii=False).encode(), "application/json; charset=utf-8"
+    head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode() + body
+
+
+async def serve_connection(reader, writer):
+    try:
+        while True:
+            try:
+                method, target, body, keep_alive = await _read_request(reader)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                break
+            except HTTPError as exc:
+                metrics.HTTP_REQUESTS.inc("other", exc.status.value)  # malformed: no route to label it with
+                writer.write(_response(exc.status, {"error": str(exc)}, False))
+                break
+            started = perf_counter()
+            try:
+                status, payload = handle(method, target, body)
+            except HTTPError as exc:
+                status, payload = exc.status, {"error": str(exc)}
+            except Exception:  # a bug must cost one request, not the connection
+                traceback.print_exc()
+                status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "internal error"}
+            route = _route(target)
+            metrics.HTTP_REQUESTS.inc(route, status.value)
+            metrics.HTTP_SECONDS.observe(perf_counter() - started, route)
+            writer.write(_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    finally:
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+
+async def start(host="127.0.0.1", port=8765, backlog=1024):
+    return await asyncio.start_server(serve_connection, host, port, backlog=backlog,
+                                      limit=MAX_HEADER_BYTES)
+
+
+def run(host="127.0.0.1", port=8765):
+    audit.enable("service")
+
+    async def main():
+        server = await start(host, port)
+        addresses = ", ".join(str(s.getsockname()) for s in server.sockets)
+        print(f"radcalc service listening on {addresses}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
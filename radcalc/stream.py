@@ -0,0 +1,91 @@
+"""Streaming JSONL scoring: one findings record in, result records out.
+
+Each input line is a JSON object. Its findings are either the top-level
+keys or a nested `"findings"` object; `"system"` (a key or a list of
+keys) picks the classifiers, otherwise every system whose required
+fields are present is scored. Each result line echoes the record id:
+
+    {"id": "A1", "system": "lung_rads", "grade": "Category 3", ...}
+    {"id": "A2", "system": "ti_rads", "error": "shape: 'Wide' is not one of [...]"}
+
+Records are read, scored and written one at a time, so memory use does
+not depend on the size of the input.
+"""
+from __future__ import annotations
+
+import json
+
+from . import metrics
+from .engine import ClassificationError, applicable_systems, classify, field_columns, get
+
+RESERVED = ("system", "findings")
+
+
+def read_records(lines):
+    """Yield `(line_number, record)`; malformed lines yield an error string instead."""
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:  # JSONDecodeError, or an integer literal over the digit limit
+            yield number, f"invalid JSON: {getattr(exc, 'msg', exc)}"
+            continue
+        if not isinstance(record, dict):
+            yield number, "record is not a JSON object"
+            continue
+        yield number, record
+
+
+def score_record(record: dict, systems=None, id_field="id"):
+    """Yield one result dict per classifier applied to `record`."""
+    findings = record.get("findings", record)
+    if not isinstance(findings, dict):
+        yield {id_field: record.get(id_field), "system": None, "error": "findings is not a JSON object"}
+        return
+    rid = record.get(id_field)
+    requested = record.get("system") or systems
+    if isinstance(requested, str):
+        requested = [requested]
+    if requested and not (isinstance(requested, (list, tuple)) and all(isinstance(k, str) for k in requested)):
+        yield {id_field: rid, "system": None, "error": "system must be a system key or a list of them"}
+        return
+    keys = list(requested) if requested else applicable_systems(
+        {k for k in findings if k not in RESERVED and k != id_field})
+    if not keys:
+        yield {id_field: rid, "system": None, "error": "no classification system matches these findings"}
+        return
+    for key in keys:
+        out = {id_field: rid, "system": key}
+        try:
+            mapping = field_columns(key, findings)
+            if mapping is None:
+                metrics.observe_error(key)
+                raise ClassificationError(f"{key}: record lacks inputs for {list(get(key).field_names)}")
+            result = classify(key, **{name: findings[column] for name, column in mapping.items()
+                                      if findings[column] is not None})
+        except ClassificationError as exc:
+            out["error"] = str(exc)
+        else:
+            out.update(result._asdict())
+        yield out
+
+
+def score_stream(lines, systems=None, id_field="id"):
+    """Generator of result dicts for an iterable of JSONL lines."""
+    for number, record in read_records(lines):
+        if isinstance(record, str):
+            yield {"line": number, "system": None, "error": record}
+            continue
+        yield from score_record(record, systems, id_field)
+
+
+def write_stream(results, out) -> int:
+    """Write result dicts as JSONL to the text stream `out`; returns the count."""
+    count = 0
+    for result in results:
+        out.write(json.dumps(result, ensure_ascii=False))
+        out.write("\n")
+        count += 1
+    return count
@@ -0,0 +1,2 @@
+"""Importing this package registers every classifier in `radcalc.SYSTEMS`."""
+from . import neuro, head_neck, cardiothoracic, abdominopelvic, msk, vascular, rads  # noqa: F401
@@ -0,0 +1,68 @@
+"""ABDOMINOPELVIC classifications (LI-RADS, PI-RADS, O-RADS, TI-RADS live in `rads`)."""
+from ..bins import Breakpoints
+from ..engine import ABDOMINOPELVIC, YES_NO, Result, choice, number, register
+
+# -----------------------------------------------------------
+# 4.1 Bosniak Classification (Renal Cysts)
+# -----------------------------------------------------------
+@register("bosniak", "Bosniak Classification (Renal Cysts)", ABDOMINOPELVIC, [
+    choice("septa", "Are septa present?", YES_NO),
+    choice("septa_thickness", "Septa thickness", ["N/A", "Thin", "Thick"], default="N/A"),
+    choice("calcifications", "Calcifications", ["None", "Thin", "Thick/Nodular"]),
+    choice("enhancement", "Is there enhancement of walls/septa?", YES_NO),
+])
+def bosniak(septa: str, septa_thickness: str, calcifications: str, enhancement: str) -> Result:
+    if septa == "No" and calcifications == "None" and enhancement == "No":
+        category = "I"
+    elif septa == "Yes" and septa_thickness == "Thin" and enhancement == "No":
+        category = "II"
+    elif septa == "Yes" and (septa_thickness == "Thin" and enhancement == "Yes"):
+        category = "IIF"
+    elif septa == "Yes" and septa_thickness == "Thick" and enhancement == "Yes":
+        category = "III"
+    else:
+        category = "IV"
+    return Result(category, next_steps="Based on the Bosniak category, further imaging follow-up or surgical consultation may be indicated.")
+
+
+# -----------------------------------------------------------
+# 4.2 AAST Organ Injury Scales (Trauma) – splenic injury
+# -----------------------------------------------------------
+@register("aast_spleen", "AAST Organ Injury Scales (Trauma)", ABDOMINOPELVIC, [
+    choice("area", "Estimated surface area involvement", ["<10%", "10–50%", ">50%"], widget="selectbox"),
+    choice("depth", "Laceration depth", ["<1 cm", "1–3 cm", ">3 cm"], widget="selectbox"),
+    choice("vascular", "Vascular injury present?", YES_NO),
+])
+def aast_spleen(area: str, depth: str, vascular: str) -> Result:
+    if area == "<10%" and depth == "<1 cm" and vascular == "No":
+        grade = "I"
+    elif area == "10–50%" and depth == "1–3 cm" and vascular == "No":
+        grade = "II"
+    elif area == ">50%" or depth == ">3 cm" or vascular == "Yes":
+        grade = "III or higher"
+    else:
+        grade = "Intermediate"
+    return Result(grade, next_steps="High-grade injuries may require surgical or interventional radiology management.")
+
+
+# -----------------------------------------------------------
+# 4.3 Balthazar & CTSI (Pancreatitis)
+# -----------------------------------------------------------
+BALTHAZAR_POINTS = {
+    "A (Normal)": 0,
+    "B (Enlarged)": 1,
+    "C (Mild Inflammation)": 2,
+    "D (Single Fluid Collection)": 3,
+    "E (Multiple Fluid Collections)": 4,
+}
+# Necrosis (%): <33 -> 0, 33–49 -> 2, ≥50 -> 4.
+NECROSIS_POINTS = Breakpoints([(33, "<"), (50, "<")], values=(0, 2, 4))
+
+
+@register("ctsi", "Balthazar/CT Severity Index (Pancreatitis)", ABDOMINOPELVIC, [
+    choice("balthazar", "Select Balthazar Grade", list(BALTHAZAR_POINTS), widget="selectbox"),
+    number("necrosis", "Estimate percentage of pancreatic necrosis (%)", min_value=0, max_value=100, value=10, step=5, widget="slider", breakpoints=NECROSIS_POINTS),
+])
+def ctsi(balthazar: str, necrosis: float) -> Result:
+    score = BALTHAZAR_POINTS[balthazar] + NECROSIS_POINTS(necrosis)
+    return Result(score, next_steps="Higher CTSI scores indicate more severe pancreatitis; manage accordingly with supportive care and ICU monitoring for severe cases.", score=score)
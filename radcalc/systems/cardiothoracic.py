@@ -0,0 +1,61 @@
+"""CARDIOTHORACIC classifications (BI-RADS and Lung-RADS live in `rads`)."""
+from ..engine import CARDIOTHORACIC, Result, choice, number, register
+
+# -----------------------------------------------------------
+# 3.1 Aortic Dissection
+# -----------------------------------------------------------
+@register("aortic_dissection", "Aortic Dissection", CARDIOTHORACIC, [
+    choice("ascending", "Is the ascending aorta involved?", ["Yes", "No"]),
+])
+def aortic_dissection(ascending: str) -> Result:
+    stanford = "Type A" if ascending == "Yes" else "Type B"
+    return Result(stanford, next_steps="For Stanford Type A, arrange immediate surgical consultation. For Type B, consider medical management and close monitoring.")
+
+
+# -----------------------------------------------------------
+# 3.2 Pulmonary Embolism – Qanadli Score
+# -----------------------------------------------------------
+@register("qanadli", "Pulmonary Embolism – Qanadli Score", CARDIOTHORACIC, [
+    number("partial", "Number of partially occluded segmental arteries", min_value=0, max_value=20, value=0, step=1),
+    number("complete", "Number of completely occluded segmental arteries", min_value=0, max_value=20, value=0, step=1),
+])
+def qanadli(partial: float, complete: float) -> Result:
+    score = int(partial * 1 + complete * 2)
+    return Result(score, next_steps="A higher score indicates a larger clot burden. For high scores, consider thrombolysis and monitor right ventricular function.", score=score)
+
+
+# -----------------------------------------------------------
+# 3.4 COVID-19 Chest Imaging (RSNA)
+# -----------------------------------------------------------
+COVID_NEXT_STEPS = {
+    "Typical": "Recommend confirmatory RT-PCR testing and initiate isolation protocols.",
+    "Indeterminate": "Correlate clinically; consider repeat imaging.",
+    "Atypical": "Evaluate for alternative pneumonia etiologies.",
+    "Negative": "Routine care; no evidence of pneumonia.",
+}
+
+
+@register("covid_rsna", "COVID-19 Chest Imaging (RSNA)", CARDIOTHORACIC, [
+    choice("ggo", "Are bilateral peripheral GGOs present?", ["Yes", "No"]),
+    choice("consolidation", "Is there consolidation or crazy-paving?", ["Yes", "No"]),
+])
+def covid_rsna(ggo: str, consolidation: str) -> Result:
+    if ggo == "Yes" and consolidation == "Yes":
+        category = "Typical"
+    elif ggo == "Yes":
+        category = "Indeterminate"
+    elif consolidation == "Yes":
+        category = "Atypical"
+    else:
+        category = "Negative"
+    return Result(category, next_steps=COVID_NEXT_STEPS[category])
+
+
+# -----------------------------------------------------------
+# 3.5 ATS/ERS Classification (IIP)
+# -----------------------------------------------------------
+@register("ats_ers", "ATS/ERS Classification (IIP)", CARDIOTHORACIC, [
+    choice("pattern", "Select the predominant HRCT pattern", ["UIP", "NSIP", "COP", "Other"], widget="selectbox"),
+])
+def ats_ers(pattern: str) -> Result:
+    return Result(pattern, next_steps="Correlate with clinical findings; if UIP, evaluate for idiopathic pulmonary fibrosis and refer to pulmonology.")
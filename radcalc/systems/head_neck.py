@@ -0,0 +1,62 @@
+"""HEAD & NECK classifications."""
+from ..bins import Breakpoints
+from ..engine import HEAD_NECK, YES_NO, Result, choice, number, register
+
+# -----------------------------------------------------------
+# 2.1 TNM Staging (AJCC) – Head & Neck Cancers
+# -----------------------------------------------------------
+# Tumor size (cm): <2, 2–4, ≥4.
+TNM_TUMOR_SIZE = Breakpoints([(2, "<"), (4, "<")])
+TNM_T = {
+    "No": ("T1", "T2", "T4"),
+    "Yes": ("T3", "T3", "T4"),
+}
+# Involved nodes: exactly 0 -> N0, exactly 1 -> N1, anything else -> N2.
+TNM_N = Breakpoints([(0, "<="), (1, "<"), (1, "<=")], values=("N0", "N2", "N1", "N2"))
+
+
+@register("tnm", "TNM Staging (AJCC) – Head & Neck Cancers", HEAD_NECK, [
+    number("tumor_size", "Enter primary tumor size (cm)", min_value=0.0, value=2.0, step=0.1, breakpoints=TNM_TUMOR_SIZE),
+    choice("invasion", "Is there invasion of adjacent structures?", YES_NO),
+    number("nodes", "Number of involved lymph nodes", min_value=0, value=1, step=1, breakpoints=TNM_N),
+    choice("metastasis", "Are distant metastases present?", YES_NO),
+])
+def tnm(tumor_size: float, invasion: str, nodes: float, metastasis: str) -> Result:
+    # Simplified TNM assignment.
+    t_cat = TNM_T[invasion][TNM_TUMOR_SIZE.bin(tumor_size)]
+    n_cat = TNM_N(nodes)
+    m_cat = "M0" if metastasis == "No" else "M1"
+    return Result(f"{t_cat} {n_cat} {m_cat}", next_steps="Confirm with biopsy and plan multidisciplinary management (surgery, radiation, chemotherapy) based on staging.")
+
+
+# -----------------------------------------------------------
+# 2.2 Lugano Classification (Lymphoma)
+# -----------------------------------------------------------
+# Nodal regions: none, exactly one, two, three or more.
+LUGANO_REGIONS = Breakpoints([(1, "<"), (1, "<="), (3, "<")])
+LUGANO_STAGE = {
+    "No": ("Stage III", "Stage I", "Stage II", "Stage II"),
+    "Yes": ("Stage IIE", "Stage IIE", "Stage IIE", "Stage IV"),
+}
+
+
+@register("lugano", "Lugano Classification (Lymphoma)", HEAD_NECK, [
+    number("nodal_regions", "Enter number of nodal regions involved", min_value=0, value=1, step=1, breakpoints=LUGANO_REGIONS),
+    choice("extranodal", "Is there extranodal involvement?", YES_NO),
+])
+def lugano(nodal_regions: float, extranodal: str) -> Result:
+    stage = LUGANO_STAGE[extranodal][LUGANO_REGIONS.bin(nodal_regions)]
+    return Result(stage, next_steps="Tailor treatment based on stage; consider chemotherapy and follow-up PET-CT for treatment response.")
+
+
+# -----------------------------------------------------------
+# 2.3 Friedman Staging (Tonsillar Hypertrophy)
+# -----------------------------------------------------------
+FRIEDMAN_STAGE = Breakpoints([(25, "<"), (50, "<"), (75, "<")], values=("1+", "2+", "3+", "4+"))
+
+
+@register("friedman", "Friedman Staging (Tonsillar Hypertrophy)", HEAD_NECK, [
+    number("tonsil_percent", "Percentage of oropharyngeal width occupied", min_value=0, max_value=100, value=30, step=5, widget="slider", breakpoints=FRIEDMAN_STAGE),
+])
+def friedman(tonsil_percent: float) -> Result:
+    return Result(FRIEDMAN_STAGE(tonsil_percent), next_steps="Significant hypertrophy (3+ or 4+) warrants further evaluation for airway compromise and potential tonsillectomy.")
@@ -0,0 +1,123 @@
+"""MUSCULOSKELETAL (MSK) classifications."""
+from ..bins import Breakpoints
+from ..engine import MSK, YES_NO, Result, choice, number, register
+
+# -----------------------------------------------------------
+# 5.1 AO/OTA Fracture Classification
+# -----------------------------------------------------------
+@register("ao_ota", "AO/OTA Fracture Classification", MSK, [
+    choice("location", "Fracture location", ["Proximal", "Diaphyseal", "Distal"], widget="selectbox"),
+    choice("pattern", "Fracture pattern", ["Simple", "Wedge", "Complex"], widget="selectbox"),
+    choice("articular", "Articular involvement", YES_NO),
+])
+def ao_ota(location: str, pattern: str, articular: str) -> Result:
+    description = f"{location} - {pattern} fracture{' with articular involvement' if articular == 'Yes' else ''}"
+    return Result(description, next_steps="Evaluate stability and consult orthopedics for treatment planning.")
+
+
+# -----------------------------------------------------------
+# 5.2 Gustilo–Anderson Classification
+# -----------------------------------------------------------
+# Wound size (cm): <1, 1–10, >10.
+GUSTILO_WOUND = Breakpoints([(1, "<"), (10, "<=")])
+GUSTILO_TYPE = {
+    "Minimal": ("Type I", "Type III", "Type III"),
+    "Moderate": ("Type III", "Type II", "Type III"),
+    "Extensive": ("Type III", "Type III", "Type III"),
+}
+
+
+@register("gustilo", "Gustilo–Anderson (Open Fractures)", MSK, [
+    number("wound_size", "Wound size (cm)", min_value=0.0, value=1.0, step=0.1, breakpoints=GUSTILO_WOUND),
+    choice("soft_tissue", "Extent of soft tissue injury", list(GUSTILO_TYPE)),
+])
+def gustilo(wound_size: float, soft_tissue: str) -> Result:
+    gtype = GUSTILO_TYPE[soft_tissue][GUSTILO_WOUND.bin(wound_size)]
+    return Result(gtype, next_steps="High-grade open fractures (Type III) require urgent debridement and stabilization.")
+
+
+# -----------------------------------------------------------
+# 5.3 Tscherne / 5.4 Salter-Harris (reader-selected grades)
+# -----------------------------------------------------------
+@register("tscherne", "Tscherne Classification (Soft-Tissue Injuries)", MSK, [
+    choice("tscherne_grade", "Select Tscherne Grade (Closed)", ["C0", "C1", "C2", "C3"], widget="selectbox"),
+])
+def tscherne(tscherne_grade: str) -> Result:
+    return Result(tscherne_grade, next_steps="Higher grades may require surgical debridement and specialized soft-tissue management.")
+
+
+@register("salter_harris", "Salter-Harris (Physeal Fractures)", MSK, [
+    choice("sh_type", "Select Salter-Harris Type", ["I", "II", "III", "IV", "V"], widget="selectbox"),
+])
+def salter_harris(sh_type: str) -> Result:
+    return Result(sh_type, next_steps="Higher types (III–V) warrant pediatric orthopedic consultation due to potential growth disturbances.")
+
+
+# -----------------------------------------------------------
+# 5.5 Other Fracture Classifications
+# -----------------------------------------------------------
+GARDEN_TYPES = {
+    "Incomplete/Valgus Impaction": "Type I",
+    "Complete Non-displaced": "Type II",
+    "Partially Displaced": "Type III",
+    "Completely Displaced": "Type IV",
+}
+
+
+@register("garden", "Garden (Femoral Neck)", MSK, [
+    choice("displacement", "Displacement", list(GARDEN_TYPES)),
+])
+def garden(displacement: str) -> Result:
+    return Result(GARDEN_TYPES[displacement], next_steps="Higher Garden types carry an increased risk of avascular necrosis; surgical treatment is usually indicated.")
+
+
+PAUWELS_TYPE = Breakpoints([(30, "<"), (50, "<")], values=("Type I", "Type II", "Type III"))
+
+
+@register("pauwels", "Pauwels (Femoral Neck)", MSK, [
+    number("angle", "Enter fracture angle (degrees)", min_value=0, max_value=90, value=25, breakpoints=PAUWELS_TYPE),
+])
+def pauwels(angle: float) -> Result:
+    return Result(PAUWELS_TYPE(angle), next_steps="Higher Pauwels types (Type III) are less stable and typically require surgical fixation.")
+
+
+@register("neer", "Neer (Proximal Humerus)", MSK, [
+    choice("segments", "Select Neer Classification", ["One-Part", "Two-Part", "Three-Part", "Four-Part"], widget="selectbox"),
+])
+def neer(segments: str) -> Result:
+    return Result(segments, next_steps="Multi-part fractures generally require surgical intervention.")
+
+
+@register("weber", "Weber (Ankle)", MSK, [
+    choice("weber", "Select Weber Type", ["A (Below Syndesmosis)", "B (At Syndesmosis)", "C (Above Syndesmosis)"], widget="selectbox"),
+])
+def weber(weber: str) -> Result:
+    return Result(weber, next_steps="Evaluate for syndesmotic injury; Type C fractures often require surgical stabilization.")
+
+
+@register("lauge_hansen", "Lauge-Hansen (Ankle)", MSK, [
+    choice("mechanism", "Select Mechanism", ["Supination–External Rotation", "Pronation–External Rotation", "Supination–Adduction", "Pronation–Abduction"], widget="selectbox"),
+])
+def lauge_hansen(mechanism: str) -> Result:
+    return Result(mechanism, next_steps="Use mechanism to guide management and assess for associated ligamentous injury.")
+
+
+@register("frykman", "Frykman (Distal Radius)", MSK, [
+    choice("frykman", "Select Frykman Type", ["I", "II", "III", "IV", "V", "VI", "VII", "VIII"], widget="selectbox"),
+])
+def frykman(frykman: str) -> Result:
+    return Result(frykman, next_steps="Higher Frykman types may require surgical intervention due to joint involvement.")
+
+
+@register("sanders", "Sanders (Calcaneal)", MSK, [
+    choice("sanders", "Select Sanders Type", ["I (<2 fragments)", "II (2 fragments)", "III (3 fragments)", "IV (≥4 fragments)"], widget="selectbox"),
+])
+def sanders(sanders: str) -> Result:
+    return Result(sanders, next_steps="Complex fractures (Sanders III and IV) often require surgical reconstruction.")
+
+
+@register("mayo", "Mayo (Olecranon)", MSK, [
+    choice("mayo", "Select Mayo Type", ["Stable", "Unstable"], widget="selectbox"),
+])
+def mayo(mayo: str) -> Result:
+    return Result(mayo, next_steps="Unstable fractures typically require surgical fixation.")
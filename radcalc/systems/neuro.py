@@ -0,0 +1,168 @@
+"""NEURO (brain & spine) classifications."""
+from ..bins import Breakpoints
+from ..engine import NEURO, YES_NO, Result, choice, number, register
+
+# -----------------------------------------------------------
+# 1.1 Hunt and Hess Classification (SAH)
+# -----------------------------------------------------------
+HUNT_HESS_TEXT = {
+    "I": ("Minimal symptoms; imaging shows only subtle SAH.",
+          "Routine monitoring; neurosurgical consult as needed."),
+    "II": ("Moderate symptoms; SAH is visible on CT.",
+           "Close observation and neurosurgical consultation."),
+    "III": ("Moderate to severe symptoms; thicker SAH may be present.",
+            "Consider intensive care and early neurosurgical evaluation."),
+    "IV": ("Severe deficits and diffuse SAH.",
+           "Urgent neurosurgical evaluation and intensive care management."),
+    "V": ("Critical condition with large, diffuse SAH (possibly with intraventricular extension).",
+          "Emergency neurosurgical and critical care management required."),
+}
+
+
+@register("hunt_hess", "Hunt and Hess (SAH)", NEURO, [
+    choice("headache", "Headache severity", ["Minimal", "Moderate", "Severe"]),
+    choice("consciousness", "Level of consciousness", ["Normal", "Drowsy/Confused", "Stupor", "Deep Coma"]),
+    choice("focal_deficit", "Focal neurological deficits", ["None", "Mild", "Severe"]),
+    choice("ct_sah", "CT appearance of SAH", ["Subtle/Small", "Moderate", "Diffuse/Large with IVH"]),
+])
+def hunt_hess(headache: str, consciousness: str, focal_deficit: str, ct_sah: str) -> Result:
+    # (Simplified logic; in practice, clinical assessment predominates.)
+    if headache == "Minimal" and consciousness == "Normal" and focal_deficit == "None" and ct_sah == "Subtle/Small":
+        grade = "I"
+    elif headache == "Moderate" and (consciousness in ["Normal", "Drowsy/Confused"]) and focal_deficit in ["None", "Mild"] and ct_sah == "Moderate":
+        grade = "II"
+    elif consciousness == "Drowsy/Confused" or focal_deficit == "Mild" or ct_sah == "Moderate":
+        grade = "III"
+    elif consciousness == "Stupor" or focal_deficit == "Severe" or ct_sah == "Diffuse/Large with IVH":
+        grade = "IV"
+    else:
+        grade = "V"
+    return Result(grade, *HUNT_HESS_TEXT[grade])
+
+
+# -----------------------------------------------------------
+# 1.2 Fisher Classification (SAH)
+# -----------------------------------------------------------
+FISHER_TEXT = {
+    1: ("No blood detected; low risk of vasospasm.", "Routine monitoring."),
+    2: ("Thin layer of blood; relatively low risk.", "Monitor and consider prophylaxis."),
+    3: ("Thick clot in the subarachnoid space; higher risk of vasospasm.",
+        "Initiate vasospasm prophylaxis and intensive monitoring."),
+    4: ("Presence of intraventricular/intraparenchymal blood; highest risk for vasospasm.",
+        "Aggressive management including possible endovascular intervention."),
+}
+
+
+@register("fisher", "Fisher (SAH)", NEURO, [
+    choice("blood_detected", "Is blood detected on CT?", YES_NO),
+    choice("blood_thickness", "If yes, is the blood layer:", ["None", "Thin (<1 mm)", "Thick (≥1 mm)"], default="None"),
+    choice("extra", "Is there intraventricular/intraparenchymal blood?", YES_NO),
+])
+def fisher(blood_detected: str, blood_thickness: str, extra: str) -> Result:
+    # Simplified scoring:
+    if blood_detected == "No":
+        grade = 1
+    elif blood_thickness == "Thin (<1 mm)":
+        grade = 2
+    elif blood_thickness == "Thick (≥1 mm)" and extra == "No":
+        grade = 3
+    else:
+        grade = 4
+    return Result(grade, *FISHER_TEXT[grade])
+
+
+# -----------------------------------------------------------
+# 1.3 Spetzler-Martin Grading (AVMs)
+# -----------------------------------------------------------
+# Nidus size (cm): small <3, medium 3–6, large >6.
+SPETZLER_SIZE_POINTS = Breakpoints([(3, "<"), (6, "<=")], values=(1, 2, 3))
+
+
+@register("spetzler_martin", "Spetzler-Martin (AVMs)", NEURO, [
+    number("size", "Enter AVM nidus size (cm)", min_value=0.0, value=2.0, step=0.1, breakpoints=SPETZLER_SIZE_POINTS),
+    choice("eloquent", "Is the AVM adjacent to eloquent brain areas?", YES_NO),
+    choice("drainage", "Type of venous drainage", ["Superficial only", "Deep drainage"]),
+])
+def spetzler_martin(size: float, eloquent: str, drainage: str) -> Result:
+    size_points = SPETZLER_SIZE_POINTS(size)
+    eloquence_points = 1 if eloquent == "Yes" else 0
+    drainage_points = 1 if drainage == "Deep drainage" else 0
+    total_score = size_points + eloquence_points + drainage_points
+    return Result(
+        total_score,
+        "A higher score (closer to 5 or more) suggests a higher surgical risk.",
+        "Multidisciplinary evaluation (neurosurgery, interventional radiology) is advised to plan treatment.",
+        score=total_score,
+    )
+
+
+# -----------------------------------------------------------
+# 1.4 Modic Classification (Vertebral Endplate Changes)
+# -----------------------------------------------------------
+@register("modic", "Modic (Vertebral Endplate Changes)", NEURO, [
+    choice("t1_signal", "T1 signal of endplate", ["Hypointense", "Hyperintense"]),
+    choice("t2_signal", "T2 signal of endplate", ["Hyperintense", "Hypointense", "Isointense"]),
+])
+def modic(t1_signal: str, t2_signal: str) -> Result:
+    if t1_signal == "Hypointense" and t2_signal == "Hyperintense":
+        modic_type = "Type I (Edematous/Inflammatory)"
+    elif t1_signal == "Hyperintense" and t2_signal in ["Hyperintense", "Isointense"]:
+        modic_type = "Type II (Fatty Degeneration)"
+    elif t1_signal == "Hypointense" and t2_signal == "Hypointense":
+        modic_type = "Type III (Sclerotic)"
+    else:
+        modic_type = "Unclassified"
+    return Result(modic_type, next_steps="Correlate with patient symptoms; conservative management versus intervention is guided by clinical context.")
+
+
+# -----------------------------------------------------------
+# 1.5 Pfirrmann Classification (Disc Degeneration)
+# -----------------------------------------------------------
+@register("pfirrmann", "Pfirrmann (Disc Degeneration)", NEURO, [
+    choice("disc_desc", "Select the disc appearance", [
+        "Homogeneous, bright T2 signal; normal disc height; clear distinction (Grade I)",
+        "Slightly less bright; normal height; clear boundary (Grade II)",
+        "Intermediate signal; slight decrease in height; borderline boundary (Grade III)",
+        "Hypointense; moderate height loss; unclear boundary (Grade IV)",
+        "Very hypointense; collapsed disc space; severe degeneration (Grade V)",
+    ], widget="selectbox"),
+])
+def pfirrmann(disc_desc: str) -> Result:
+    if "Grade I)" in disc_desc:
+        grade = "I"
+    elif "Grade II)" in disc_desc:
+        grade = "II"
+    elif "Grade III" in disc_desc:
+        grade = "III"
+    elif "Grade IV" in disc_desc:
+        grade = "IV"
+    else:
+        grade = "V"
+    return Result(grade, next_steps="For mild degeneration, conservative treatment is usually recommended; severe degeneration may require interventional or surgical management.")
+
+
+# -----------------------------------------------------------
+# 1.6 TLICS – Thoracolumbar Injury Classification
+# -----------------------------------------------------------
+TLICS_MORPH_POINTS = {"Compression": 1, "Burst": 2, "Translation/Rotation": 3, "Distraction": 4}
+TLICS_PLC_POINTS = {"Intact": 0, "Disrupted": 3}
+TLICS_NEURO_POINTS = {"Intact": 0, "Incomplete deficit": 2, "Complete deficit": 3}
+
+
+@register("tlics", "TLICS (Thoracolumbar Injury)", NEURO, [
+    choice("morphology", "Injury Morphology", list(TLICS_MORPH_POINTS), widget="selectbox"),
+    choice("plc", "Posterior Ligamentous Complex", list(TLICS_PLC_POINTS)),
+    choice("neuro", "Neurological Status", list(TLICS_NEURO_POINTS), widget="selectbox"),
+])
+def tlics(morphology: str, plc: str, neuro: str) -> Result:
+    tlics_score = TLICS_MORPH_POINTS[morphology] + TLICS_PLC_POINTS[plc] + TLICS_NEURO_POINTS[neuro]
+    if tlics_score >= 5:
+        next_steps = "Recommend surgical consultation for stabilization."
+    else:
+        next_steps = "Consider conservative management with close follow-up."
+    return Result(
+        tlics_score,
+        "A TLICS score of ≥5 generally indicates that surgical treatment is recommended.",
+        next_steps,
+        score=tlics_score,
+    )
@@ -0,0 +1,135 @@
+"""-RADS systems (BI-RADS and Lung-RADS are also shown under CARDIOTHORACIC)."""
+from ..bins import Breakpoints
+from ..engine import RADS, YES_NO, Result, choice, number, register
+
+# -----------------------------------------------------------
+# BI-RADS
+# -----------------------------------------------------------
+@register("bi_rads", "BI-RADS (Breast)", RADS, [
+    choice("shape", "Mass shape", ["Oval", "Round", "Irregular"], widget="selectbox"),
+    choice("margin", "Mass margin", ["Circumscribed", "Not-circumscribed"], widget="selectbox"),
+    choice("calc", "Calcifications present?", YES_NO),
+])
+def bi_rads(shape: str, margin: str, calc: str) -> Result:
+    if shape in ["Oval", "Round"] and margin == "Circumscribed" and calc == "No":
+        category = 2
+    elif shape == "Irregular" or margin == "Not-circumscribed":
+        category = 4
+    else:
+        category = 3
+    return Result(category, next_steps="For BI-RADS 4 lesions, consider biopsy; for BI-RADS 3, recommend short-term follow-up.")
+
+
+# -----------------------------------------------------------
+# Lung-RADS
+# -----------------------------------------------------------
+# Nodule size (mm): <6, 6–8, ≥8.
+LUNG_RADS_SIZE = Breakpoints([(6, "<"), (8, "<")], values=(
+    ("Category 2", "Benign"),
+    ("Category 3", "Probably benign"),
+    ("Category 4", "Suspicious"),
+))
+
+
+@register("lung_rads", "Lung-RADS (Lung CT Screening)", RADS, [
+    number("nodule_size", "Nodule size (mm)", min_value=0, value=5, breakpoints=LUNG_RADS_SIZE),
+    choice("nodule_type", "Nodule type", ["Solid", "Part-solid", "Ground-glass"]),
+])
+def lung_rads(nodule_size: float, nodule_type: str) -> Result:
+    # Simplified decision: nodule_type is recorded but does not change the category.
+    category, meaning = LUNG_RADS_SIZE(nodule_size)
+    return Result(category, meaning, "Recommend appropriate follow-up CT; suspicious nodules (Category 4) may need further diagnostic evaluation.")
+
+
+# -----------------------------------------------------------
+# LI-RADS
+# -----------------------------------------------------------
+# Lesion size (mm): ≥10 is enough for LR-3 on its own.
+LI_RADS_SIZE = Breakpoints([(10, "<")], values=(False, True))
+
+
+@register("li_rads", "LI-RADS (Liver)", RADS, [
+    choice("aphe", "Is arterial phase hyperenhancement present?", YES_NO),
+    choice("washout", "Is washout observed in later phases?", YES_NO),
+    choice("capsule", "Is capsule appearance present?", YES_NO),
+    number("size", "Lesion size (mm)", min_value=0, value=8, breakpoints=LI_RADS_SIZE),
+])
+def li_rads(aphe: str, washout: str, capsule: str, size: float) -> Result:
+    if aphe == "Yes" and washout == "Yes":
+        category = "LR-4"
+    elif any([aphe == "Yes", washout == "Yes", capsule == "Yes"]) or LI_RADS_SIZE(size):
+        category = "LR-3"
+    else:
+        category = "LR-2"
+    return Result(category, next_steps="For LI-RADS 4 lesions, further evaluation with biopsy or surgical consultation is advised.")
+
+
+# -----------------------------------------------------------
+# PI-RADS
+# -----------------------------------------------------------
+@register("pi_rads", "PI-RADS (Prostate)", RADS, [
+    choice("t2", "Is there a hypointense lesion on T2?", YES_NO),
+    choice("dwi", "Is there restricted diffusion?", YES_NO),
+    choice("dce", "Is there early focal enhancement?", YES_NO),
+])
+def pi_rads(t2: str, dwi: str, dce: str) -> Result:
+    score = 4 if dwi == "Yes" else 2
+    return Result(score, next_steps="Lesions with PI-RADS ≥4 should be considered for biopsy and further urologic evaluation.", score=score)
+
+
+# -----------------------------------------------------------
+# TI-RADS
+# -----------------------------------------------------------
+@register("ti_rads", "TI-RADS (Thyroid)", RADS, [
+    choice("composition", "Nodule composition", ["Cystic", "Mixed", "Solid"], widget="selectbox"),
+    choice("echogenicity", "Echogenicity", ["Anechoic", "Isoechoic", "Hypoechoic"], widget="selectbox"),
+    choice("shape", "Nodule shape", ["Not taller-than-wide", "Taller-than-wide"]),
+    choice("margins", "Margins", ["Smooth", "Irregular"]),
+    choice("microcalc", "Microcalcifications present?", YES_NO),
+])
+def ti_rads(composition: str, echogenicity: str, shape: str, margins: str, microcalc: str) -> Result:
+    score = 0
+    if composition == "Solid": score += 1
+    if echogenicity == "Hypoechoic": score += 1
+    if shape == "Taller-than-wide": score += 1
+    if margins == "Irregular": score += 1
+    if microcalc == "Yes": score += 1
+    if score <= 1:
+        category = "TR1"
+    elif score == 2:
+        category = "TR2"
+    elif score == 3:
+        category = "TR3"
+    elif score == 4:
+        category = "TR4"
+    else:
+        category = "TR5"
+    return Result(category, next_steps="Nodules in TR4 or TR5 should be considered for fine-needle aspiration biopsy.", score=score)
+
+
+# -----------------------------------------------------------
+# O-RADS
+# -----------------------------------------------------------
+@register("o_rads", "O-RADS (Ovarian-Adnexal)", RADS, [
+    choice("morphology", "Mass morphology", ["Simple cyst", "Multilocular cyst", "Complex mass"], widget="selectbox"),
+    choice("septations", "Are septations present?", YES_NO),
+    choice("papillary", "Are papillary projections present?", YES_NO),
+])
+def o_rads(morphology: str, septations: str, papillary: str) -> Result:
+    if morphology == "Simple cyst" and septations == "No" and papillary == "No":
+        category = "O-RADS 1"
+    elif morphology == "Multilocular cyst" or septations == "Yes":
+        category = "O-RADS 3"
+    else:
+        category = "O-RADS 4"
+    return Result(category, next_steps="Higher O-RADS categories (4 or above) warrant surgical evaluation and possible biopsy.")
+
+
+# -----------------------------------------------------------
+# NI-RADS
+# -----------------------------------------------------------
+@register("ni_rads", "NI-RADS (Neck)", RADS, [
+    choice("ni_rads", "Select NI-RADS Category", ["1", "2", "3", "4"], widget="selectbox"),
+])
+def ni_rads(ni_rads: str) -> Result:
+    return Result(ni_rads, next_steps="Higher NI-RADS categories require closer surveillance and possible further diagnostic workup.")
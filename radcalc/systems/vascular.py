@@ -0,0 +1,38 @@
+"""INTERVENTIONAL RADIOLOGY / VASCULAR classifications."""
+from ..engine import VASCULAR, Result, choice, register
+
+# -----------------------------------------------------------
+# 6.1 TICI Score (Stroke)
+# -----------------------------------------------------------
+@register("tici", "TICI Score (Stroke)", VASCULAR, [
+    choice("tici", "Select TICI Grade", ["0", "1", "2a", "2b", "2c", "3"], widget="selectbox"),
+])
+def tici(tici: str) -> Result:
+    return Result(tici, next_steps="Suboptimal reperfusion (grades 0–2) may require further thrombectomy or adjunctive therapy.")
+
+
+# -----------------------------------------------------------
+# 6.2 Hamburg Classification (Vascular Malformations)
+# -----------------------------------------------------------
+@register("hamburg", "Hamburg Classification (Vascular Malformations)", VASCULAR, [
+    choice("flow", "Flow type", ["Fast-flow", "Slow-flow"], widget="selectbox"),
+    choice("tissue", "Dominant tissue component", ["Capillary", "Venous", "Lymphatic", "Arterial", "Combined"], widget="selectbox"),
+])
+def hamburg(flow: str, tissue: str) -> Result:
+    return Result(f"{flow} {tissue} malformation", next_steps="Treatment options include sclerotherapy, embolization, or surgical resection, depending on type.")
+
+
+# -----------------------------------------------------------
+# 6.3 VARC Criteria (TAVR)
+# -----------------------------------------------------------
+@register("varc", "VARC Criteria (TAVR)", VASCULAR, [
+    choice("positioning", "Is valve positioning optimal?", ["Yes", "No"]),
+    choice("leak", "Is there a significant paravalvular leak?", ["No", "Yes"]),
+    choice("access", "Any vascular access complications?", ["No", "Yes"]),
+])
+def varc(positioning: str, leak: str, access: str) -> Result:
+    if positioning == "Yes" and leak == "No" and access == "No":
+        outcome = "Favorable"
+    else:
+        outcome = "Complicated"
+    return Result(outcome, next_steps="For complicated outcomes, arrange a multidisciplinary review to manage complications and optimize patient care.")
@@ -0,0 +1,72 @@
+"""Dense lookup tables for classifiers whose inputs are categorical or binned.
+
+The table is generated once by running the classifier over the full
+product of its field options, with numeric fields represented by one
+value per breakpoint bin. Option codes and bin numbers are mixed-radix
+digits, so a case is scored by one flat index into `results`.
+"""
+from __future__ import annotations
+
+import itertools
+
+from .engine import Result
+
+
+class LookupTable:
+    def __init__(self, classifier):
+        self.classifier = classifier
+        fields = classifier.fields
+        self.shape = tuple(len(f.breakpoints) if f.numeric else len(f.options) for f in fields)
+        strides, stride = [], 1
+        for size in reversed(self.shape):
+            strides.append(stride)
+            stride *= size
+        self.strides = tuple(reversed(strides))
+        # Categorical axes map option -> offset; numeric axes are binned.
+        self.axes = tuple(
+            (f, None if f.numeric else {o: i * s for i, o in enumerate(f.options)}, s)
+            for f, s in zip(fields, self.strides)
+        )
+        self.results: list[Result] = [
+            classifier.func(**dict(zip(classifier.field_names, combo)))
+            for combo in itertools.product(*(self.axis_values(f) for f in fields))
+        ]
+
+    @staticmethod
+    def axis_values(field) -> tuple:
+        """Options of a categorical field, one representative per bin of a numeric one."""
+        return field.breakpoints.representatives() if field.numeric else field.options
+
+    def __len__(self):
+        return len(self.results)
+
+    def index(self, inputs: dict) -> int:
+        """Flat index of `inputs`; raises through `Classifier.normalize` when invalid."""
+        idx = used = 0
+        try:
+            for field, offsets, stride in self.axes:
+                if field.name in inputs:
+                    value = inputs[field.name]
+                    used += 1
+                else:
+                    value = field.default
+                if offsets is None:
+                    idx += field.breakpoints.bin(field.validate(value)) * stride
+                else:
+                    idx += offsets[value]
+        except (KeyError, OverflowError, TypeError, ValueError):
+            used = -1
+        if used != len(inputs):
+            # Raises for invalid inputs; otherwise retry with the canonical values.
+            return self.index(self.classifier.normalize(inputs))
+        return idx
+
+    def lookup(self, inputs: dict) -> Result:
+        return self.results[self.index(inputs)]
+
+    def flat_index(self, codes):
+        """Vectorized `index` over integer arrays (option codes or bin numbers), in field order."""
+        idx = 0
+        for c, stride in zip(codes, self.strides):
+            idx = idx + c * stride
+        return idx
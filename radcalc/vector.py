@@ -0,0 +1,172 @@
+"""NumPy kernels for the additive point systems and the lookup-table systems.
+
+Each kernel takes whole columns - categorical inputs as integer codes
+(index into the field's `options`), numeric inputs as float arrays - and
+returns `(grades, scores)` arrays in one pass. `score_arrays` does the
+encoding and flags rows whose inputs are missing or out of range so the
+caller can fall back to the scalar classifier for an error message.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from .engine import get
+from .systems.abdominopelvic import BALTHAZAR_POINTS, NECROSIS_POINTS
+from .systems.neuro import SPETZLER_SIZE_POINTS, TLICS_MORPH_POINTS, TLICS_NEURO_POINTS, TLICS_PLC_POINTS
+
+KERNELS = {}
+
+
+def kernel(key):
+    def wrap(func):
+        KERNELS[key] = func
+        return func
+    return wrap
+
+
+def code(system, field, label) -> int:
+    return get(system).field_map[field].options.index(label)
+
+
+def points(system, field, table) -> np.ndarray:
+    """Per-option points in code order, for indexing with an encoded column."""
+    return np.array([table[o] for o in get(system).field_map[field].options], dtype=np.int64)
+
+
+def encode(field, values) -> np.ndarray:
+    """Integer codes for a categorical column; -1 marks values outside `field.options`."""
+    inverse, uniques = pd.factorize(np.asarray(values, dtype=object), use_na_sentinel=False)
+    lookup = {o: i for i, o in enumerate(field.options)}
+    table = np.array([lookup.get(u if isinstance(u, str) else str(u), -1) for u in uniques], dtype=np.int64)
+    return table[inverse]
+
+
+@lru_cache(maxsize=None)
+def get_kernel(system):
+    """The kernel for `system`: hand-written, else its lookup table, else None.
+
+    Hand-written kernels mirror the built-in Python rules, so they are
+    skipped when a rule file has replaced the system.
+    """
+    if system in KERNELS and get(system).source is None:
+        return KERNELS[system]
+    table = get(system).table
+    if table is None:
+        return None
+    grades = np.array([r.grade for r in table.results], dtype=object)
+    scores = None
+    if any(r.score is not None for r in table.results):
+        scores = np.array([r.score for r in table.results], dtype=np.int64)
+    fields = table.classifier.fields
+
+    def lookup(**columns):
+        codes = [f.breakpoints.bins(columns[f.name]) if f.numeric else columns[f.name] for f in fields]
+        idx = table.flat_index(codes)
+        return grades[idx], None if scores is None else scores[idx]
+
+    return lookup
+
+
+def score_arrays(system, **columns):
+    """Vectorized scoring of `system`; returns `(grades, scores, valid)` arrays.
+
+    `scores` is None for systems that only produce a grade.
+    """
+    classifier = get(system)
+    func = get_kernel(system)
+    n = len(next(iter(columns.values())))
+    valid = np.ones(n, dtype=bool)
+    encoded = {}
+    for f in classifier.fields:
+        if f.name in columns:
+            values = columns[f.name]
+        elif f.default is not None:
+            values = [f.default] * n
+        else:
+            raise KeyError(f"{system}: missing column {f.name!r}")
+        if f.options:
+            codes = encode(f, values)
+            valid &= codes >= 0
+            encoded[f.name] = np.where(codes >= 0, codes, 0)
+        else:
+            numbers = np.asarray(values, dtype=float)
+            ok = np.isfinite(numbers)  # NaN and ±inf fall back to the scalar path, which rejects them
+            if f.min_value is not None:
+                ok &= numbers >= f.min_value
+            if f.max_value is not None:
+                ok &= numbers <= f.max_value
+            if isinstance(f.step, int):
+                ok &= numbers == np.floor(numbers)
+            valid &= ok
+            encoded[f.name] = np.where(ok, numbers, 0.0)
+    grades, scores = func(**encoded)
+    return grades, scores, valid
+
+
+# -----------------------------------------------------------
+# TI-RADS: one point per suspicious feature, TR1 (0-1) .. TR5 (5)
+# -----------------------------------------------------------
+TI_RADS_CATEGORIES = np.array(["TR1", "TR1", "TR2", "TR3", "TR4", "TR5"], dtype=object)
+_SOLID = code("ti_rads", "composition", "Solid")
+_HYPOECHOIC = code("ti_rads", "echogenicity", "Hypoechoic")
+_TALLER = code("ti_rads", "shape", "Taller-than-wide")
+_IRREGULAR = code("ti_rads", "margins", "Irregular")
+_MICROCALC = code("ti_rads", "microcalc", "Yes")
+
+
+@kernel("ti_rads")
+def ti_rads(composition, echogenicity, shape, margins, microcalc):
+    score = ((composition == _SOLID).astype(np.int64) + (echogenicity == _HYPOECHOIC)
+             + (shape == _TALLER) + (margins == _IRREGULAR) + (microcalc == _MICROCALC))
+    return TI_RADS_CATEGORIES[score], score
+
+
+# -----------------------------------------------------------
+# Spetzler-Martin: size 1-3 + eloquence 0-1 + deep drainage 0-1
+# -----------------------------------------------------------
+_ELOQUENT = code("spetzler_martin", "eloquent", "Yes")
+_DEEP = code("spetzler_martin", "drainage", "Deep drainage")
+
+
+@kernel("spetzler_martin")
+def spetzler_martin(size, eloquent, drainage):
+    score = SPETZLER_SIZE_POINTS.take(size) + (eloquent == _ELOQUENT) + (drainage == _DEEP)
+    return score.astype(object), score
+
+
+# -----------------------------------------------------------
+# CTSI: Balthazar 0-4 + necrosis 0/2/4
+# -----------------------------------------------------------
+_BALTHAZAR = points("ctsi", "balthazar", BALTHAZAR_POINTS)
+
+
+@kernel("ctsi")
+def ctsi(balthazar, necrosis):
+    score = _BALTHAZAR[balthazar] + NECROSIS_POINTS.take(necrosis)
+    return score.astype(object), score
+
+
+# -----------------------------------------------------------
+# TLICS: morphology + PLC + neurological status
+# -----------------------------------------------------------
+_MORPH = points("tlics", "morphology", TLICS_MORPH_POINTS)
+_PLC = points("tlics", "plc", TLICS_PLC_POINTS)
+_NEURO = points("tlics", "neuro", TLICS_NEURO_POINTS)
+
+
+@kernel("tlics")
+def tlics(morphology, plc, neuro):
+    score = _MORPH[morphology] + _PLC[plc] + _NEURO[neuro]
+    return score.astype(object), score
+
+
+# -----------------------------------------------------------
+# Qanadli: partial x1 + complete x2
+# -----------------------------------------------------------
+@kernel("qanadli")
+def qanadli(partial, complete):
+    score = (partial + 2 * complete).astype(np.int64)
+    return score.astype(object), score
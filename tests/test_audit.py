@@ -0,0 +1,81 @@
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from radcalc import audit
+from radcalc.engine import ClassificationError, Result
+
+
+def _count(path):
+    with sqlite3.connect(path) as db:
+        return db.execute("SELECT count(*) FROM calculations").fetchone()[0]
+
+
+def test_record_blocks_when_full_and_close_writes_everything(tmp_path, monkeypatch):
+    monkeypatch.setattr(audit, "BATCH_SIZE", 10)
+    monkeypatch.setattr(audit, "MAX_QUEUE", 50)
+    path = tmp_path / "audit.db"
+    log = audit.AuditLog(path, "cli")
+    longest = 0
+    for i in range(2000):
+        log.record("bosniak", {"septa": "No", "i": i}, Result("I"))
+        longest = max(longest, len(log._queue))
+    log.extend([(time.time(), None, "bosniak", "{}", "I", None, None)] * 500)
+    log.close()
+    assert longest <= 50
+    assert _count(path) == 2500
+    assert log.dropped == 0
+
+
+def test_close_reports_calculations_lost_with_the_writer(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(audit, "MAX_QUEUE", 5)
+    log = audit.AuditLog(tmp_path / "audit.db", "cli")
+    log.close()  # the writer is gone: the queue can only fill up
+    for i in range(8):
+        log.record("bosniak", {"i": i}, Result("I"))
+    log.close()
+    assert log.dropped == 3
+    assert "8 calculations were not written" in capsys.readouterr().err
+
+
+def test_query_filters_by_grade_prefix(tmp_path):
+    path = tmp_path / "audit.db"
+    log = audit.AuditLog(path, "service")
+    log.record("lung_rads", {"nodule_size": 9}, Result("Category 4A"))
+    log.record("lung_rads", {"nodule_size": 3}, Result("Category 2"))
+    log.record("bosniak", {"septa": "No"}, Result("I"))
+    log.close()
+    rows = audit.query(path, system="lung_rads", grade="Category 4")
+    assert [(row["grade"], row["inputs"], row["source"]) for row in rows] == [
+        ("Category 4A", {"nodule_size": 9}, "service")]
+
+
+def test_query_grade_prefix_is_literal(tmp_path):
+    path = tmp_path / "audit.db"
+    log = audit.AuditLog(path, "service")
+    for grade in ("Category 4A", "Category 4*", "Category [4]"):
+        log.record("lung_rads", {"nodule_size": 9}, Result(grade))
+    log.close()
+    assert [row["grade"] for row in audit.query(path, grade="Category 4*")] == ["Category 4*"]
+    assert [row["grade"] for row in audit.query(path, grade="Category [")] == ["Category [4]"]
+    assert audit.query(path, grade="Category ?") == []
+
+
+def test_query_compares_times_in_utc(tmp_path):
+    path = tmp_path / "audit.db"
+    log = audit.AuditLog(path, "service")
+    log.record("lung_rads", {"nodule_size": 9}, Result("Category 4A"))
+    log.close()
+    [row] = audit.query(path)
+    stamp = datetime.fromisoformat(row["time"])
+    assert len(audit.query(path, since=stamp.isoformat(timespec="milliseconds"))) == 1
+    assert audit.query(path, until=stamp.isoformat(timespec="milliseconds")) == []
+    # The same instant written with an offset, and as a naive (UTC) time
+    local = stamp.astimezone(timezone(timedelta(hours=-5)))
+    assert len(audit.query(path, since=local.isoformat(), until=(local + timedelta(seconds=1)).isoformat())) == 1
+    assert len(audit.query(path, since=stamp.replace(tzinfo=None).isoformat())) == 1
+    assert len(audit.query(path, since=stamp.date().isoformat())) == 1
+    with pytest.raises(ClassificationError, match="since: not an ISO date or time"):
+        audit.query(path, since="yesterday")
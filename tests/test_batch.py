@@ -0,0 +1,46 @@
+import pandas as pd
+
+from radcalc.batch import read_table, score_frame
+from radcalc.parallel import score_file
+
+BOSNIAK_CSV = """septa,septa_thickness,calcifications,enhancement
+No,N/A,None,No
+Yes,Thin,None,No
+No,,None,No
+"""
+
+
+def test_read_table_keeps_none_and_na_option_labels(tmp_path):
+    path = tmp_path / "bosniak.csv"
+    path.write_text(BOSNIAK_CSV)
+    df = read_table(path)
+    assert df["septa_thickness"].tolist()[:2] == ["N/A", "Thin"]
+    assert df["calcifications"].tolist() == ["None", "None", "None"]
+    assert pd.isna(df["septa_thickness"][2])  # an empty cell is still missing
+
+
+def test_score_file_scores_none_option_labels(tmp_path):
+    source, output = tmp_path / "hunt_hess.csv", tmp_path / "scored.csv"
+    source.write_text("headache,consciousness,focal_deficit,ct_sah\n"
+                      "Minimal,Normal,None,Subtle/Small\n"
+                      "Moderate,Normal,None,Moderate\n")
+    rows, invalid = score_file(source, output, ["hunt_hess"], chunk_size=1)
+    assert (rows, invalid) == (2, 0)
+    out = pd.read_csv(output, dtype=str, keep_default_na=False)
+    assert out["hunt_hess_grade"].tolist() == ["I", "II"]
+    assert out["focal_deficit"].tolist() == ["None", "None"]
+    assert out["hunt_hess_error"].tolist() == ["", ""]
+
+
+def test_score_frame_matches_bosniak_labels(tmp_path):
+    path = tmp_path / "bosniak.csv"
+    path.write_text(BOSNIAK_CSV)
+    out = score_frame(read_table(path), ["bosniak"])
+    assert out["bosniak_grade"].tolist()[:2] == ["I", "II"]
+    assert out["bosniak_error"].tolist()[:2] == ["", ""]
+
+
+def test_score_frame_rejects_fractional_counts():
+    out = score_frame(pd.DataFrame({"partial": [1.0, 1.5], "complete": [2, 0]}), ["qanadli"])
+    assert out["qanadli_score"].tolist()[0] == 5
+    assert out["qanadli_error"].tolist() == ["", "partial: 1.5 is not a whole number"]
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from radcalc.bins import Breakpoints
+
+
+def test_operator_decides_the_bin_of_a_cut_value():
+    lt, le = Breakpoints([(6, "<")]), Breakpoints([(6, "<=")])
+    assert [lt.bin(x) for x in (5.9, 6, 6.1)] == [0, 1, 1]
+    assert [le.bin(x) for x in (5.9, 6, 6.1)] == [0, 0, 1]
+
+
+def test_values_by_bin():
+    size = Breakpoints([(3, "<"), (6, "<=")], values=("small", "mid", "large"))
+    assert [size(x) for x in (0, 2.9, 3, 6, 6.0001)] == ["small", "small", "mid", "mid", "large"]
+    assert size.take([0, 3, 7]).tolist() == ["small", "mid", "large"]
+    assert len(size) == 3
+
+
+def test_vectorized_bins_match_scalar_bins():
+    cuts = Breakpoints([(1, "<="), (2.5, "<"), (10, "<="), (30, "<")])
+    xs = [-1, 0, 1, 1.0000001, 2.4999, 2.5, 9.99, 10, 10.01, 29.99, 30, 1e9]
+    assert cuts.bins(xs).tolist() == [cuts.bin(x) for x in xs]
+    assert cuts.bins(np.array(xs)).dtype.kind == "i"
+
+
+def test_representatives_fall_in_their_own_bin():
+    for cuts in ([(3, "<"), (6, "<=")], [(0, "<=")], [(33, "<"), (50, "<")], [(1, "<="), (1.5, "<")]):
+        bp = Breakpoints(cuts)
+        assert [bp.bin(x) for x in bp.representatives()] == list(range(len(bp)))
+
+
+@pytest.mark.parametrize("cuts, values", [
+    ([(3, ">")], None),
+    ([(6, "<"), (3, "<")], None),
+    ([(3, "<"), (3, "<")], None),
+    ([(3, "<")], (1, 2, 3)),
+])
+def test_invalid_breakpoints(cuts, values):
+    with pytest.raises(ValueError):
+        Breakpoints(cuts, values)
+
+
+def test_a_cut_at_the_same_value_with_both_operators_is_allowed():
+    bp = Breakpoints([(3, "<"), (3, "<=")])
+    assert [bp.bin(x) for x in (2.9, 3, 3.1)] == [0, 1, 2]
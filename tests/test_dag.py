@@ -0,0 +1,27 @@
+import pytest
+
+from radcalc import SYSTEMS, get
+from radcalc.coverage import combinations
+from radcalc import dag
+
+
+def _matches(conditions, values, classifier):
+    for name, wanted in conditions.items():
+        f = classifier.field_map[name]
+        if (f.breakpoints.bin(values[name]) if f.numeric else values[name]) not in wanted:
+            return False
+    return True
+
+
+@pytest.mark.parametrize("key", [key for key in SYSTEMS if get(key).dag is not None])
+def test_paths_are_exclusive_and_agree_with_the_classifier(key):
+    classifier = get(key)
+    rules = list(dag.paths(classifier.dag))
+    for values in combinations(classifier):
+        matched = [result for conditions, result in rules if _matches(conditions, values, classifier)]
+        assert matched == [classifier.func(**values)]
+
+
+def test_fields_that_never_change_the_result_are_not_tested():
+    assert dag.tested_fields(get("lung_rads").dag) == {"nodule_size"}
+    assert {"t2", "dce"}.isdisjoint(dag.tested_fields(get("pi_rads").dag))
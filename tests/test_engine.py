@@ -0,0 +1,49 @@
+import math
+
+import pytest
+
+from radcalc.cache import cache_info, cache_clear
+from radcalc.engine import ClassificationError, classify, get
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_option_value_is_a_classification_error(value):
+    with pytest.raises(ClassificationError):
+        classify("ni_rads", ni_rads=value)
+
+
+@pytest.mark.parametrize("value", [math.inf, "inf", -math.inf])
+def test_non_finite_number_is_a_classification_error(value):
+    with pytest.raises(ClassificationError):
+        classify("lung_rads", nodule_size=value, nodule_type="Solid")
+
+
+def test_numeric_cell_matches_numeric_label():
+    assert get("ni_rads").fields[0].validate(2.0) == "2"
+    assert classify("ni_rads", ni_rads=1).grade == "1"
+
+
+def test_cache_key_distinguishes_equal_values_of_different_types():
+    cache_clear()
+    with pytest.raises(ClassificationError):
+        classify("ni_rads", ni_rads=True)
+    assert classify("ni_rads", ni_rads=1).grade == "1"
+    with pytest.raises(ClassificationError):
+        classify("ni_rads", ni_rads=True)  # not answered from the entry for 1
+    assert classify("ni_rads", ni_rads=1.0).grade == "1"
+    assert cache_info().size == 2
+
+
+@pytest.mark.parametrize("key, inputs", [
+    ("ni_rads", {"ni_rads": 10 ** 400}),
+    ("lung_rads", {"nodule_size": 10 ** 400, "nodule_type": "Solid"}),
+])
+def test_integer_beyond_float_range_is_a_classification_error(key, inputs):
+    with pytest.raises(ClassificationError):
+        classify(key, **inputs)
+
+
+def test_count_fields_take_whole_numbers_only():
+    assert classify("qanadli", partial=3.0, complete=2).score == 7
+    with pytest.raises(ClassificationError, match="partial: 1.5 is not a whole number"):
+        classify("qanadli", partial=1.5, complete=0)
@@ -0,0 +1,26 @@
+import importlib.util
+import statistics
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "benchmarks" / "import_budget.py"
+BUDGET_MS = 10.0
+
+
+@pytest.fixture(scope="module")
+def budget():
+    spec = importlib.util.spec_from_file_location("import_budget", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module._python("import radcalc")  # bytecode caches, as in the benchmark
+    return module
+
+
+def test_radcalc_does_not_import_the_ui_or_dataframe_stack(budget):
+    assert budget.imported("radcalc") == []
+
+
+def test_radcalc_imports_within_budget(budget):
+    median = statistics.median(budget.import_ms("radcalc") for _ in range(5))
+    assert median <= BUDGET_MS, f"radcalc imports in {median:.1f} ms, over the {BUDGET_MS} ms budget"
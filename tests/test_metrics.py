@@ -0,0 +1,60 @@
+import pytest
+
+from radcalc import classify, metrics
+from radcalc.metrics import Counter, Histogram
+
+
+@pytest.fixture
+def fresh():
+    """Run with empty metrics, then put back what the rest of the session recorded."""
+    saved = metrics.take()
+    yield
+    metrics.take()
+    metrics.merge(saved)
+
+
+def test_counter_samples_escape_label_values():
+    c = Counter("x_total", "X.", ("system", "grade"))
+    c.inc("a", 'say "hi"\\now\n')
+    c.inc("a", "plain", amount=2)
+    assert list(c.samples()) == ['x_total{system="a",grade="plain"} 2',
+                                 'x_total{system="a",grade="say \\"hi\\"\\\\now\\n"} 1']
+
+
+def test_histogram_buckets_are_cumulative():
+    h = Histogram("t_seconds", "T.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        h.observe(value, "/x")
+    assert list(h.samples()) == [
+        't_seconds_bucket{route="/x",le="0.1"} 2',
+        't_seconds_bucket{route="/x",le="1.0"} 3',
+        't_seconds_bucket{route="/x",le="+Inf"} 4',
+        't_seconds_sum{route="/x"} 3.65',
+        't_seconds_count{route="/x"} 4',
+    ]
+
+
+def test_take_and_merge_round_trip():
+    h = Histogram("t_seconds", "T.", (), buckets=(1.0,))
+    h.observe(0.5)
+    taken = h.take()
+    assert list(h.samples()) == []
+    h.merge(taken)
+    h.merge(taken)
+    assert list(h.samples())[-1] == "t_seconds_count 2"
+
+
+def test_render_reports_classify_calls(fresh):
+    classify("ni_rads", ni_rads="2")
+    classify("ni_rads", ni_rads="2")
+    with pytest.raises(ValueError):
+        classify("ni_rads", ni_rads="9")
+    text = metrics.render()
+    assert text.endswith("\n")
+    assert '# TYPE radcalc_calls_total counter' in text
+    assert 'radcalc_calls_total{system="ni_rads",path="scalar"} 3' in text
+    assert 'radcalc_results_total{system="ni_rads",grade="2"} 2' in text
+    assert 'radcalc_errors_total{system="ni_rads",path="scalar"} 1' in text
+    assert 'radcalc_classify_seconds_count{system="ni_rads"} 2' in text
+    for line in text.splitlines():
+        assert line.startswith("#") or len(line.rsplit(" ", 1)) == 2
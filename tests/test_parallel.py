@@ -0,0 +1,32 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from radcalc.parallel import score_file
+
+INVALID = dict(septa="Maybe", septa_thickness="Thin", calcifications="None", enhancement="No")
+VALID = dict(septa="No", septa_thickness="N/A", calcifications="None", enhancement="No")
+
+
+def test_parquet_schema_does_not_depend_on_the_first_chunk(tmp_path):
+    source, output = tmp_path / "bosniak.csv", tmp_path / "scored.parquet"
+    pd.DataFrame([INVALID] * 5 + [VALID] * 5).to_csv(source, index=False)
+    rows, invalid = score_file(source, output, ["bosniak"], chunk_size=5)
+    assert (rows, invalid) == (10, 5)
+    schema = pq.read_schema(output)
+    assert schema.field("bosniak_grade").type == pa.string()
+    assert schema.field("bosniak_error").type == pa.string()
+    assert pq.read_table(output).column("bosniak_grade").to_pylist() == [None] * 5 + ["I"] * 5
+
+
+def test_parquet_output_keeps_source_types_and_integer_scores(tmp_path):
+    source, output = tmp_path / "avm.parquet", tmp_path / "scored.parquet"
+    sizes = [-1.0] * 3 + [2.0, 4.0, 7.0]
+    pd.DataFrame({"size": sizes, "eloquent": "No", "drainage": "Superficial only"}).to_parquet(source)
+    score_file(source, output, ["spetzler_martin"], chunk_size=3)
+    table = pq.read_table(output)
+    assert table.schema.field("size").type == pa.float64()
+    assert table.schema.field("spetzler_martin_score").type == pa.int64()
+    assert table.schema.field("spetzler_martin_grade").type == pa.string()
+    assert table.column("spetzler_martin_score").to_pylist() == [None] * 3 + [1, 2, 3]
+    assert table.column("spetzler_martin_grade").to_pylist() == [None] * 3 + ["1", "2", "3"]
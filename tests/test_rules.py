@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from radcalc.engine import ClassificationError, classify
+from radcalc.rules import compile_system, export, load_file
+
+
+def _system(rules, size_cuts=((10, "<"),)):
+    return {"key": "test_cyst", "name": "Test Cyst", "category": "-RADS SYSTEMS",
+            "fields": [{"name": "wall", "label": "Wall", "options": ["Thin", "Thick"]},
+                       {"name": "size", "label": "Size (mm)", "breakpoints": [list(c) for c in size_cuts]}],
+            "rules": rules}
+
+
+def test_first_matching_rule_wins_and_numeric_conditions_name_bins():
+    classifier = compile_system(_system([
+        {"when": {"wall": "Thick", "size": 1}, "grade": "High", "score": 2},
+        {"when": {"wall": "Thick"}, "grade": "Mid", "score": 1},
+        {"grade": "Low", "score": 0}]))
+    assert classifier(wall="Thick", size=12) == ("High", "", "", 2)
+    assert classifier(wall="Thick", size=3).grade == "Mid"
+    assert classifier(wall="Thin", size=30).grade == "Low"
+    assert len(classifier.table) == 4
+
+
+def test_uncovered_combination_is_a_load_error():
+    with pytest.raises(ClassificationError, match="no rule matches"):
+        compile_system(_system([{"when": {"wall": "Thick"}, "grade": "High"}]))
+
+
+@pytest.mark.parametrize("rule, message", [
+    ({"when": {"wall": "Wavy"}, "grade": "X"}, "unknown option"),
+    ({"when": {"size": 2}, "grade": "X"}, "unknown bin"),
+    ({"when": {"colour": "Red"}, "grade": "X"}, "unknown field"),
+    ({"when": {"wall": "Thin"}}, "has no grade"),
+    ({"grade": "X", "colour": "Red"}, "unknown rule key"),
+    ({"when": ["wall", "Thin"], "grade": "X"}, "when must map field names"),
+    ("High", "a rule must be a JSON object"),
+])
+def test_invalid_rule_is_rejected(rule, message):
+    with pytest.raises(ClassificationError, match=message):
+        compile_system(_system([rule, {"grade": "Low"}]))
+
+
+@pytest.mark.parametrize("part, value, message", [
+    ("fields", "abc", "fields must be a list"),
+    ("rules", {"grade": "Low"}, "rules must be a list"),
+    ("fields", ["wall"], "field 'wall' must be a JSON object"),
+])
+def test_malformed_system_names_the_file(part, value, message):
+    spec = _system([{"grade": "Low"}])
+    spec[part] = value
+    with pytest.raises(ClassificationError, match=f"^cysts.json: test_cyst: {message}"):
+        compile_system(spec, "cysts.json")
+
+
+def test_score_must_be_set_on_every_rule_or_none():
+    with pytest.raises(ClassificationError, match=r"rule\(s\) \[1\] have no score"):
+        compile_system(_system([{"when": {"wall": "Thick"}, "grade": "High", "score": 1}, {"grade": "Low"}]))
+
+
+@pytest.mark.parametrize("score", [1.5, "2", True])
+def test_score_must_be_an_integer(score):
+    with pytest.raises(ClassificationError, match="score must be an integer"):
+        compile_system(_system([{"grade": "Low", "score": score}]))
+
+
+def test_exported_rules_reproduce_the_builtin_system(tmp_path):
+    path = tmp_path / "spetzler.json"
+    path.write_text(json.dumps(export("spetzler_martin")))
+    [classifier] = load_file(path)
+    for size in (1, 4, 7):
+        for eloquent in ("No", "Yes"):
+            inputs = dict(size=size, eloquent=eloquent, drainage="Deep drainage")
+            assert classifier(**inputs) == classify("spetzler_martin", **inputs)
@@ -0,0 +1,89 @@
+import asyncio
+import json
+
+import pytest
+
+from radcalc import metrics, service
+
+
+async def _exchange(requests):
+    """Send `(method, path, body)` requests on one kept-alive connection; `[(status, payload), ...]`."""
+    server = await service.start(port=0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    responses = []
+    try:
+        for method, path, body in requests:
+            writer.write(f"{method} {path} HTTP/1.1\r\nHost: x\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+                         + body)
+            head = (await reader.readuntil(b"\r\n\r\n")).decode()
+            length = int(head.lower().split("content-length: ")[1].split("\r\n")[0])
+            responses.append((int(head.split(" ")[1]), json.loads(await reader.readexactly(length))))
+    finally:
+        writer.close()
+        server.close()
+        await server.wait_closed()
+    return responses
+
+
+def test_nan_input_is_unprocessable():
+    [(status, payload)] = asyncio.run(_exchange([("POST", "/classify/ni_rads", b'{"ni_rads": NaN}')]))
+    assert status == 422
+    assert "ni_rads" in payload["error"]
+
+
+def test_unexpected_error_is_a_500_and_the_connection_survives(monkeypatch, capsys):
+    handle = service.handle
+
+    def broken(method, path, body):
+        if path == "/health":
+            raise RuntimeError("boom")
+        return handle(method, path, body)
+
+    monkeypatch.setattr(service, "handle", broken)
+    before = metrics.HTTP_REQUESTS.take()
+    try:
+        responses = asyncio.run(_exchange([("GET", "/health", b""),
+                                           ("POST", "/classify/ni_rads", b'{"ni_rads": "1"}')]))
+        counts = metrics.HTTP_REQUESTS.take()
+    finally:
+        metrics.HTTP_REQUESTS.merge(before)
+    assert responses[0] == (500, {"error": "internal error"})
+    assert responses[1][0] == 200 and responses[1][1]["grade"] == "1"
+    assert counts[("/health", 500)] == 1
+    assert "RuntimeError: boom" in capsys.readouterr().err
+
+
+async def _raw(request: bytes) -> bytes:
+    server = await service.start(port=0)
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.sockets[0].getsockname()[1])
+    try:
+        writer.write(request)
+        return await reader.read()
+    finally:
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.parametrize("length", ["-5", "abc", "+5", "", "9" * 5000])
+def test_bad_content_length_is_a_client_error(length):
+    reply = asyncio.run(_raw(f"POST /classify/ni_rads HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode()))
+    assert reply.split(b" ", 2)[1] in (b"400", b"413")
+
+
+def test_batch_reports_an_unexpected_error_on_its_record(monkeypatch, capsys):
+    score_record = service.score_record
+
+    def broken(record):
+        if record.get("id") == 2:
+            raise RuntimeError("boom")
+        return score_record(record)
+
+    monkeypatch.setattr(service, "score_record", broken)
+    body = b'[{"id": 1, "ni_rads": "1"}, {"id": 2, "ni_rads": "2"}, {"id": 3, "ni_rads": "3"}]'
+    [(status, payload)] = asyncio.run(_exchange([("POST", "/batch", body)]))
+    assert status == 200
+    assert [(r["id"], r.get("grade"), r.get("error")) for r in payload["results"]] == [
+        (1, "1", None), (2, None, "internal error"), (3, "3", None)]
+    assert "RuntimeError: boom" in capsys.readouterr().err
@@ -0,0 +1,49 @@
+import io
+import json
+
+from radcalc.stream import score_stream, write_stream
+
+
+def _run(text, systems=None):
+    out = io.StringIO()
+    count = write_stream(score_stream(io.StringIO(text), systems), out)
+    return count, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_nan_input_is_reported_per_record():
+    count, results = _run('{"id": 1, "ni_rads": NaN}\n{"id": 2, "ni_rads": "2"}\n', ["ni_rads"])
+    assert count == 2
+    assert "error" in results[0] and results[0]["id"] == 1
+    assert results[1]["grade"] == "2"
+
+
+def test_bad_lines_and_missing_inputs_do_not_stop_the_stream():
+    count, results = _run('not json\n[1, 2]\n{"id": 3}\n{"id": 4, "ni_rads": "3"}\n', ["ni_rads"])
+    assert count == 4
+    assert [("error" in r) for r in results] == [True, True, True, False]
+    assert results[2]["error"] == "ni_rads: record lacks inputs for ['ni_rads']"
+    assert results[3]["grade"] == "3"
+
+
+def test_record_without_a_matching_system():
+    _, results = _run('{"id": 5, "unrelated": 1}\n')
+    assert results == [{"id": 5, "system": None, "error": "no classification system matches these findings"}]
+
+
+def test_invalid_system_value_is_reported_per_record():
+    count, results = _run('{"id": 1, "system": 5}\n{"id": 2, "system": {"a": 1}}\n'
+                          '{"id": 3, "system": ["ni_rads", [1]]}\n{"id": 4, "system": "ni_rads", "ni_rads": "4"}\n')
+    assert count == 4
+    assert [r["error"] for r in results[:3]] == ["system must be a system key or a list of them"] * 3
+    assert results[3]["grade"] == "4"
+
+
+def test_huge_integers_are_reported_per_record():
+    huge = "1" + "0" * 400
+    count, results = _run(f'{{"id": 1, "ni_rads": {huge}}}\n{{"id": 2, "ni_rads": {"1" + "0" * 5000}}}\n'
+                          f'{{"id": 3, "system": "lung_rads", "nodule_size": {huge}, "nodule_type": "Solid"}}\n',
+                          ["ni_rads"])
+    assert count == 3
+    assert results[0]["error"].startswith("ni_rads: ")
+    assert results[1]["error"].startswith("invalid JSON")
+    assert results[2]["error"] == "nodule_size: value is out of range"
@@ -0,0 +1,24 @@
+from types import SimpleNamespace
+
+from calculators import study
+from calculators.study import finding_names
+from radcalc.engine import choice, number
+
+
+def test_numeric_fields_in_different_units_are_separate_findings():
+    names = finding_names(["spetzler_martin", "li_rads"])
+    assert names[("spetzler_martin", "size")] == "spetzler_martin.size"
+    assert names[("li_rads", "size")] == "li_rads.size"
+
+
+def test_fields_with_disagreeing_options_are_separate_findings():
+    names = finding_names(["ti_rads", "bi_rads"])
+    assert names[("ti_rads", "shape")] == "ti_rads.shape"
+    assert names[("bi_rads", "shape")] == "bi_rads.shape"
+
+
+def test_fields_with_the_same_meaning_share_a_finding(monkeypatch):
+    fields = {"a": [choice("side", "Side", ["Left", "Right"]), number("size", "Size (mm)")],
+              "b": [choice("side", "Side", ["Left", "Right"]), number("size", "Size (mm)")]}
+    monkeypatch.setattr(study, "get", lambda key: SimpleNamespace(fields=fields[key]))
+    assert set(study.finding_names(["a", "b"]).values()) == {"side", "size"}
@@ -0,0 +1,57 @@
+import itertools
+import math
+
+import pandas as pd
+import pytest
+
+from radcalc import SYSTEMS, classify, get
+from radcalc.batch import score_frame
+from radcalc.coverage import combinations
+
+TABULATED = [key for key in SYSTEMS if get(key).table is not None]
+
+
+def _probe_values(field):
+    """Options, or each cut value and its neighbours (inside the field's range) for a numeric field.
+
+    A field with an integer step takes whole numbers only, so its neighbours are whole too.
+    """
+    if field.options:
+        return field.options
+    values = {field.min_value or 0, *field.breakpoints.representatives()}
+    for cut, _ in field.breakpoints.cuts:
+        values.update((cut, cut - 0.5, cut + 0.5, cut - 1, cut + 1, math.nextafter(cut, math.inf)))
+    low, high = field.min_value, field.max_value
+    whole = isinstance(field.step, int)
+    return sorted(v for v in values if (low is None or v >= low) and (high is None or v <= high)
+                  and (not whole or v == int(v)))
+
+
+def _cases(classifier):
+    names = classifier.field_names
+    for combo in itertools.product(*(_probe_values(f) for f in classifier.fields)):
+        yield dict(zip(names, combo))
+
+
+@pytest.mark.parametrize("key", TABULATED)
+def test_lookup_table_matches_the_classifier_function(key):
+    classifier = get(key)
+    for values in _cases(classifier):
+        assert classifier.table.lookup(values) == classifier.func(**classifier.normalize(values)), values
+
+
+@pytest.mark.parametrize("key", list(SYSTEMS))
+def test_batch_scoring_matches_scalar_scoring(key):
+    classifier = get(key)
+    cases = list(itertools.islice(_cases(classifier) if classifier.table is not None
+                                  else combinations(classifier), 2000))
+    out = score_frame(pd.DataFrame(cases), [key])
+    expected = [classify(key, **values) for values in cases]
+    assert out[f"{key}_grade"].tolist() == [r.grade for r in expected]
+    if f"{key}_score" in out:
+        assert out[f"{key}_score"].tolist() == [r.score for r in expected]
+    assert (out[f"{key}_error"] == "").all()
+
+
+def test_defaults_fill_conditional_inputs():
+    assert get("bosniak").table.lookup({"septa": "No", "calcifications": "None", "enhancement": "No"}).grade == "I"